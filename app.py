@@ -1,164 +1,846 @@
-"""
-Property Management System App
-
-This file defines a Flask web application for managing properties. It uses a PropertyManager class to handle
-the management of properties, and it provides various routes for filtering, sorting, and saving property data.
-"""
-
-import json
-import configparser
-from classes.property_manager import PropertyManager
-
-from flask import Flask, render_template, request
-
-
-# Create a configparser object
-config = configparser.ConfigParser()
-
-# Read the configuration file
-config.read('config.ini')
-
-# Access values of input and output file
-input_file = config["FILES"]["Input"]
-output_file = config["FILES"]["Output"]
-
-app = Flask(__name__)
-property_manager = PropertyManager()
-property_manager.read_properties_from_json(input_file)
-
-
-@app.route('/')
-def homepage():
-    """
-    Route for the homepage that renders the index.html template with the list of all properties.
-
-    Returns:
-        render_template: The rendered template with property data.
-    """
-    return render_template(
-        "index.html",
-        properties=property_manager.get_properties(),
-        info="all")
-
-
-@app.route("/filter_by_location", methods=["POST"])
-def filter_by_location():
-    """
-    Route for filtering properties by location.
-
-    Returns:
-        render_template: The rendered template with filtered property data.
-    """
-    location = request.form["location"]
-    filtered_properties = property_manager.filter_by_location(
-        location=location)
-    return render_template(
-        'index.html',
-        properties=filtered_properties,
-        info=f"filtered by location: {location}")
-
-
-@app.route("/filter_by_price", methods=["POST"])
-def filter_by_price():
-    """
-    Route for filtering properties by price range.
-
-    Returns:
-        render_template: The rendered template with filtered property data.
-    """
-    min_price = int(request.form["min_price"])
-    if not request.form["max_price"]:
-        max_price = None
-    else:
-        max_price = int(request.form["max_price"])
-
-    filtered_properties = property_manager.filter_by_price(min_price=min_price,
-                                                           max_price=max_price)
-    return render_template(
-        "index.html",
-        properties=filtered_properties,
-        info=f"filtered by price: min={min_price}, max={max_price}")
-
-
-@app.route("/filter_by_square_footage", methods=["POST"])
-def filter_by_square_footage():
-    """
-    Route for filtering properties by square footage range.
-
-    Returns:
-        render_template: The rendered template with filtered property data.
-    """
-    min_square_footage = int(request.form["min_square_footage"])
-    if not request.form["max_square_footage"]:
-        max_square_footage = None
-    else:
-        max_square_footage = int(request.form["max_square_footage"])
-
-    filtered_properties = property_manager.filter_by_square_footage(
-        min_square_footage=min_square_footage, max_square_footage=max_square_footage)
-    return render_template(
-        "index.html",
-        properties=filtered_properties,
-        info=f"filtered by square footage: min={min_square_footage}, max={max_square_footage}")
-
-
-@app.route("/filter_by_property_type", methods=["POST"])
-def filter_by_property_type():
-    """
-    Route for filtering properties by property type.
-
-    Returns:
-        render_template: The rendered template with filtered property data.
-    """
-    property_type = request.form["property_type"]
-    filtered_properties = property_manager.filter_by_property_type(
-        property_type=property_type)
-    return render_template(
-        "index.html",
-        properties=filtered_properties,
-        info=f"filtered by property type {property_type}")
-
-
-@app.route("/sort", methods=["POST"])
-def sort():
-    """
-    Route for sorting properties based on the given attribute and sorting type.
-
-    Returns:
-        render_template: The rendered template with sorted property data.
-    """
-    sorting_attribute = request.form["sorting_attribute"]
-    sorting_type = request.form["sorting_type"]
-    sorted_properties = property_manager.sort_properties(
-        sorting_attribute=sorting_attribute, sorting_type=sorting_type)
-    return render_template(
-        "index.html",
-        properties=sorted_properties,
-        info=f"sorted by {sorting_attribute} in {sorting_type} order")
-
-
-@app.route("/save_current_selection", methods=["POST"])
-def save_current_selection():
-    """
-    Route for saving the current selection of properties to a JSON file.
-
-    Returns:
-        render_template: The rendered template indicating the success and the path to the saved file.
-    """
-    selected_properties = request.form.getlist("selected_properties")
-    selected_properties_data = []
-
-    for prop in selected_properties:
-        for p in property_manager.get_properties():
-            if p.get_id() == prop:
-                selected_properties_data.append(p.to_dict())
-                break
-
-    with open(output_file, "w", encoding="utf-8") as jf:
-        json.dump(selected_properties_data, jf, ensure_ascii=False, indent=4)
-
-    return render_template("success.html", path_to_file=output_file)
-
-
-if __name__ == '__main__':
-    app.run(debug=True)
+"""
+Property Management System App
+
+This file defines a Flask web application for managing properties. It uses a PropertyManager class to handle
+the management of properties, and it provides various routes for filtering, sorting, and saving property data.
+"""
+
+import base64
+import json
+import os
+import configparser
+import time
+from contextlib import ExitStack, contextmanager
+from functools import partial, wraps
+from classes.property_manager import PropertyManager
+from classes.columnar_property_manager import ColumnarPropertyManager
+from classes.sqlite_property_manager import SQLitePropertyManager
+from classes.property_reader import PropertyReader
+from classes.page_cache import PageCache
+from classes.catalog_reloader import CatalogReloader
+from classes.property_exporter import PropertyExporter
+from classes.property_serializer import PropertySerializer
+from classes.request_metrics import RequestMetrics
+from classes.request_profiler import RequestProfiler
+
+from flask import Flask, Response, abort, g, make_response, render_template, request, stream_with_context
+from werkzeug.exceptions import HTTPException
+
+
+# Create a configparser object
+config = configparser.ConfigParser()
+
+# Read the configuration file (config.ini unless the PROPERTY_APP_CONFIG environment variable names another one)
+config.read(os.environ.get("PROPERTY_APP_CONFIG", "config.ini"))
+
+# Access values of input and output file
+input_file = config["FILES"]["Input"]
+output_file = config["FILES"]["Output"]
+
+# Access the directory of delta files applied on top of the input file
+delta_directory = config.get("FILES", "Deltas", fallback="") or None
+
+# Exports are saved next to the output file, named after it and in the format of its extension
+output_directory, output_name = os.path.split(output_file)
+output_prefix, output_extension = os.path.splitext(output_name)
+property_exporter = PropertyExporter(
+    output_directory or ".",
+    prefix=output_prefix,
+    default_format=output_extension.lstrip(".") or "json")
+
+# Access the number of properties shown on one page
+page_size = config.getint("LISTING", "PageSize", fallback=50)
+
+# Access the storage engine holding the properties
+storage_engines = {
+    "memory": PropertyManager,
+    "columnar": ColumnarPropertyManager,
+    "sqlite": partial(SQLitePropertyManager, config.get("STORAGE", "Database", fallback="properties.sqlite3"))
+}
+storage_engine = config.get("STORAGE", "Engine", fallback="memory")
+snapshot_file = config.get("STORAGE", "Snapshot", fallback="") or None
+load_workers = config.getint("STORAGE", "LoadWorkers", fallback=1) or None
+
+# Access the limits of the rendered page cache
+page_cache = PageCache(
+    max_entries=config.getint("CACHE", "MaxEntries", fallback=256),
+    max_bytes=config.getint("CACHE", "MaxBytes", fallback=32 * 1024 * 1024),
+    ttl=config.getfloat("CACHE", "TTL", fallback=60))
+
+# Access the largest number of properties returned by one API request
+api_max_limit = config.getint("API", "MaxLimit", fallback=1000)
+
+# Request latencies and the rows scanned by the catalog are recorded unless the metrics are disabled
+request_metrics = RequestMetrics() if config.getboolean("METRICS", "Enabled", fallback=True) else None
+
+# Sampled and slow requests are profiled only if the profiling is enabled
+request_profiler = None
+if config.getboolean("PROFILING", "Enabled", fallback=False):
+    request_profiler = RequestProfiler(
+        config.get("PROFILING", "Directory", fallback="profiles"),
+        sample_rate=config.getfloat("PROFILING", "SampleRate", fallback=0),
+        slow_threshold=config.getfloat("PROFILING", "SlowThreshold", fallback=0) or None,
+        max_files=config.getint("PROFILING", "MaxFiles", fallback=100))
+
+
+def load_property_manager():
+    """
+    Creates a property manager of the configured storage engine and reads the input file and the deltas into it.
+
+    Returns:
+        PropertyManager: The loaded property manager.
+    """
+    property_manager = storage_engines[storage_engine]()
+    property_manager.read_properties_from_json(
+        input_file,
+        progress_callback=PropertyReader.print_progress,
+        path_to_snapshot=snapshot_file,
+        paths_to_deltas=get_delta_files(),
+        workers=load_workers)
+    property_manager.set_metrics(request_metrics)
+    return property_manager
+
+
+def get_delta_files():
+    """
+    Lists the delta files to apply, in the order of their names (e.g. the dates of a nightly feed).
+
+    Returns:
+        list: The paths to the JSON and JSON Lines files in the delta directory.
+    """
+    if delta_directory is None or not os.path.isdir(delta_directory):
+        return []
+
+    return [os.path.join(delta_directory, name) for name in sorted(os.listdir(delta_directory))
+            if os.path.splitext(name)[1] in (".json", ".jsonl")]
+
+
+def start_catalog_reloader():
+    """
+    Loads the catalog and starts reloading it in the background when the input file or the delta directory
+    changes or the configured signal is received.
+
+    Returns:
+        CatalogReloader: The reloader holding the loaded catalog.
+    """
+    reloader = CatalogReloader(
+        load_property_manager,
+        input_file,
+        on_reload=page_cache.clear,
+        watched_paths=() if delta_directory is None else (delta_directory,))
+    reload_poll_interval = None
+    if config.getboolean("RELOAD", "Watch", fallback=False):
+        reload_poll_interval = config.getfloat("RELOAD", "PollInterval", fallback=2)
+    reload_signal = config.get("RELOAD", "Signal", fallback="")
+    if reload_signal:
+        reloader.install_signal_handler(reload_signal)
+    if reload_poll_interval is not None or reload_signal:
+        reloader.start(poll_interval=reload_poll_interval)
+    return reloader
+
+
+app = Flask(__name__)
+
+# The catalog is loaded when the app is imported (e.g. by a WSGI server) or run as a script, but not when
+# a worker process spawned to parse the catalog in parallel imports this script again as __mp_main__
+catalog_reloader = None if __name__ == "__mp_main__" else start_catalog_reloader()
+
+
+@app.before_request
+def use_current_catalog():
+    """
+    Pins the current catalog for the whole request, so a reload finishing meanwhile does not affect it, and keeps
+    every read of the request on one version of it (see PropertyManager.consistent_reads), so e.g. a page and
+    its total always match even when a SQLite catalog is changed in place.
+    """
+    g.catalog_generation, g.property_manager = catalog_reloader.acquire()
+    g.catalog_reads = ExitStack()
+    g.catalog_reads.enter_context(g.property_manager.consistent_reads())
+
+
+@app.teardown_request
+def release_catalog(exception=None):
+    """
+    Ends the reads of the request and releases its catalog, so it can be closed once a reload has replaced it.
+
+    Teardown functions run in the reverse order of their registration, so this one runs after the others.
+    The request context of a streamed response is kept until its body has been produced (see timed_stream),
+    so its catalog stays pinned, and open, until then.
+
+    Args:
+        exception (Exception): The error that ended the request, if any.
+    """
+    if "property_manager" not in g:
+        return
+
+    try:
+        if "catalog_reads" in g:
+            g.catalog_reads.close()
+    finally:
+        catalog_reloader.release(g.property_manager)
+
+
+@app.before_request
+def start_request_timer():
+    """
+    Starts measuring the request and its phases (see timed_phase).
+    """
+    g.request_start = time.perf_counter()
+    g.phase_seconds = {}
+    if request_profiler is not None:
+        g.profiling = request_profiler.start()
+
+
+@app.teardown_request
+def record_request_metrics(exception=None):
+    """
+    Records the duration of the request and of its phases under the name of the route.
+
+    The teardown functions of a streamed response run once its body has been produced (see timed_stream),
+    so its duration includes producing the body.
+
+    Args:
+        exception (Exception): The error that ended the request, if any.
+    """
+    if request_metrics is None or "request_start" not in g:
+        return
+
+    route = request.endpoint or "unmatched"
+    request_metrics.observe(route, "total", time.perf_counter() - g.request_start)
+    for phase, seconds in g.phase_seconds.items():
+        request_metrics.observe(route, phase, seconds)
+
+
+@app.teardown_request
+def write_request_profile(exception=None):
+    """
+    Stops profiling the request and writes its profile with the route parameters and the catalog size
+    if it was sampled or slow. A streamed response is profiled until its body has been produced (see timed_stream).
+
+    Args:
+        exception (Exception): The error that ended the request, if any.
+    """
+    profiling = g.pop("profiling", None)
+    if profiling is None:
+        return
+
+    request_profiler.stop(profiling, time.perf_counter() - g.request_start, lambda: {
+        "route": request.endpoint or "unmatched",
+        "method": request.method,
+        "path": request.path,
+        "view_args": request.view_args,
+        "parameters": {name: request.values.getlist(name) for name in request.values
+                       if name != "selected_properties"},
+        "phases": g.phase_seconds,
+        "catalog_version": get_catalog_version(),
+        "catalog_size": g.property_manager.count(),
+        "storage_engine": storage_engine,
+        "exception": None if exception is None else repr(exception)
+    })
+
+
+@contextmanager
+def timed_phase(phase):
+    """
+    Measures a phase of the request (e.g. "query" or "render"), adding up repeated phases.
+
+    Args:
+        phase (str): The name of the phase.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        g.phase_seconds[phase] = g.phase_seconds.get(phase, 0) + time.perf_counter() - start
+
+
+def timed_stream(chunks, phase):
+    """
+    Produces the body of a streamed response within its request, measuring it as a phase of the request.
+
+    The request context is kept until the stream ends or is closed (see stream_with_context), so the teardown
+    functions recording the duration of the request, stopping its profiler and releasing its catalog run after
+    the body has been produced.
+
+    Args:
+        chunks (Iterable): The chunks of the body.
+        phase (str): The name of the phase.
+
+    Returns:
+        Iterator: The chunks of the body.
+    """
+    def measured_chunks():
+        iterator = iter(chunks)
+        while True:
+            with timed_phase(phase):
+                chunk = next(iterator, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    return stream_with_context(measured_chunks())
+
+
+def get_catalog_version():
+    """
+    Gets the version of the catalog used by the request, which differs between reloaded catalogs.
+
+    Returns:
+        str: The generation of the catalog and the version of its content.
+    """
+    return f"{g.catalog_generation}.{g.property_manager.get_version()}"
+
+
+def get_optional_int(name):
+    """
+    Reads an optional integer parameter from the query string or the submitted form.
+
+    Args:
+        name (str): The name of the parameter.
+
+    Returns:
+        int: The value of the parameter or None if it is missing or empty.
+
+    Raises:
+        BadRequest: If the value is not an integer.
+    """
+    value = request.values.get(name)
+    if not value:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        abort(400, description=f"{name} must be an integer")
+
+
+def get_criteria():
+    """
+    Reads the search criteria from the query string or the submitted form. Empty criteria are left as None.
+
+    Returns:
+        dict: The criteria, named like the arguments of PropertyManager.query.
+
+    Raises:
+        BadRequest: If a numeric criterion is not an integer.
+    """
+    return {
+        "location": request.values.get("location") or None,
+        "property_type": request.values.get("property_type") or None,
+        "min_price": get_optional_int("min_price"),
+        "max_price": get_optional_int("max_price"),
+        "min_square_footage": get_optional_int("min_square_footage"),
+        "max_square_footage": get_optional_int("max_square_footage")
+    }
+
+
+def get_page():
+    """
+    Reads the requested page number and page size from the query string or the submitted form.
+
+    Returns:
+        tuple: The page number (starting from 1) and the number of properties per page.
+
+    Raises:
+        BadRequest: If the page number or the page size is not a positive integer.
+    """
+    page = get_optional_int("page") or 1
+    limit = get_optional_int("limit") or page_size
+    if page < 1 or limit < 1:
+        abort(400, description="page and limit must be positive integers")
+
+    return page, limit
+
+
+def render_listing(properties, info, page, limit, total=None, offset=0, sorting_attribute=None):
+    """
+    Renders one page of a property listing with the index.html template.
+
+    Args:
+        properties (list): The listed properties, starting at the given offset of the listing. It has to contain
+            at least the properties up to the end of the requested page, properties after it are ignored.
+        info (str): The description of the listing.
+        page (int): The page number (starting from 1).
+        limit (int): The number of properties per page.
+        total (int): The total number of listed properties or None if properties holds the whole listing.
+        offset (int): The position of the first given property in the listing.
+        sorting_attribute (str): The attribute the listing is ordered by without a sorting_attribute parameter
+            (e.g. "price" for a price range) or None, so the export of the listing keeps its order.
+
+    Returns:
+        render_template: The rendered template with the property data of the page.
+
+    Raises:
+        NotFound: If the page is after the last page of the listing.
+    """
+    if total is None:
+        total = len(properties)
+
+    pages = max((total + limit - 1) // limit, 1)
+    if page > pages:
+        abort(404, description=f"page {page} is after the last page ({pages})")
+
+    start = (page - 1) * limit
+    pagination = {
+        "page": page,
+        "pages": pages,
+        "first": start + 1,
+        "last": min(start + limit, total),
+        "total": total,
+        "params": [(name, value) for name, value in request.values.items(multi=True)
+                   if name not in ("page", "selected_properties")]
+    }
+    export_params = pagination["params"]
+    if sorting_attribute is not None and "sorting_attribute" not in request.values:
+        export_params = export_params + [("sorting_attribute", sorting_attribute)]
+    with timed_phase("render"):
+        return render_template(
+            "index.html",
+            properties=properties[start - offset:start - offset + limit],
+            info=info,
+            pagination=pagination,
+            export_params=export_params)
+
+
+def cached_page(route):
+    """
+    Decorates a listing route so that its rendered page is cached.
+
+    The cache key is the route path, the query string and form parameters exactly as sent (see PageCache.make_key)
+    and the catalog version, so pages are never served for a catalog that has changed since they were rendered.
+    Responses carry an ETag and GET requests revalidating a current page get a 304 response without a body.
+
+    Args:
+        route (callable): The route function returning the rendered page.
+
+    Returns:
+        callable: The decorated route function.
+    """
+    @wraps(route)
+    def wrapper(*args, **kwargs):
+        key = PageCache.make_key(
+            request.path,
+            (request.args, request.form),
+            get_catalog_version(),
+            ignored=("selected_properties",))
+
+        cached = page_cache.get(key)
+        if cached is None:
+            cached = page_cache.put(
+                key, route(*args, **kwargs).encode("utf-8"))
+
+        body, etag = cached
+        response = make_response(body)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
+
+    return wrapper
+
+
+@app.route('/')
+@cached_page
+def homepage():
+    """
+    Route for the homepage that renders the index.html template with the list of all properties.
+
+    Returns:
+        render_template: The rendered template with property data.
+    """
+    page, limit = get_page()
+    return render_listing(
+        g.property_manager.get_properties(),
+        info="all",
+        page=page,
+        limit=limit)
+
+
+@app.route("/filter_by_location", methods=["POST"])
+@cached_page
+def filter_by_location():
+    """
+    Route for filtering properties by location.
+
+    Returns:
+        render_template: The rendered template with filtered property data.
+    """
+    location = request.form["location"]
+    with timed_phase("query"):
+        filtered_properties = g.property_manager.filter_by_location(
+            location=location)
+    page, limit = get_page()
+    return render_listing(
+        filtered_properties,
+        info=f"filtered by location: {location}",
+        page=page,
+        limit=limit)
+
+
+@app.route("/filter_by_price", methods=["POST"])
+@cached_page
+def filter_by_price():
+    """
+    Route for filtering properties by price range.
+
+    Returns:
+        render_template: The rendered template with filtered property data.
+    """
+    min_price = int(request.form["min_price"])
+    if not request.form["max_price"]:
+        max_price = None
+    else:
+        max_price = int(request.form["max_price"])
+
+    with timed_phase("query"):
+        filtered_properties = g.property_manager.filter_by_price(min_price=min_price,
+                                                               max_price=max_price)
+    page, limit = get_page()
+    return render_listing(
+        filtered_properties,
+        info=f"filtered by price: min={min_price}, max={max_price}",
+        page=page,
+        limit=limit,
+        sorting_attribute="price")
+
+
+@app.route("/filter_by_square_footage", methods=["POST"])
+@cached_page
+def filter_by_square_footage():
+    """
+    Route for filtering properties by square footage range.
+
+    Returns:
+        render_template: The rendered template with filtered property data.
+    """
+    min_square_footage = int(request.form["min_square_footage"])
+    if not request.form["max_square_footage"]:
+        max_square_footage = None
+    else:
+        max_square_footage = int(request.form["max_square_footage"])
+
+    with timed_phase("query"):
+        filtered_properties = g.property_manager.filter_by_square_footage(
+            min_square_footage=min_square_footage, max_square_footage=max_square_footage)
+    page, limit = get_page()
+    return render_listing(
+        filtered_properties,
+        info=f"filtered by square footage: min={min_square_footage}, max={max_square_footage}",
+        page=page,
+        limit=limit,
+        sorting_attribute="square_footage")
+
+
+@app.route("/filter_by_property_type", methods=["POST"])
+@cached_page
+def filter_by_property_type():
+    """
+    Route for filtering properties by property type.
+
+    Returns:
+        render_template: The rendered template with filtered property data.
+    """
+    property_type = request.form["property_type"]
+    with timed_phase("query"):
+        filtered_properties = g.property_manager.filter_by_property_type(
+            property_type=property_type)
+    page, limit = get_page()
+    return render_listing(
+        filtered_properties,
+        info=f"filtered by property type {property_type}",
+        page=page,
+        limit=limit)
+
+
+@app.route("/sort", methods=["POST"])
+@cached_page
+def sort():
+    """
+    Route for sorting properties based on the given attribute and sorting type.
+
+    Only the properties of the requested page are read from the presorted order.
+
+    Returns:
+        render_template: The rendered template with sorted property data.
+    """
+    sorting_attribute = request.form["sorting_attribute"]
+    sorting_type = request.form["sorting_type"]
+    page, limit = get_page()
+    with timed_phase("query"):
+        sorted_properties = g.property_manager.sort_properties(
+            sorting_attribute=sorting_attribute,
+            sorting_type=sorting_type,
+            limit=limit,
+            offset=(page - 1) * limit)
+    return render_listing(
+        sorted_properties,
+        info=f"sorted by {sorting_attribute} in {sorting_type} order",
+        page=page,
+        limit=limit,
+        total=len(g.property_manager.get_properties()),
+        offset=(page - 1) * limit)
+
+
+@app.route("/search", methods=["GET", "POST"])
+@cached_page
+def search():
+    """
+    Route for finding properties matching several criteria at once, optionally sorted.
+
+    Empty criteria are ignored.
+
+    Returns:
+        render_template: The rendered template with the matching property data.
+    """
+    criteria = get_criteria()
+    sorting_attribute = request.values.get("sorting_attribute") or None
+    sorting_type = request.values.get("sorting_type") or "ascending"
+    page, limit = get_page()
+
+    try:
+        with timed_phase("query"):
+            found_properties = g.property_manager.query(
+                **criteria,
+                sorting_attribute=sorting_attribute,
+                sorting_type=sorting_type,
+                limit=limit,
+                offset=(page - 1) * limit)
+            total = g.property_manager.count(**criteria)
+    except ValueError as e:
+        abort(400, description=str(e))
+
+    description = ", ".join(
+        f"{name}={value}" for name, value in criteria.items() if value is not None)
+    if sorting_attribute is not None:
+        description += f"{', ' if description else ''}sorted by {sorting_attribute} in {sorting_type} order"
+    return render_listing(
+        found_properties,
+        info=f"search: {description or 'all'}",
+        page=page,
+        limit=limit,
+        total=total,
+        offset=(page - 1) * limit)
+
+
+def export_properties(properties):
+    """
+    Saves properties to a new export file in the format requested with the format parameter.
+
+    Args:
+        properties (Iterable): The properties to save.
+
+    Returns:
+        render_template: The rendered template indicating the success, the path to the saved file and the
+            number of saved properties.
+
+    Raises:
+        BadRequest: If the format is not supported.
+    """
+    try:
+        with timed_phase("export"):
+            path_to_file, count = property_exporter.export(
+                properties, file_format=request.values.get("format") or None)
+    except ValueError as e:
+        abort(400, description=str(e))
+
+    return render_template("success.html", path_to_file=path_to_file, count=count)
+
+
+@app.route("/save_current_selection", methods=["POST"])
+def save_current_selection():
+    """
+    Route for saving the current selection of properties to a new file.
+
+    Returns:
+        render_template: The rendered template indicating the success and the path to the saved file.
+    """
+    selected_properties = request.form.getlist("selected_properties")
+    return export_properties(g.property_manager.get_by_ids(selected_properties))
+
+
+@app.route("/export", methods=["POST"])
+def export():
+    """
+    Route for saving every property matching the given criteria to a new file, optionally sorted.
+
+    The criteria and the sorting are the parameters of the /search route, so the parameters of any listing
+    export the whole listing, not only its current page. A listing ordered by a range it filters by (e.g.
+    /filter_by_price) posts that attribute as the sorting_attribute (see render_listing), so its export keeps
+    the order. Since every export writes a file, only POST requests are accepted, so links followed by crawlers
+    or prefetched by browsers never create one.
+
+    Returns:
+        render_template: The rendered template indicating the success and the path to the saved file.
+    """
+    try:
+        with timed_phase("query"):
+            found_properties = g.property_manager.query(
+                **get_criteria(),
+                sorting_attribute=request.values.get("sorting_attribute") or None,
+                sorting_type=request.values.get("sorting_type") or "ascending")
+    except ValueError as e:
+        abort(400, description=str(e))
+
+    return export_properties(found_properties)
+
+
+def encode_cursor(offset):
+    """
+    Creates the opaque cursor pointing at a position of an API listing in the current catalog version.
+
+    Args:
+        offset (int): The position of the first property of the next page.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    cursor = json.dumps({"offset": offset, "version": get_catalog_version()})
+    return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Reads the position an API cursor points at.
+
+    Args:
+        cursor (str): The cursor returned with the previous page or None for the first page.
+
+    Returns:
+        int: The position of the first property of the requested page.
+
+    Raises:
+        BadRequest: If the cursor is malformed.
+        Conflict: If the catalog has changed since the cursor was created.
+    """
+    if not cursor:
+        return 0
+
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        offset, version = int(position["offset"]), position["version"]
+    except (ValueError, KeyError, TypeError):
+        abort(400, description="cursor is malformed")
+
+    if offset < 0:
+        abort(400, description="cursor is malformed")
+    if version != get_catalog_version():
+        abort(409, description="the catalog has changed since the cursor was created, start again without it")
+
+    return offset
+
+
+def get_serializer():
+    """
+    Creates the serializer for the fields requested with the comma-separated fields parameter.
+
+    Returns:
+        PropertySerializer: The serializer of the requested fields or of all the fields if none are requested.
+
+    Raises:
+        BadRequest: If a requested field does not exist.
+    """
+    fields = request.args.get("fields")
+    try:
+        return PropertySerializer(
+            [field.strip() for field in fields.split(",") if field.strip()] if fields else None)
+    except ValueError as e:
+        abort(400, description=str(e))
+
+
+@app.errorhandler(HTTPException)
+def handle_http_exception(e):
+    """
+    Returns errors of the API routes as JSON objects and keeps the default error pages of the other routes.
+
+    Args:
+        e (HTTPException): The raised HTTP error.
+
+    Returns:
+        Response: The error response.
+    """
+    if not request.path.startswith("/api/"):
+        return e
+
+    response = e.get_response()
+    response.set_data(json.dumps({"error": e.description}))
+    response.mimetype = "application/json"
+    return response
+
+
+@app.route("/api/properties")
+def api_properties():
+    """
+    API route for listing the properties matching the given criteria, optionally sorted.
+
+    The criteria and the sorting are the parameters of the /search route. A page holds at most limit properties
+    and the next_cursor of the response requests the following page. The response is streamed.
+
+    Returns:
+        Response: The JSON document with the total number of matches, the next cursor and the properties.
+    """
+    criteria = get_criteria()
+    limit = get_optional_int("limit") or page_size
+    if not 1 <= limit <= api_max_limit:
+        abort(400, description=f"limit must be between 1 and {api_max_limit}")
+    offset = decode_cursor(request.args.get("cursor"))
+    serializer = get_serializer()
+
+    try:
+        with timed_phase("query"):
+            found_properties = g.property_manager.query(
+                **criteria,
+                sorting_attribute=request.args.get("sorting_attribute") or None,
+                sorting_type=request.args.get("sorting_type") or "ascending",
+                limit=limit,
+                offset=offset)
+            total = g.property_manager.count(**criteria)
+    except ValueError as e:
+        abort(400, description=str(e))
+
+    next_cursor = encode_cursor(offset + limit) if offset + limit < total else None
+    return Response(
+        timed_stream(
+            serializer.iter_document(found_properties, total=total, next_cursor=next_cursor),
+            "serialize"),
+        mimetype="application/json")
+
+
+@app.route("/api/properties/<property_id>")
+def api_property(property_id):
+    """
+    API route for getting one property by its ID.
+
+    Args:
+        property_id (str): The ID of the property.
+
+    Returns:
+        Response: The JSON object of the property.
+    """
+    with timed_phase("query"):
+        prop = g.property_manager.get_by_id(property_id)
+    if prop is None:
+        abort(404, description=f"property {property_id} not found")
+
+    with timed_phase("serialize"):
+        body = get_serializer().serialize(prop)
+    return Response(body, mimetype="application/json")
+
+
+@app.route("/metrics")
+def metrics():
+    """
+    Route exposing the request latencies and the row counters of this process in the Prometheus text format.
+
+    Returns:
+        Response: The metrics.
+
+    Raises:
+        NotFound: If the metrics are disabled.
+    """
+    if request_metrics is None:
+        abort(404)
+
+    return Response(request_metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+if __name__ == '__main__':
+    app.run(debug=True)
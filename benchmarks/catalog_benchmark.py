@@ -0,0 +1,437 @@
+"""
+Catalog Benchmark
+
+This script measures the load, filter, sort, serialization and page rendering paths of the storage engines
+on a synthetic catalog of any size (e.g. from 1k to 10M listings) and prints the timings as JSON.
+Every benchmark is run several times: the first run (which builds the lazily created indexes) is reported
+separately from the median and the minimum of all runs.
+Given the results of an earlier run as a baseline, it also lists every benchmark whose median got slower than
+the allowed ratio and exits with status 1, so slowdowns are caught before deploying.
+
+Usage (from the repository root):
+    python -m benchmarks.catalog_benchmark --count 100000 --output baseline.json
+    python -m benchmarks.catalog_benchmark --count 100000 --baseline baseline.json --max-slowdown 1.5
+    python -m benchmarks.catalog_benchmark --count 1000000 --load-workers 1 2 4 8 16 32 --skip-routes
+"""
+
+import argparse
+import configparser
+import gc
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from classes.catalog_reloader import CatalogReloader
+from classes.property_manager import PropertyManager
+from classes.columnar_property_manager import ColumnarPropertyManager
+from classes.sqlite_property_manager import SQLitePropertyManager
+
+STORAGE_ENGINES = {
+    "memory": PropertyManager,
+    "columnar": ColumnarPropertyManager,
+    "sqlite": SQLitePropertyManager
+}
+
+LOCATIONS = ("Sofia", "Plovdiv", "Varna", "Burgas", "Ruse", "Stara Zagora", "Pleven", "Sliven",
+             "Dobrich", "Shumen", "Pernik", "Haskovo", "Yambol", "Pazardzhik", "Blagoevgrad")
+BUSINESS_TYPES = ("Office", "Retail", "Restaurant", "Warehouse", "Workshop")
+
+# Number of properties on one page, as rendered by the app
+PAGE_SIZE = 50
+
+# Number of properties converted by the to_dict benchmark
+TO_DICT_COUNT = 10000
+
+# Medians differing from the baseline by less than this many seconds are never reported as regressions
+NOISE_FLOOR = 0.001
+
+
+def generate_catalog(path_to_file, count, seed=0):
+    """
+    Writes a synthetic catalog as a JSON Lines file, one listing at a time.
+
+    The listings are 60% apartments, 30% houses and 10% commercial spaces spread over LOCATIONS,
+    with prices and square footages drawn from skewed distributions. The same seed gives the same catalog.
+
+    Args:
+        path_to_file (str): The path to the file to write.
+        count (int): The number of listings.
+        seed (int): The seed of the random number generator.
+    """
+    generator = random.Random(seed)
+    with open(path_to_file, "w", encoding="utf-8") as catalog_file:
+        for number in range(count):
+            draw = generator.random()
+            square_footage = round(generator.lognormvariate(7, 0.5))
+            listing = {
+                "id": f"listing-{number:08d}",
+                "name": f"Listing {number}",
+                "location": generator.choice(LOCATIONS),
+                "price": round(square_footage * generator.uniform(80, 400), -2),
+                "square_footage": square_footage
+            }
+            if draw < 0.9:
+                listing["num_of_bedrooms"] = generator.randint(1, 6)
+                listing["num_of_bathrooms"] = generator.randint(1, 3)
+            if draw < 0.6:
+                listing["property_type"] = "Apartment"
+                listing["floor_number"] = generator.randint(0, 20)
+            elif draw < 0.9:
+                listing["property_type"] = "House"
+                listing["num_of_floors"] = generator.randint(1, 3)
+            else:
+                listing["property_type"] = "Commercial Space"
+                listing["business_type"] = generator.choice(BUSINESS_TYPES)
+            catalog_file.write(json.dumps(listing) + "\n")
+
+
+def time_calls(function, repeats, setup=None):
+    """
+    Calls a function several times and measures every call.
+
+    Args:
+        function (callable): The function to call without arguments.
+        repeats (int): The number of calls.
+        setup (callable): A function called without arguments before every call and not measured, or None.
+
+    Returns:
+        dict: The duration of the first call and the median and minimum durations of all calls, in seconds.
+    """
+    durations = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return {
+        "first_seconds": round(durations[0], 6),
+        "median_seconds": round(statistics.median(durations), 6),
+        "min_seconds": round(min(durations), 6),
+        "repeats": repeats
+    }
+
+
+def read_page(properties):
+    """
+    Reads the number of properties in a result and the dictionaries of its first page, like a rendered page does.
+
+    Args:
+        properties (Sequence): The properties returned by a PropertyManager method.
+
+    Returns:
+        int: The number of properties.
+    """
+    for prop in properties[:PAGE_SIZE]:
+        prop.to_dict()
+    return len(properties)
+
+
+def clear_property_caches(properties):
+    """
+    Drops the dictionaries, display rows and JSON the properties memoized.
+
+    Args:
+        properties (Iterable): The properties.
+    """
+    for prop in properties:
+        prop._clear_cache()
+
+
+def load_catalog(engine, path_to_catalog, path_to_snapshot=None, workers=1):
+    """
+    Creates a property manager of a storage engine and reads a catalog into it.
+
+    Args:
+        engine (str): The name of the storage engine (see STORAGE_ENGINES).
+        path_to_catalog (str): The path to the catalog file.
+        path_to_snapshot (str): The path to the binary snapshot of the catalog or None to always read the file.
+        workers (int): The number of processes parsing the catalog.
+
+    Returns:
+        PropertyManager: The loaded property manager.
+    """
+    property_manager = STORAGE_ENGINES[engine]()
+    property_manager.read_properties_from_json(path_to_catalog, path_to_snapshot=path_to_snapshot, workers=workers)
+    return property_manager
+
+
+def benchmark_engine(engine, path_to_catalog, repeats, load_repeats, load_workers=()):
+    """
+    Runs the benchmarks of one storage engine.
+
+    Args:
+        engine (str): The name of the storage engine (see STORAGE_ENGINES).
+        path_to_catalog (str): The path to the catalog file.
+        repeats (int): The number of runs of every benchmark except the loads.
+        load_repeats (int): The number of runs of the load benchmarks.
+        load_workers (Iterable): The numbers of processes to measure parallel loads with.
+
+    Returns:
+        tuple: The results of every benchmark, indexed by its name, and the last loaded property manager.
+    """
+    results = {"read_properties_from_json": time_calls(
+        lambda: load_catalog(engine, path_to_catalog), load_repeats)}
+    for workers in load_workers:
+        results[f"read_properties_from_json_workers_{workers}"] = time_calls(
+            lambda: load_catalog(engine, path_to_catalog, workers=workers), load_repeats)
+
+    if engine != "sqlite":
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_snapshot = os.path.join(directory, "catalog.snapshot")
+            load_catalog(engine, path_to_catalog, path_to_snapshot)
+            results["read_snapshot"] = time_calls(
+                lambda: load_catalog(engine, path_to_catalog, path_to_snapshot), load_repeats)
+
+    property_manager = load_catalog(engine, path_to_catalog)
+    count = len(property_manager.get_properties())
+    benchmarks = {
+        "filter_by_location": lambda: read_page(property_manager.filter_by_location("Sofia")),
+        "filter_by_price": lambda: read_page(property_manager.filter_by_price(150000, 250000)),
+        "filter_by_square_footage": lambda: read_page(property_manager.filter_by_square_footage(1000, 1500)),
+        "filter_by_property_type": lambda: read_page(property_manager.filter_by_property_type("House")),
+        "sort_properties": lambda: read_page(property_manager.sort_properties("price", "descending")),
+        "sort_properties_page": lambda: read_page(property_manager.sort_properties(
+            "square_footage", "ascending", limit=PAGE_SIZE, offset=count // 2)),
+        "query": lambda: read_page(property_manager.query(
+            location="Varna", min_price=100000, property_type="Apartment", sorting_attribute="price",
+            limit=PAGE_SIZE))
+    }
+    for name, function in benchmarks.items():
+        results[name] = time_calls(function, repeats)
+
+    # The memory engine keeps its property objects, which memoize their dictionaries after the first call,
+    # so every run of to_dict starts from empty caches like the first request after a load does
+    results["to_dict"] = time_calls(
+        lambda: [prop.to_dict() for prop in property_manager.get_properties()[:TO_DICT_COUNT]], repeats,
+        setup=lambda: clear_property_caches(property_manager.get_properties()[:TO_DICT_COUNT]))
+
+    return results, property_manager
+
+
+def load_app(directory):
+    """
+    Imports the app configured to keep every file it writes in a directory and not to watch for reloads.
+
+    The app reads an empty catalog, saves no snapshot and installs no signal handler, so importing it
+    changes nothing outside the directory. Its catalog is replaced by benchmark_routes.
+
+    Args:
+        directory (str): The directory holding the configuration, the empty catalog and the exports.
+
+    Returns:
+        module: The app module.
+    """
+    path_to_catalog = os.path.join(directory, "app_catalog.json")
+    with open(path_to_catalog, "w", encoding="utf-8") as catalog_file:
+        catalog_file.write("[]")
+
+    config = configparser.ConfigParser()
+    config["FILES"] = {
+        "Input": path_to_catalog,
+        "Output": os.path.join(directory, "exports", "selected_properties.json"),
+        "Deltas": ""
+    }
+    config["STORAGE"] = {
+        "Engine": "memory",
+        "Snapshot": "",
+        "Database": os.path.join(directory, "app_catalog.sqlite3")
+    }
+    config["PROFILING"] = {"Enabled": "false"}
+    config["RELOAD"] = {"Watch": "false", "Signal": ""}
+    path_to_config = os.path.join(directory, "app_config.ini")
+    with open(path_to_config, "w", encoding="utf-8") as config_file:
+        config.write(config_file)
+
+    previous_config = os.environ.get("PROPERTY_APP_CONFIG")
+    os.environ["PROPERTY_APP_CONFIG"] = path_to_config
+    try:
+        return importlib.import_module("app")
+    finally:
+        if previous_config is None:
+            del os.environ["PROPERTY_APP_CONFIG"]
+        else:
+            os.environ["PROPERTY_APP_CONFIG"] = previous_config
+
+
+def benchmark_routes(app_module, property_manager, repeats):
+    """
+    Renders the pages and API responses of the app for a catalog through the Flask test client.
+
+    The page cache is cleared before every request, so every page is rendered again.
+
+    Args:
+        app_module (module): The app module (see load_app).
+        property_manager (PropertyManager): The catalog to serve.
+        repeats (int): The number of runs of every benchmark.
+
+    Returns:
+        dict: The results of every benchmark, indexed by the name of the route.
+
+    Raises:
+        RuntimeError: If a route does not respond with status 200.
+    """
+    app_module.catalog_reloader = CatalogReloader(lambda: property_manager, app_module.input_file)
+    client = app_module.app.test_client()
+    count = len(property_manager.get_properties())
+    requests = {
+        "route_homepage": ("GET", "/", None),
+        "route_homepage_last_page": ("GET", f"/?page={max(count // PAGE_SIZE, 1)}", None),
+        "route_filter_by_location": ("POST", "/filter_by_location", {"location": "Sofia"}),
+        "route_sort": ("POST", "/sort", {"sorting_attribute": "price", "sorting_type": "descending"}),
+        "route_search": ("GET", "/search?location=Varna&min_price=100000&property_type=Apartment"
+                                "&sorting_attribute=price", None),
+        "route_api_properties": ("GET", "/api/properties?location=Sofia&sorting_attribute=price&limit=100", None)
+    }
+
+    def render(method, path, data):
+        app_module.page_cache.clear()
+        response = client.open(path, method=method, data=data)
+        if response.status_code != 200:
+            raise RuntimeError(f"{__name__}: {method} {path} responded with {response.status}")
+        response.get_data()
+
+    return {name: time_calls(lambda: render(*request), repeats) for name, request in requests.items()}
+
+
+def find_regressions(results, baseline, max_slowdown, thresholds):
+    """
+    Compares the results with the ones of an earlier run.
+
+    Args:
+        results (dict): The results of this run, indexed by engine and benchmark.
+        baseline (dict): The results of the earlier run, in the same format.
+        max_slowdown (float): The largest allowed ratio of a median to the baseline median.
+        thresholds (dict): Other allowed ratios for some benchmarks, indexed by the benchmark name.
+
+    Returns:
+        list: The benchmarks that got slower than allowed, with their medians and the ratio.
+    """
+    regressions = []
+    for engine, engine_results in results.items():
+        for name, result in engine_results.items():
+            baseline_result = baseline.get(engine, {}).get(name)
+            if baseline_result is None:
+                continue
+            seconds = result["median_seconds"]
+            baseline_seconds = baseline_result["median_seconds"]
+            ratio = seconds / baseline_seconds if baseline_seconds else float("inf")
+            if ratio > thresholds.get(name, max_slowdown) and seconds - baseline_seconds > NOISE_FLOOR:
+                regressions.append({
+                    "engine": engine,
+                    "benchmark": name,
+                    "baseline_seconds": baseline_seconds,
+                    "median_seconds": seconds,
+                    "ratio": round(ratio, 3)
+                })
+    return regressions
+
+
+def parse_threshold(value):
+    """
+    Parses a per-benchmark threshold given on the command line.
+
+    Args:
+        value (str): The benchmark name and the allowed ratio, e.g. "to_dict=1.5".
+
+    Returns:
+        tuple: The benchmark name and the ratio.
+
+    Raises:
+        ArgumentTypeError: If the value is not a name and a number separated by "=".
+    """
+    name, _, ratio = value.partition("=")
+    try:
+        return name, float(ratio)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=RATIO, got {value}")
+
+
+def main():
+    """
+    Runs the benchmarks, prints or saves the results as JSON and compares them with the baseline.
+
+    Returns:
+        int: The exit status, 1 if a benchmark got slower than allowed and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000,
+                        help="number of generated listings (not used when --catalog exists)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the generated catalog")
+    parser.add_argument("--catalog",
+                        help="JSON Lines file to use as the catalog, generated if it does not exist "
+                             "(by default a temporary file)")
+    parser.add_argument("--engines", nargs="+", choices=STORAGE_ENGINES, default=list(STORAGE_ENGINES),
+                        help="storage engines to benchmark")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="number of runs of every benchmark")
+    parser.add_argument("--load-repeats", type=int, default=5,
+                        help="number of runs of the load benchmarks")
+    parser.add_argument("--load-workers", type=int, nargs="+", default=[],
+                        help="numbers of processes to measure parallel loads of the catalog with, e.g. 1 2 4 8")
+    parser.add_argument("--skip-routes", action="store_true",
+                        help="do not render the routes of the app")
+    parser.add_argument("--output",
+                        help="file to save the results to (by default they are printed)")
+    parser.add_argument("--baseline",
+                        help="results of an earlier run to compare with")
+    parser.add_argument("--max-slowdown", type=float, default=1.5,
+                        help="largest allowed ratio of a median to the baseline median")
+    parser.add_argument("--threshold", type=parse_threshold, action="append", default=[],
+                        help="allowed ratio of one benchmark, e.g. --threshold to_dict=1.5")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path_to_catalog = arguments.catalog or os.path.join(directory, "catalog.jsonl")
+        if not os.path.exists(path_to_catalog):
+            generate_catalog(path_to_catalog, arguments.count, arguments.seed)
+
+        app_module = None if arguments.skip_routes else load_app(directory)
+        results = {}
+        for engine in arguments.engines:
+            results[engine], property_manager = benchmark_engine(
+                engine, path_to_catalog, arguments.repeats, arguments.load_repeats, arguments.load_workers)
+            if app_module is not None:
+                results[engine].update(benchmark_routes(app_module, property_manager, arguments.repeats))
+            del property_manager
+
+    report = {
+        "count": arguments.count,
+        "seed": arguments.seed,
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "platform": platform.platform(),
+        "results": results
+    }
+
+    status = 0
+    if arguments.baseline is not None:
+        with open(arguments.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("count") != arguments.count:
+            print(f"{__name__}: The baseline was measured on {baseline.get('count')} listings, "
+                  f"not {arguments.count}", file=sys.stderr)
+        report["baseline"] = arguments.baseline
+        report["max_slowdown"] = arguments.max_slowdown
+        report["regressions"] = find_regressions(
+            results, baseline["results"], arguments.max_slowdown, dict(arguments.threshold))
+        status = 1 if report["regressions"] else 0
+
+    if arguments.output is None:
+        print(json.dumps(report, indent=4))
+    else:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=4)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Property Memory Benchmark
+
+This script measures how many bytes one property object takes for every property class.
+It compares the compact __slots__ layout of the classes with the per-instance __dict__ layout they used before,
+which is emulated by subclasses that shadow the slots so that every field is stored in the instance __dict__.
+
+Usage (from the repository root):
+    python -m benchmarks.memory_benchmark --count 1000000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+
+
+def generate_arguments(property_class, count):
+    """
+    Generates the constructor arguments of count listings of the given class.
+
+    Args:
+        property_class (type): The property class (Apartment, House or CommercialSpace).
+        count (int): The number of listings.
+
+    Returns:
+        list: The keyword arguments of every listing.
+    """
+    locations = ["Sofia", "Plovdiv", "Varna", "Burgas", "Blagoevgrad"]
+    arguments = []
+    for number in range(count):
+        listing = {
+            "name": f"{property_class.__name__} {number}",
+            "property_type": "Commercial Space" if property_class is CommercialSpace else property_class.__name__,
+            "location": locations[number % len(locations)],
+            "price": 50000 + number % 950000,
+            "square_footage": 300 + number % 4700
+        }
+        if property_class is CommercialSpace:
+            listing["business_type"] = "Office"
+        else:
+            listing["num_of_bedrooms"] = number % 6
+            listing["num_of_bathrooms"] = number % 4
+            if property_class is Apartment:
+                listing["floor_number"] = number % 20
+            else:
+                listing["num_of_floors"] = number % 3 + 1
+        arguments.append(listing)
+    return arguments
+
+
+def get_slot_names(property_class):
+    """
+    Gets the names of all slots of a class, including the inherited ones.
+
+    Args:
+        property_class (type): The property class.
+
+    Returns:
+        list: The slot names.
+    """
+    return [name for klass in property_class.__mro__
+            for name in getattr(klass, "__slots__", ())]
+
+
+def with_dict_layout(property_class):
+    """
+    Creates a subclass storing every field in the instance __dict__, like the classes did before using __slots__.
+
+    The subclass shadows the slot descriptors with plain class attributes, so attribute access falls through
+    to the instance __dict__. The (now unused) slot storage is still allocated and is subtracted when measuring.
+
+    Args:
+        property_class (type): The property class.
+
+    Returns:
+        type: The subclass with the __dict__ layout.
+    """
+    return type(
+        f"Dict{property_class.__name__}",
+        (property_class,),
+        dict.fromkeys(get_slot_names(property_class)))
+
+
+def measure(property_class, arguments, unused_bytes=0):
+    """
+    Measures the memory allocated while creating one object per listing.
+
+    Args:
+        property_class (type): The class to instantiate.
+        arguments (list): The keyword arguments of every listing.
+        unused_bytes (int): Bytes per object that would not exist in the measured layout.
+
+    Returns:
+        float: The number of bytes per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = [property_class(**listing) for listing in arguments]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated / len(arguments) - unused_bytes
+
+
+def main():
+    """
+    Runs the benchmark and prints the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000000,
+                        help="number of generated listings per property class")
+    count = parser.parse_args().count
+
+    results = {"count": count, "bytes_per_property": {}}
+    for property_class in (Apartment, House, CommercialSpace):
+        arguments = generate_arguments(property_class, count)
+        # Every shadowed slot keeps an unused pointer in the object
+        unused_bytes = 8 * len(get_slot_names(property_class))
+        results["bytes_per_property"][property_class.__name__] = {
+            "dict_layout": round(measure(with_dict_layout(property_class), arguments, unused_bytes), 1),
+            "slots_layout": round(measure(property_class, arguments), 1)
+        }
+
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()
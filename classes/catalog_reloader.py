@@ -0,0 +1,284 @@
+"""
+CatalogReloader Class
+
+This file defines the CatalogReloader class, which reloads the property catalog without restarting the app.
+A new PropertyManager (with its indexes) is built from the input file in a background thread while the current one
+keeps serving requests, and is then swapped in with a single assignment. Requests that acquired the previous
+catalog keep using it until they release it, since a loaded catalog is never changed by a reload, and the replaced
+catalog is closed once its last reader has released it.
+Changes made at runtime are swapped in the same way, after being applied to a copy of the current catalog.
+A reload is triggered when the input file or another watched path changes (by polling their status)
+or when the process receives a signal.
+"""
+
+import os
+import signal
+import sys
+import threading
+
+
+class CatalogReloader:
+    def __init__(self, load_catalog, path_to_file, on_reload=None, watched_paths=()):
+        """
+        Initializes a CatalogReloader object and loads the first catalog.
+
+        Args:
+            load_catalog (callable): A function returning a new, fully loaded PropertyManager.
+            path_to_file (str): The path to the file the catalog is loaded from, watched for changes.
+            on_reload (callable): A function called after a new catalog has been swapped in (e.g. to clear caches).
+            watched_paths (Iterable): Other files or directories the catalog depends on, also watched for changes
+                (a directory changes when a file is added to it, removed from it or renamed in it).
+        """
+        self._load_catalog = load_catalog
+        self._watched_paths = (path_to_file, *watched_paths)
+        self._on_reload = on_reload
+        self._poll_interval = None
+        self._worker = None
+        self._fork_hook_registered = False
+        self._create_synchronization()
+
+        self._file_state = self._get_file_state()
+        self._current = (0, load_catalog())
+
+    def get_current(self):
+        """
+        Gets the current catalog together with its generation.
+
+        Both are read at once, so a request should call this once and use the returned catalog throughout.
+
+        Returns:
+            tuple: The generation (the number of catalogs swapped in so far) and the PropertyManager.
+        """
+        return self._current
+
+    def acquire(self):
+        """
+        Gets the current catalog together with its generation and keeps the catalog open until it is released.
+
+        A catalog replaced by a reload or a change is closed (see PropertyManager.close) once every reader
+        that acquired it has released it.
+
+        Returns:
+            tuple: The generation and the PropertyManager, as returned by get_current.
+        """
+        with self._readers_lock:
+            current = self._current
+            self._readers[id(current[1])] = self._readers.get(id(current[1]), 0) + 1
+            return current
+
+    def release(self, catalog):
+        """
+        Releases a catalog acquired with acquire, closing it if it has been replaced and this was its last reader.
+
+        Args:
+            catalog (PropertyManager): The acquired catalog.
+        """
+        with self._readers_lock:
+            readers = self._readers.pop(id(catalog)) - 1
+            if readers:
+                self._readers[id(catalog)] = readers
+                return
+            replaced = catalog is not self._current[1]
+
+        if replaced:
+            self._close(catalog)
+
+    def get_manager(self):
+        """
+        Gets the current catalog.
+
+        Returns:
+            PropertyManager: The current catalog.
+        """
+        return self._current[1]
+
+    def reload(self):
+        """
+        Builds a new catalog in the calling thread and swaps it in. Concurrent reloads run one after another.
+
+        If loading fails, the error is printed and the current catalog is kept until the file changes again.
+
+        Returns:
+            bool: True if a new catalog has been swapped in.
+        """
+        with self._reload_lock:
+            self._file_state = self._get_file_state()
+            try:
+                catalog = self._load_catalog()
+            except Exception as e:
+                print(f"{__name__}: Reload failed, keeping the current catalog: {e}", file=sys.stderr)
+                return False
+
+            self._swap(catalog)
+
+        if self._on_reload is not None:
+            self._on_reload()
+        return True
+
+    def update(self, change):
+        """
+        Changes the catalog copy-on-write, without blocking the requests reading it.
+
+        The change is applied to a copy of the current catalog (see PropertyManager.copy), which is then swapped
+        in like a reloaded catalog, so requests never see a partially applied change. Changes and reloads run one
+        after another, and a later reload replaces the changed catalog with the content of the file.
+
+        Args:
+            change (callable): A function changing the PropertyManager it is given
+                (e.g. lambda catalog: catalog.apply_delta(path_to_delta)).
+
+        Returns:
+            object: The value returned by the change.
+
+        Raises:
+            Exception: Any error raised by the change, in which case the current catalog is kept.
+        """
+        with self._reload_lock:
+            catalog = self._current[1].copy()
+            result = change(catalog)
+            self._swap(catalog)
+
+        if self._on_reload is not None:
+            self._on_reload()
+        return result
+
+    def request_reload(self):
+        """
+        Asks the background thread to reload the catalog and returns immediately.
+        """
+        self._reload_requested.set()
+
+    def start(self, poll_interval=None):
+        """
+        Starts the background thread reloading the catalog on request and, optionally, when the file changes.
+
+        The thread is started again in processes forked from this one (e.g. pre-forked server workers)
+        while it runs in this one.
+
+        Args:
+            poll_interval (int|float): The number of seconds between checks of the file or None to reload
+                only on request.
+        """
+        self._poll_interval = poll_interval
+        if not self._fork_hook_registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._start_after_fork)
+            self._fork_hook_registered = True
+        self._start_worker()
+
+    def stop(self):
+        """
+        Stops the background thread, waiting for a running reload to finish.
+        """
+        self._stopped.set()
+        self._reload_requested.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def install_signal_handler(self, signal_name):
+        """
+        Makes a signal request a reload. Signal handlers can only be installed by the main thread.
+
+        Args:
+            signal_name (str): The name of the signal (e.g. "SIGHUP").
+
+        Returns:
+            bool: True if the handler was installed, False if the signal does not exist on this platform
+                or this is not the main thread.
+        """
+        signal_number = getattr(signal, signal_name, None)
+        if signal_number is None or threading.current_thread() is not threading.main_thread():
+            return False
+
+        signal.signal(signal_number, lambda signum, frame: self.request_reload())
+        return True
+
+    def _swap(self, catalog):
+        """
+        Swaps in a new catalog and closes the replaced one unless a reader still uses it. (protected method)
+
+        Args:
+            catalog (PropertyManager): The new catalog, which may be the current one changed in place
+                (see SQLitePropertyManager.copy).
+        """
+        with self._readers_lock:
+            replaced = self._current[1]
+            self._current = (self._current[0] + 1, catalog)
+            if replaced is catalog or id(replaced) in self._readers:
+                return
+
+        self._close(replaced)
+
+    @staticmethod
+    def _close(catalog):
+        """
+        Closes a replaced catalog, printing the error if closing fails. (protected method)
+
+        Args:
+            catalog (PropertyManager): The replaced catalog.
+        """
+        try:
+            catalog.close()
+        except Exception as e:
+            print(f"{__name__}: Closing the replaced catalog failed: {e}", file=sys.stderr)
+
+    def _create_synchronization(self):
+        """
+        Creates the locks and the events used by the reloads and the readers. (protected method)
+
+        The readers of a forked process start from none, since the threads that acquired catalogs
+        are not inherited.
+        """
+        self._reload_lock = threading.Lock()
+        self._reload_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._readers_lock = threading.Lock()
+        self._readers = {}
+
+    def _start_worker(self):
+        """
+        Starts the background thread. (protected method)
+        """
+        self._worker = threading.Thread(target=self._run, name="catalog-reloader", daemon=True)
+        self._worker.start()
+
+    def _start_after_fork(self):
+        """
+        Replaces the synchronization objects and the thread, which are not inherited by a forked process.
+        (protected method)
+        """
+        self._create_synchronization()
+        if self._worker is not None:
+            self._start_worker()
+
+    def _run(self):
+        """
+        Runs the background thread, reloading the catalog when requested or when the file has changed.
+        (protected method)
+        """
+        while not self._stopped.is_set():
+            requested = self._reload_requested.wait(self._poll_interval)
+            if self._stopped.is_set():
+                break
+            self._reload_requested.clear()
+
+            if requested or self._get_file_state() != self._file_state:
+                self.reload()
+
+    def _get_file_state(self):
+        """
+        Gets the status of the watched files that changes whenever one of them is modified or replaced.
+        (protected method)
+
+        Returns:
+            tuple: The modification time, size and inode of every watched file (None for missing ones).
+        """
+        states = []
+        for path in self._watched_paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                states.append(None)
+                continue
+            states.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(states)
@@ -0,0 +1,694 @@
+"""
+ColumnarPropertyManager Class (inherits from PropertyManager)
+
+This file defines the ColumnarPropertyManager class, an alternative storage engine for the property catalog.
+Instead of a list of Property objects it keeps a PropertyColumns object, filters by reading cached lists of the
+rows of every location and property type or by scanning typed columns, sorts by ordering row numbers, and returns
+PropertyRows sequences that only create the Property objects which are actually accessed (e.g. the rendered page).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import accumulate, compress
+from classes.property_columns import PropertyColumns
+from classes.property_manager import PropertyManager, SORTING_KEYS
+from classes.property_rows import PropertyRows
+from classes.property_snapshot import PropertySnapshot, ORDERED_ATTRIBUTES
+
+
+class ColumnarPropertyManager(PropertyManager):
+    def __init__(self):
+        """
+        Initializes a ColumnarPropertyManager object with empty columns.
+        """
+        super().__init__()
+        self._columns = PropertyColumns()
+        self._orders = {}
+        self._groups = {}
+
+    def copy(self):
+        """
+        Creates a copy of the catalog that can be changed while this one keeps serving readers.
+
+        The columns are copied, except for memory-mapped ones, and the cached orders and groups are shared:
+        changes replace them instead of changing them.
+
+        Returns:
+            ColumnarPropertyManager: The copy.
+        """
+        catalog = super().copy()
+        catalog._columns = self._columns.copy()
+        catalog._orders = dict(self._orders)
+        catalog._groups = dict(self._groups)
+        return catalog
+
+    def get_properties(self):
+        """
+        Gets all properties.
+
+        Returns:
+            PropertyRows: The properties in the order they were added.
+        """
+        return PropertyRows(self._columns, range(len(self._columns)))
+
+    def get_by_id(self, property_id):
+        """
+        Gets a property by its ID.
+
+        Args:
+            property_id (str): The ID of the property.
+
+        Returns:
+            Property: The property with the given ID or None if there is no such property.
+        """
+        row = self._columns.find_row(property_id)
+        return None if row is None else self._columns.materialize(row)
+
+    def get_by_ids(self, property_ids):
+        """
+        Gets the properties with the given IDs.
+
+        Unknown IDs are skipped.
+
+        Args:
+            property_ids (list): The IDs of the properties.
+
+        Returns:
+            list: The properties in the order of the given IDs.
+        """
+        rows = (self._columns.find_row(property_id)
+                for property_id in property_ids)
+        return self._columns.materialize_rows([row for row in rows if row is not None])
+
+    def _add_property(self, property_to_add):
+        """
+        Adds a property as a new row. (protected method)
+
+        Args:
+            property_to_add (Property): The property to add.
+
+        Raises:
+            Exception: If the given object is not an instance of Property.
+            ValueError: If a property with the same ID has already been added.
+        """
+        self._add_properties([property_to_add])
+
+    def _add_properties(self, properties_to_add):
+        """
+        Adds many properties as new rows. (protected method)
+
+        Args:
+            properties_to_add (list): The properties to add.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        self._check_new_properties(
+            properties_to_add,
+            lambda property_id: self._columns.find_row(property_id) is not None)
+
+        for property_to_add in properties_to_add:
+            self._columns.append(property_to_add)
+        self._version += 1
+
+    def _add_columns(self, columns):
+        """
+        Appends the rows of a PropertyColumns object, e.g. a shard read by a worker process,
+        without creating Property objects. (protected method)
+
+        Args:
+            columns (PropertyColumns): The properties to add.
+
+        Raises:
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        new_ids = set()
+        for property_id in columns.to_columns()["ids"]:
+            if property_id in new_ids or self._columns.find_row(property_id) is not None:
+                raise ValueError(
+                    f"{__name__}: Duplicate property ID {property_id}")
+            new_ids.add(property_id)
+
+        self._columns.extend(columns)
+        self._version += 1
+
+    def apply_changes(self, properties_to_upsert, property_ids_to_delete=()):
+        """
+        Deletes and adds or replaces properties as one change of the catalog.
+
+        The deletions are applied first. A property replacing one with the same ID is deleted and appended
+        as a new row. Removed rows are dropped from the columns and from the cached orders and groups in one pass
+        over each, and every appended row is placed in the cached orders with a binary search and at the end of its
+        groups, so they stay current without being built again.
+
+        Args:
+            properties_to_upsert (list): The properties to add or replace, with IDs unique among themselves.
+            property_ids_to_delete (Iterable): The IDs of the properties to delete. Unknown IDs are skipped.
+
+        Returns:
+            tuple: The numbers of added, replaced and deleted properties.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another one of them.
+        """
+        self._check_new_properties(properties_to_upsert, lambda property_id: False)
+
+        removed_rows = set()
+        deleted = 0
+        for property_id in property_ids_to_delete:
+            row = self._columns.find_row(property_id)
+            if row is not None and row not in removed_rows:
+                removed_rows.add(row)
+                deleted += 1
+        replaced = 0
+        for property_to_upsert in properties_to_upsert:
+            row = self._columns.find_row(property_to_upsert.get_id())
+            if row is not None and row not in removed_rows:
+                removed_rows.add(row)
+                replaced += 1
+        if not removed_rows and not properties_to_upsert:
+            return 0, 0, 0
+
+        orders = {attribute: (order, values)
+                  for attribute, (version, order, values) in self._orders.items() if version == self._version}
+        groups = {attribute: rows_by_code
+                  for attribute, (version, rows_by_code) in self._groups.items() if version == self._version}
+        if removed_rows:
+            kept = self._columns.delete_rows(removed_rows)
+            new_rows = array("l", accumulate(kept, initial=-1))
+            del new_rows[0]
+            for attribute, (order, values) in orders.items():
+                order_kept = bytes(map(kept.__getitem__, order))
+                orders[attribute] = (
+                    array("l", map(new_rows.__getitem__, compress(order, order_kept))),
+                    array(self._get_typecode(values), compress(values, order_kept)))
+            for attribute, rows_by_code in groups.items():
+                groups[attribute] = {
+                    code: array("l", map(new_rows.__getitem__, compress(rows, map(kept.__getitem__, rows))))
+                    for code, rows in rows_by_code.items()}
+
+        first_new_row = len(self._columns)
+        for property_to_upsert in properties_to_upsert:
+            self._columns.append(property_to_upsert)
+        self._version += 1
+
+        for attribute, (order, values) in orders.items():
+            self._orders[attribute] = (self._version, *self._merge_rows(
+                order, values, self._columns.get_column(attribute), range(first_new_row, len(self._columns))))
+        for attribute, rows_by_code in groups.items():
+            self._groups[attribute] = (self._version, self._append_to_groups(
+                rows_by_code, self._columns.get_codes(attribute), range(first_new_row, len(self._columns))))
+
+        return len(properties_to_upsert) - replaced, replaced, deleted
+
+    def write_snapshot(self, path_to_snapshot, source, deltas=()):
+        """
+        Saves the columns and the cached orders to a binary snapshot (see PropertySnapshot).
+
+        The columns and orders are then replaced by the memory-mapped ones of the written snapshot, which hold
+        the same rows, so the process that built the catalog shares its memory with the ones reading the snapshot.
+
+        Args:
+            path_to_snapshot (str): The path to the snapshot file.
+            source (dict): The description of the file the properties were read from,
+                as returned by PropertySnapshot.describe_source.
+            deltas (Iterable): The descriptions of the delta files applied after the file, in order.
+        """
+        snapshot = PropertySnapshot(path_to_snapshot)
+        snapshot.write(
+            self._columns,
+            {attribute: self._get_order(attribute) for attribute in ORDERED_ATTRIBUTES},
+            source,
+            deltas)
+
+        self._columns, orders = snapshot.read()
+        self._orders = {attribute: (self._version, *orders[attribute])
+                        for attribute in ORDERED_ATTRIBUTES}
+
+    def read_snapshot(self, path_to_snapshot):
+        """
+        Adds the properties saved in a binary snapshot (see PropertySnapshot).
+
+        If the catalog was empty, the memory-mapped columns and orders of the snapshot are used as they are.
+
+        Args:
+            path_to_snapshot (str): The path to the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a compatible snapshot or holds an ID that has already been added.
+        """
+        if len(self._columns):
+            super().read_snapshot(path_to_snapshot)
+            return
+
+        self._columns, orders = PropertySnapshot(path_to_snapshot).read()
+        self._version += 1
+        self._orders = {attribute: (self._version, *orders[attribute])
+                        for attribute in ORDERED_ATTRIBUTES}
+
+    def filter_by_location(self, location):
+        """
+        Filters properties by location.
+
+        Args:
+            location (str): The location to filter by.
+
+        Returns:
+            PropertyRows: The filtered properties in the order they were added.
+        """
+        rows = self._get_group_rows("location", self._columns.find_location_codes(location))
+        self._record_rows("filter_by_location", len(rows), len(rows))
+        return PropertyRows(self._columns, rows)
+
+    def filter_by_property_type(self, property_type):
+        """
+        Filters properties by property type.
+
+        Args:
+            property_type (str): The property type to filter by.
+
+        Returns:
+            PropertyRows: The filtered properties in the order they were added.
+        """
+        rows = self._get_group_rows("property_type", self._columns.find_type_codes(property_type))
+        self._record_rows("filter_by_property_type", len(rows), len(rows))
+        return PropertyRows(self._columns, rows)
+
+    def filter_by_price(self, min_price=0, max_price=None):
+        """
+        Filters properties by price range.
+
+        Args:
+            min_price (int): The minimum price.
+            max_price (int): The maximum price or None for no upper bound.
+
+        Returns:
+            PropertyRows: The filtered properties, ordered by price.
+        """
+        rows = self._select_range("price", min_price, max_price)
+        self._record_rows("filter_by_price", len(rows), len(rows))
+        return rows
+
+    def filter_by_square_footage(
+            self,
+            min_square_footage=0,
+            max_square_footage=None):
+        """
+        Filters properties by square footage range.
+
+        Args:
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage or None for no upper bound.
+
+        Returns:
+            PropertyRows: The filtered properties, ordered by square footage.
+        """
+        rows = self._select_range(
+            "square_footage", min_square_footage, max_square_footage)
+        self._record_rows("filter_by_square_footage", len(rows), len(rows))
+        return rows
+
+    def sort_properties(
+            self,
+            sorting_attribute,
+            sorting_type,
+            limit=None,
+            offset=0):
+        """
+        Sorts properties based on the given attribute and sorting type.
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The number of properties needed or None for all of them.
+            offset (int): The number of leading sorted properties to skip.
+
+        Returns:
+            PropertyRows: The sorted properties.
+        """
+        if sorting_attribute != "price":
+            sorting_attribute = "square_footage"
+
+        rows = self._sort_rows(sorting_attribute, sorting_type, limit, offset)
+        self._record_rows("sort_properties", len(rows), len(rows))
+        return PropertyRows(self._columns, rows)
+
+    def _sort_rows(self, sorting_attribute, sorting_type, limit, offset):
+        """
+        Reads a page of all rows from the cached order of an attribute (see sort_properties). (protected method)
+
+        Rows with equal values are listed in the order they were added when sorting in ascending order
+        and in the reverse order when sorting in descending order.
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The number of rows needed or None for all of them.
+            offset (int): The number of leading sorted rows to skip.
+
+        Returns:
+            array: The sorted rows.
+        """
+        order, _ = self._get_order(sorting_attribute)
+        total = len(order)
+        stop = total if limit is None else min(offset + limit, total)
+
+        if sorting_type == "descending":
+            return order[max(total - stop, 0):max(total - offset, 0)][::-1]
+        return order[offset:stop]
+
+    def query(
+            self,
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None,
+            sorting_attribute=None,
+            sorting_type="ascending",
+            limit=None,
+            offset=0):
+        """
+        Finds the properties matching all the given criteria.
+
+        Criteria left as None are ignored. The criteria are checked by scanning the columns, starting from
+        the rows of the narrowest location, property type, price range or square footage range. Without criteria,
+        a page of sorted properties is read from the cached order like in sort_properties.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage") or None to keep
+                the order the properties were added in.
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The maximum number of properties to return or None for no limit.
+            offset (int): The number of leading matching properties to skip.
+
+        Returns:
+            PropertyRows: The matching properties.
+
+        Raises:
+            ValueError: If the sorting attribute is not supported.
+        """
+        if sorting_attribute is not None and sorting_attribute not in SORTING_KEYS:
+            raise ValueError(
+                f"{__name__}: Cannot sort by {sorting_attribute}")
+
+        if sorting_attribute is not None and all(criterion is None for criterion in (
+                location, property_type, min_price, max_price, min_square_footage, max_square_footage)):
+            rows = self._sort_rows(sorting_attribute, sorting_type, limit, offset)
+            self._record_rows("query", len(rows), len(rows))
+            return PropertyRows(self._columns, rows)
+
+        rows, scanned = self._find_rows(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage)
+
+        stop = None if limit is None else offset + limit
+        if sorting_attribute is not None:
+            scanned = max(scanned, len(rows))
+            rows = self._sort_limited(
+                rows,
+                key=self._columns.get_column(sorting_attribute).__getitem__,
+                reverse=sorting_type == "descending",
+                limit=stop)
+        rows = rows[offset:stop]
+        self._record_rows("query", scanned or len(rows), len(rows))
+        return PropertyRows(self._columns, rows)
+
+    def count(
+            self,
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None):
+        """
+        Counts the properties matching all the given criteria.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            int: The number of matching properties.
+        """
+        rows, scanned = self._find_rows(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage)
+        self._record_rows("count", scanned, 0)
+        return len(rows)
+
+    def _find_rows(
+            self,
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage):
+        """
+        Finds the rows matching all the given criteria. (protected method)
+
+        Only the rows of the narrowest criterion are scanned: the cached rows of a location or property type,
+        or the rows inside a price or square footage range (found by a binary search over the cached order of
+        its attribute). The remaining criteria are combined as one mask per criterion over the columns of those rows.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            tuple: The matching rows in the order they were added and the number of rows checked against
+                the criteria (0 without criteria). The rows may be shared with the cache and must not be modified.
+        """
+        groups = [(attribute, codes)
+                  for attribute, codes in (
+                      ("location", None if location is None else self._columns.find_location_codes(location)),
+                      ("property_type",
+                       None if property_type is None else self._columns.find_type_codes(property_type)))
+                  if codes is not None]
+        ranges = [(attribute, min_value, max_value)
+                  for attribute, min_value, max_value in (
+                      ("price", min_price, max_price),
+                      ("square_footage", min_square_footage, max_square_footage))
+                  if min_value is not None or max_value is not None]
+        if not groups and not ranges:
+            return range(len(self._columns)), 0
+
+        candidate_lists = [(self._get_group_rows(*criterion), groups, criterion) for criterion in groups]
+        candidate_lists += [(self._select_range(*criterion).get_rows(), ranges, criterion) for criterion in ranges]
+        candidates, criteria, narrowest = min(candidate_lists, key=lambda candidate_list: len(candidate_list[0]))
+        criteria.remove(narrowest)
+        if criteria is ranges:
+            # The rows of a range are ordered by its attribute
+            candidates = sorted(candidates)
+
+        masks = []
+        for attribute, codes in groups:
+            masks.append(map(codes.__contains__, map(
+                self._columns.get_codes(attribute).__getitem__, candidates)))
+
+        for attribute, min_value, max_value in ranges:
+            low = float("-inf") if min_value is None else min_value
+            high = float("inf") if max_value is None else max_value
+            column = self._columns.get_column(attribute)
+            masks.append(map(lambda value, low=low, high=high: low <= value <= high,
+                             map(column.__getitem__, candidates)))
+
+        if not masks:
+            return candidates, len(candidates)
+        if len(masks) == 1:
+            return list(compress(candidates, masks[0])), len(candidates)
+        return list(compress(candidates, map(all, zip(*masks)))), len(candidates)
+
+    def _get_group_rows(self, attribute, codes):
+        """
+        Gets the rows holding any of the given location or property type codes. (protected method)
+
+        Args:
+            attribute (str): The encoded attribute ("location" or "property_type").
+            codes (set): The codes.
+
+        Returns:
+            array|list: The rows in the order they were added. A single group is shared with the cache
+                and must not be modified.
+        """
+        rows_by_code = self._get_groups(attribute)
+        groups = [rows_by_code[code] for code in codes if code in rows_by_code]
+        if len(groups) == 1:
+            return groups[0]
+        return list(merge(*groups))
+
+    def _get_groups(self, attribute):
+        """
+        Gets the rows of every location or property type code, grouping them again only if the catalog changed
+        since the groups were cached. (protected method)
+
+        Args:
+            attribute (str): The encoded attribute ("location" or "property_type").
+
+        Returns:
+            dict: The rows of every code (see PropertyColumns.get_groups).
+        """
+        version, rows_by_code = self._groups.get(attribute, (None, None))
+        if version != self._version:
+            rows_by_code = self._columns.get_groups(attribute)
+            self._groups[attribute] = (self._version, rows_by_code)
+
+        return rows_by_code
+
+    @staticmethod
+    def _append_to_groups(rows_by_code, codes, new_rows):
+        """
+        Adds rows to the groups of a location or property type. (protected method)
+
+        The groups receiving rows are replaced instead of being changed, since they may be shared with copies.
+
+        Args:
+            rows_by_code (dict): The rows of every code.
+            codes (array): The code of every row.
+            new_rows (range): The rows to add, all after the grouped ones.
+
+        Returns:
+            dict: The new rows of every code.
+        """
+        added = {}
+        for row in new_rows:
+            added.setdefault(codes[row], []).append(row)
+
+        rows_by_code = dict(rows_by_code)
+        for code, rows in added.items():
+            rows_by_code[code] = rows_by_code.get(code, array("l")) + array("l", rows)
+        return rows_by_code
+
+    def _select_range(self, attribute, min_value, max_value):
+        """
+        Selects the rows whose value of a sorted attribute lies in the given (inclusive) range,
+        by a binary search over the cached order of the attribute. (protected method)
+
+        Args:
+            attribute (str): The sorted attribute ("price" or "square_footage").
+            min_value (int|float): The lower bound or None for no lower bound.
+            max_value (int|float): The upper bound or None for no upper bound.
+
+        Returns:
+            PropertyRows: The selected properties, ordered by the attribute.
+        """
+        order, values = self._get_order(attribute)
+        start = 0 if min_value is None else bisect_left(values, min_value)
+        end = len(values) if max_value is None else bisect_right(
+            values, max_value)
+        return PropertyRows(self._columns, order[start:end])
+
+    def _get_order(self, attribute):
+        """
+        Gets the rows ordered by a numeric attribute, sorting them again only if the catalog changed
+        since the order was cached. (protected method)
+
+        Args:
+            attribute (str): The attribute ("price" or "square_footage").
+
+        Returns:
+            tuple: The ordered rows and the attribute values in the same order (both as typed arrays).
+        """
+        version, order, values = self._orders.get(attribute, (None, None, None))
+        if version != self._version:
+            order, values = self._columns.get_order(attribute)
+            self._orders[attribute] = (self._version, order, values)
+
+        return order, values
+
+    @staticmethod
+    def _merge_rows(order, values, column, new_rows):
+        """
+        Adds rows to an order of the rows by a numeric attribute. (protected method)
+
+        Every new row is placed after the rows with equal values with a binary search, and the order is then
+        copied once from the unchanged slices between the new rows.
+
+        Args:
+            order (array|memoryview): The ordered rows.
+            values (array|memoryview): The attribute values in the same order.
+            column (array|memoryview): The column of the attribute.
+            new_rows (range): The rows to add, all after the ordered ones.
+
+        Returns:
+            tuple: The new ordered rows and attribute values (both as typed arrays).
+        """
+        if not new_rows:
+            return order, values
+
+        merged_order = array("l")
+        merged_values = array(ColumnarPropertyManager._get_typecode(values))
+        order = ColumnarPropertyManager._to_array(order)
+        values = ColumnarPropertyManager._to_array(values)
+
+        start = 0
+        for row in sorted(new_rows, key=column.__getitem__):
+            value = column[row]
+            position = bisect_right(values, value, start)
+            merged_order += order[start:position]
+            merged_values += values[start:position]
+            merged_order.append(row)
+            merged_values.append(value)
+            start = position
+
+        merged_order += order[start:]
+        merged_values += values[start:]
+        return merged_order, merged_values
+
+    @staticmethod
+    def _get_typecode(column):
+        """
+        Gets the typecode of a typed array or of a memoryview. (protected method)
+
+        Args:
+            column (array|memoryview): The column.
+
+        Returns:
+            str: The typecode.
+        """
+        return column.format if isinstance(column, memoryview) else column.typecode
+
+    @staticmethod
+    def _to_array(column):
+        """
+        Copies a memoryview into a typed array. Arrays are returned as they are. (protected method)
+
+        Args:
+            column (array|memoryview): The column.
+
+        Returns:
+            array: The column as a typed array.
+        """
+        if not isinstance(column, memoryview):
+            return column
+        copied_column = array(column.format)
+        copied_column.frombytes(column.cast("B"))
+        return copied_column
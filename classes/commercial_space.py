@@ -1,67 +1,112 @@
-"""
-CommercialSpace Class (inherits from Property)
-
-This file defines the CommercialSpace class, which is a subclass of the Property class.
-A CommercialSpace object represents a commercial property with additional attributes such as
-the type of business operating in the space.
-"""
-
-from classes.property import Property
-
-
-class CommercialSpace(Property):
-    def __init__(
-            self,
-            name,
-            property_type,
-            location,
-            price,
-            square_footage,
-            business_type):
-        """
-        Initializes a CommercialSpace object.
-
-        Args:
-            name (str): The name of the property.
-            property_type (str): The type of property (in this case "Commercial Space").
-            location (str): The location of the property.
-            price (int|float): The price of the property.
-            square_footage (int|float): The square footage of the property.
-            business_type (str): The type of business operating in the commercial space.
-        """
-        super().__init__(name, property_type, location, price, square_footage)
-        self.set_business_type(business_type)
-
-    def get_business_type(self):
-        """
-        Gets the type of business operating in the commercial space.
-
-        Returns:
-            str: The business type.
-        """
-        return self._business_type
-
-    def set_business_type(self, value):
-        """
-        Sets the type of business operating in the commercial space.
-
-        Args:
-            value (str): The business type.
-        """
-        self._business_type = value
-
-    def to_dict(self):
-        """
-        Converts the CommercialSpace object to a dictionary.
-
-        Returns:
-            dict: A dictionary representing the CommercialSpace object.
-        """
-        return {
-            "name": self.get_name(),
-            "property_type": self.get_property_type(),
-            "location": self.get_location(),
-            "price": self.get_price(),
-            "square_footage": self.get_square_footage(),
-            "business_type": self.get_business_type(),
-        }
+"""
+CommercialSpace Class (inherits from Property)
+
+This file defines the CommercialSpace class, which is a subclass of the Property class.
+A CommercialSpace object represents a commercial property with additional attributes such as
+the type of business operating in the space.
+"""
+
+from classes.property import Property
+
+
+class CommercialSpace(Property):
+    __slots__ = ("_business_type",)
+
+    _FIELDS = Property._FIELDS + ("business_type",)
+
+    def __init__(
+            self,
+            name,
+            property_type,
+            location,
+            price,
+            square_footage,
+            business_type,
+            property_id=None):
+        """
+        Initializes a CommercialSpace object.
+
+        Args:
+            name (str): The name of the property.
+            property_type (str): The type of property (in this case "Commercial Space").
+            location (str): The location of the property.
+            price (int|float): The price of the property.
+            square_footage (int|float): The square footage of the property.
+            business_type (str): The type of business operating in the commercial space.
+            property_id (str): The ID of the property. A new UUID is generated if it is None.
+        """
+        super().__init__(
+            name,
+            property_type,
+            location,
+            price,
+            square_footage,
+            property_id)
+        self.set_business_type(business_type)
+
+    def get_business_type(self):
+        """
+        Gets the type of business operating in the commercial space.
+
+        Returns:
+            str: The business type.
+        """
+        return self._business_type
+
+    def set_business_type(self, value):
+        """
+        Sets the type of business operating in the commercial space.
+
+        Args:
+            value (str): The business type.
+        """
+        self._business_type = value
+        self._clear_cache()
+
+    def _create_dict(self):
+        """
+        Creates the dictionary representing the CommercialSpace object. (protected method)
+
+        Returns:
+            dict: A dictionary representing the CommercialSpace object.
+        """
+        return {
+            "name": self.get_name(),
+            "property_type": self.get_property_type(),
+            "location": self.get_location(),
+            "price": self.get_price(),
+            "square_footage": self.get_square_footage(),
+            "business_type": self.get_business_type(),
+        }
+
+    @classmethod
+    def _create_batch(cls, property_ids, columns):
+        """
+        Creates commercial spaces from validated columns, assigning the attributes directly. (protected method)
+
+        Args:
+            property_ids (Sequence): The IDs of the commercial spaces.
+            columns (list): The validated columns in the order of the arguments of the constructor.
+
+        Returns:
+            list: The new commercial spaces.
+        """
+        commercial_spaces = []
+        for (property_id,
+                name,
+                property_type,
+                location,
+                price,
+                square_footage,
+                business_type) in zip(property_ids, *columns):
+            commercial_space = cls.__new__(cls)
+            commercial_space._id = property_id
+            commercial_space._name = name
+            commercial_space._property_type = property_type
+            commercial_space._location = location
+            commercial_space._price = price
+            commercial_space._square_footage = square_footage
+            commercial_space._business_type = business_type
+            commercial_space._dict_cache = commercial_space._display_rows_cache = commercial_space._json_cache = None
+            commercial_spaces.append(commercial_space)
+        return commercial_spaces
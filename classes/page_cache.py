@@ -0,0 +1,150 @@
+"""
+PageCache Class
+
+This file defines the PageCache class, an in-process LRU cache for rendered HTML pages.
+Entries are evicted when the cache holds too many entries or too many bytes, and expire after a time to live.
+Every entry has an ETag, so clients can revalidate a cached page without downloading it again.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class PageCache:
+    def __init__(
+            self,
+            max_entries=256,
+            max_bytes=32 * 1024 * 1024,
+            ttl=60,
+            clock=time.monotonic):
+        """
+        Initializes an empty PageCache object.
+
+        Args:
+            max_entries (int): The maximum number of cached pages.
+            max_bytes (int): The maximum total size of the cached pages in bytes.
+            ttl (int|float): The number of seconds a page stays cached.
+            clock (callable): The function returning the current time in seconds.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path, parameter_sources, version, ignored=()):
+        """
+        Builds the key of a page from its path, the request parameters and the catalog version.
+
+        The values are kept exactly as they were sent, since the routes read them as they are: a value with
+        surrounding spaces or an empty value can give a different page (or an error) than a trimmed or missing one.
+        Only the order of the parameter names is made canonical.
+
+        Args:
+            path (str): The path of the page.
+            parameter_sources (Iterable): The parameters of every source (e.g. the query string and the form),
+                each a MultiDict or any object whose lists() method returns the names with their lists of values.
+            version (str): The version of the catalog the page is rendered from.
+            ignored (Iterable): The names of the parameters that do not change the page.
+
+        Returns:
+            tuple: The key.
+        """
+        return (path,
+                tuple(tuple(sorted((name, tuple(values)) for name, values in parameters.lists()
+                                   if name not in ignored))
+                      for parameters in parameter_sources),
+                version)
+
+    def __len__(self):
+        """
+        Gets the number of cached pages, including the expired ones not evicted yet.
+
+        Returns:
+            int: The number of cached pages.
+        """
+        return len(self._entries)
+
+    def get_size(self):
+        """
+        Gets the total size of the cached pages.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return self._size
+
+    def get(self, key):
+        """
+        Gets a cached page and marks it as recently used.
+
+        Args:
+            key (hashable): The key of the page.
+
+        Returns:
+            tuple: The page body and its ETag or None if the page is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            body, etag, expires_at = entry
+            if self._clock() >= expires_at:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return body, etag
+
+    def put(self, key, body):
+        """
+        Caches a page, evicting the least recently used pages if the cache is full.
+
+        Pages larger than the whole cache are not cached.
+
+        Args:
+            key (hashable): The key of the page.
+            body (bytes): The page body.
+
+        Returns:
+            tuple: The page body and its ETag.
+        """
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        if len(body) > self._max_bytes or self._max_entries <= 0:
+            return body, etag
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (body, etag, self._clock() + self._ttl)
+            self._size += len(body)
+
+            while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+        return body, etag
+
+    def clear(self):
+        """
+        Removes all cached pages.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        """
+        Removes a cached page. The lock has to be held by the caller. (protected method)
+
+        Args:
+            key (hashable): The key of the page.
+        """
+        body, _, _ = self._entries.pop(key)
+        self._size -= len(body)
@@ -0,0 +1,164 @@
+"""
+ParallelPropertyReader Class
+
+This file defines the ParallelPropertyReader class, which reads a JSON Lines file with a pool of processes.
+The file is split into shards of whole lines, every worker process parses and validates the records of a shard
+into properties and returns them as the columns of a PropertyColumns object, a compact form that is cheap to send
+back, and the shards are handed out in the order of the file so the catalog is the same as when read by one process.
+The workers are started as fresh interpreters (spawned, not forked), so they inherit none of the threads,
+signal handlers and fork hooks of the application (e.g. the CatalogReloader thread). A spawned worker imports
+the main script again, so a script reading a catalog in parallel must not load it when imported by a worker
+(see app.py).
+"""
+
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from classes.property_columns import PropertyColumns
+
+# The largest number of bytes read by a worker at once. Smaller files are split into
+# SHARDS_PER_WORKER shards per worker (of at least MIN_SHARD_SIZE bytes), so the workers finish together
+SHARD_SIZE = 1 << 22
+MIN_SHARD_SIZE = 1 << 16
+SHARDS_PER_WORKER = 4
+
+
+class ParallelPropertyReader:
+    def __init__(self, path_to_file, create_property, workers=None, progress_callback=None):
+        """
+        Initializes a ParallelPropertyReader object.
+
+        Args:
+            path_to_file (str): The path to the JSON Lines file.
+            create_property (callable): The function creating a property from a record or returning None to skip it
+                (e.g. PropertyManager._create_property). It is sent to the workers, so it must be defined in
+                an importable module rather than in the main script.
+            workers (int): The number of worker processes or None for one per CPU.
+            progress_callback (callable): A function called with the number of records read, the number of bytes
+                read and the size of the file after every shard (see PropertyReader).
+        """
+        self._path_to_file = path_to_file
+        self._create_property = create_property
+        self._workers = workers or os.cpu_count() or 1
+        self._progress_callback = progress_callback
+
+    def __iter__(self):
+        """
+        Reads the shards of the file in the worker processes.
+
+        At most two shards per worker are read ahead of the one being consumed.
+
+        Yields:
+            PropertyColumns: The properties of the next shard, in the order of the file.
+
+        Raises:
+            FileNotFoundError: If the file cannot be found.
+            ValueError: If a line is not valid JSON or a record is not a valid property.
+        """
+        total_bytes = os.path.getsize(self._path_to_file)
+        shard_size = min(SHARD_SIZE, max(total_bytes // (self._workers * SHARDS_PER_WORKER), MIN_SHARD_SIZE))
+        shards = iter(self.find_shards(self._path_to_file, shard_size))
+
+        records_read = 0
+        with ProcessPoolExecutor(self._workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            pending = deque()
+            try:
+                for start, end in islice(shards, 2 * self._workers):
+                    pending.append((end, self._submit(executor, start, end)))
+
+                while pending:
+                    end, future = pending.popleft()
+                    columns, records = future.result()
+                    for start, next_end in islice(shards, 1):
+                        pending.append((next_end, self._submit(executor, start, next_end)))
+
+                    records_read += records
+                    yield PropertyColumns.from_columns(columns)
+                    if self._progress_callback is not None and end < total_bytes:
+                        self._progress_callback(records_read, end, total_bytes)
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+        if self._progress_callback is not None:
+            self._progress_callback(records_read, total_bytes, total_bytes)
+
+    def _submit(self, executor, start, end):
+        """
+        Submits the reading of a shard to the pool, which starts the worker processes it still lacks.
+        (protected method)
+
+        Args:
+            executor (ProcessPoolExecutor): The pool.
+            start (int): The offset of the first byte of the shard.
+            end (int): The offset after the last byte of the shard.
+
+        Returns:
+            Future: The columns and the number of records of the shard.
+        """
+        return executor.submit(self._read_shard, self._path_to_file, start, end, self._create_property)
+
+    @staticmethod
+    def find_shards(path_to_file, shard_size):
+        """
+        Splits a file into shards of whole lines.
+
+        Args:
+            path_to_file (str): The path to the file.
+            shard_size (int): The number of bytes after which a shard ends at the next line break.
+
+        Returns:
+            list: The start and end byte offsets of every shard, in order.
+        """
+        total_bytes = os.path.getsize(path_to_file)
+        boundaries = [0]
+        with open(path_to_file, "rb") as input_file:
+            while boundaries[-1] < total_bytes:
+                input_file.seek(boundaries[-1] + shard_size)
+                input_file.readline()
+                boundaries.append(min(input_file.tell(), total_bytes))
+
+        return list(zip(boundaries, boundaries[1:]))
+
+    @staticmethod
+    def _read_shard(path_to_file, start, end, create_property):
+        """
+        Parses the records of a shard into properties, in a worker process. Empty lines are skipped.
+        (protected method)
+
+        Args:
+            path_to_file (str): The path to the file.
+            start (int): The offset of the first byte of the shard.
+            end (int): The offset after the last byte of the shard.
+            create_property (callable): The function creating a property from a record.
+
+        Returns:
+            tuple: The columns of the created properties (see PropertyColumns.to_columns) and the number of records.
+
+        Raises:
+            ValueError: If a line is not valid JSON or a record is not a valid property.
+        """
+        with open(path_to_file, "rb") as input_file:
+            input_file.seek(start)
+            data = input_file.read(end - start)
+
+        columns = PropertyColumns()
+        records = 0
+        offset = start
+        for line in data.split(b"\n"):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(
+                        f"{__name__}: Invalid JSON at byte {offset}: {e}") from e
+                records += 1
+                property_to_add = create_property(record)
+                if property_to_add is not None:
+                    columns.append(property_to_add)
+            offset += len(line) + 1
+
+        return columns.to_columns(), records
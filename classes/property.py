@@ -1,178 +1,359 @@
-"""
-Property Class
-
-This file defines the abstract Property class, which serves as the base class for
-different types of properties (House, Apartment, Commercial Space).
-"""
-
-import uuid
-from abc import ABC, abstractmethod
-
-
-class Property(ABC):
-    def __init__(self, name, property_type, location, price, square_footage):
-        """
-        Initializes a Property object.
-
-        Args:
-            name (str): The name of the property.
-            property_type (str): The type of property (e.g., "House", "Apartment", "Commercial Space").
-            location (str): The location of the property.
-            price (int|float): The price of the property.
-            square_footage (int|float): The square footage of the property.
-        """
-        self.set_name(name)
-        self.set_property_type(property_type)
-        self.set_location(location)
-        self.set_price(price)
-        self.set_square_footage(square_footage)
-        self._id = self.generate_uuid()
-
-    def get_id(self):
-        """
-        Gets the ID of the property.
-
-        Returns:
-            str: The ID of the property.
-        """
-        return self._id
-
-    def get_name(self):
-        """
-        Gets the name of the property.
-
-        Returns:
-            str: The name of the property.
-        """
-        return self._name
-
-    def set_name(self, name):
-        """
-        Sets the name of the property.
-
-        Args:
-            name (str): The name of the property.
-        """
-        self._name = name
-
-    def get_property_type(self):
-        """
-        Gets the type of the property.
-
-        Returns:
-            str: The type of the property.
-        """
-        return self._property_type
-
-    def set_property_type(self, value):
-        """
-        Set the type of the property.
-
-        Args:
-            value (str): The type of the property.
-
-        Raises:
-            ValueError: If the provided property type is not valid.
-        """
-        if value.title() not in ["House", "Apartment", "Commercial Space"]:
-            raise ValueError(
-                f"{__name__}: Property Type must be House, Apartment or Commercial Space")
-
-        self._property_type = value.title()
-
-    def get_location(self):
-        """
-        Gets the location of the property.
-
-        Returns:
-            str: The location of the property.
-
-        """
-        return self._location
-
-    def set_location(self, value):
-        """
-        Sets the location of the property.
-
-        Args:
-            value (str): The location of the property.
-        """
-        self._location = value
-
-    def get_price(self):
-        """
-        Gets the price of the property.
-
-        Returns:
-            int|float: The price of the property.
-        """
-        return self._price
-
-    def set_price(self, value):
-        """
-        Sets the price of the property.
-
-        Args:
-            value (int|float): The price of the property.
-
-        Raises:
-            ValueError: If the provided price is not a valid number.
-        """
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"{__name__}: Price must be either int or float")
-
-        if value < 0:
-            self._price = 0
-        else:
-            self._price = value
-
-    def get_square_footage(self):
-        """
-        Gets the square footage of the property.
-
-        Returns:
-            int|float: The square footage of the property.
-        """
-        return self._square_footage
-
-    def set_square_footage(self, value):
-        """
-        Sets the square footage of the property.
-
-        Args:
-            value (int|float): The square footage of the property.
-
-        Raises:
-            ValueError: If the provided square footage is not a valid number.
-        """
-        if not isinstance(value, (int, float)):
-            raise ValueError(
-                f"{__name__}: Square footage must be either int or float")
-
-        if value < 0:
-            self._square_footage = 0
-        else:
-            self._square_footage = value
-
-    @staticmethod
-    def generate_uuid():
-        """
-        Generates a UUID (Universally Unique Identifier).
-
-        Returns:
-            str: A string representing the generated UUID.
-        """
-        return str(uuid.uuid4())
-
-    @abstractmethod
-    def to_dict(self):
-        """
-        Converts the Property object to a dictionary.
-
-        This method must be implemented by concrete subclasses.
-
-        Returns:
-            dict: A dictionary representing the Property object.
-        """
-
-        pass
+"""
+Property Class
+
+This file defines the abstract Property class, which serves as the base class for
+different types of properties (House, Apartment, Commercial Space).
+"""
+
+import json
+import uuid
+from abc import ABC, abstractmethod
+from classes.property_serializer import PropertySerializer
+
+# Namespace of the IDs derived from the content of property records
+PROPERTY_ID_NAMESPACE = uuid.UUID("0b6c3a52-4f1e-4a8e-9d5c-7f2e61a9c3d4")
+
+# The valid property types
+PROPERTY_TYPES = ("House", "Apartment", "Commercial Space")
+
+# The typecodes of the arrays (and memoryviews) known to hold only ints or only ints and floats
+INT_TYPECODES = frozenset("bBhHiIlLqQ")
+NUMBER_TYPECODES = INT_TYPECODES | frozenset("fd")
+
+
+class Property(ABC):
+    __slots__ = ("_id", "_name", "_property_type", "_location", "_price", "_square_footage",
+                 "_dict_cache", "_display_rows_cache", "_json_cache")
+
+    # The arguments of the constructor (except the ID), in order
+    _FIELDS = ("name", "property_type", "location", "price", "square_footage")
+
+    # The numeric arguments with the types their values must have. Negative values are stored as 0
+    _NUMBER_FIELDS = {"price": (int, float), "square_footage": (int, float)}
+
+    def __init__(
+            self,
+            name,
+            property_type,
+            location,
+            price,
+            square_footage,
+            property_id=None):
+        """
+        Initializes a Property object.
+
+        Args:
+            name (str): The name of the property.
+            property_type (str): The type of property (e.g., "House", "Apartment", "Commercial Space").
+            location (str): The location of the property.
+            price (int|float): The price of the property.
+            square_footage (int|float): The square footage of the property.
+            property_id (str): The ID of the property. A new UUID is generated if it is None.
+        """
+        self.set_name(name)
+        self.set_property_type(property_type)
+        self.set_location(location)
+        self.set_price(price)
+        self.set_square_footage(square_footage)
+        self._id = self.generate_uuid() if property_id is None else property_id
+
+    @classmethod
+    def from_columns(cls, property_ids, columns):
+        """
+        Creates many properties of this class from columns of values without calling the setters.
+
+        Every column is validated once as a whole with the rules of the setters (e.g. all prices are numbers,
+        which arrays guarantee by their typecode), so creating a large batch from a trusted source such as
+        a snapshot is several times faster than calling the constructor for every property.
+
+        Args:
+            property_ids (Sequence): The IDs of the properties.
+            columns (dict): A sequence of values for every argument of the constructor except the ID,
+                aligned with the IDs.
+
+        Returns:
+            list: The new properties, in the order of the IDs.
+
+        Raises:
+            ValueError: If a column is missing, has a different length or holds a value the setter rejects.
+        """
+        return cls._create_batch(property_ids, cls._validate_columns(len(property_ids), columns))
+
+    def get_id(self):
+        """
+        Gets the ID of the property.
+
+        Returns:
+            str: The ID of the property.
+        """
+        return self._id
+
+    def get_name(self):
+        """
+        Gets the name of the property.
+
+        Returns:
+            str: The name of the property.
+        """
+        return self._name
+
+    def set_name(self, name):
+        """
+        Sets the name of the property.
+
+        Args:
+            name (str): The name of the property.
+        """
+        self._name = name
+        self._clear_cache()
+
+    def get_property_type(self):
+        """
+        Gets the type of the property.
+
+        Returns:
+            str: The type of the property.
+        """
+        return self._property_type
+
+    def set_property_type(self, value):
+        """
+        Set the type of the property.
+
+        Args:
+            value (str): The type of the property.
+
+        Raises:
+            ValueError: If the provided property type is not valid.
+        """
+        if value.title() not in PROPERTY_TYPES:
+            raise ValueError(
+                f"{__name__}: Property Type must be House, Apartment or Commercial Space")
+
+        self._property_type = value.title()
+        self._clear_cache()
+
+    def get_location(self):
+        """
+        Gets the location of the property.
+
+        Returns:
+            str: The location of the property.
+
+        """
+        return self._location
+
+    def set_location(self, value):
+        """
+        Sets the location of the property.
+
+        Args:
+            value (str): The location of the property.
+        """
+        self._location = value
+        self._clear_cache()
+
+    def get_price(self):
+        """
+        Gets the price of the property.
+
+        Returns:
+            int|float: The price of the property.
+        """
+        return self._price
+
+    def set_price(self, value):
+        """
+        Sets the price of the property.
+
+        Args:
+            value (int|float): The price of the property.
+
+        Raises:
+            ValueError: If the provided price is not a valid number.
+        """
+        if not isinstance(value, (int, float)):
+            raise ValueError(f"{__name__}: Price must be either int or float")
+
+        if value < 0:
+            self._price = 0
+        else:
+            self._price = value
+        self._clear_cache()
+
+    def get_square_footage(self):
+        """
+        Gets the square footage of the property.
+
+        Returns:
+            int|float: The square footage of the property.
+        """
+        return self._square_footage
+
+    def set_square_footage(self, value):
+        """
+        Sets the square footage of the property.
+
+        Args:
+            value (int|float): The square footage of the property.
+
+        Raises:
+            ValueError: If the provided square footage is not a valid number.
+        """
+        if not isinstance(value, (int, float)):
+            raise ValueError(
+                f"{__name__}: Square footage must be either int or float")
+
+        if value < 0:
+            self._square_footage = 0
+        else:
+            self._square_footage = value
+        self._clear_cache()
+
+    @staticmethod
+    def generate_uuid(record=None):
+        """
+        Generates a UUID (Universally Unique Identifier).
+
+        Args:
+            record (dict): The record the property is created from. If given, the UUID is derived from its
+                content, so the same record always gets the same UUID. Otherwise a random UUID is generated.
+
+        Returns:
+            str: A string representing the generated UUID.
+        """
+        if record is None:
+            return str(uuid.uuid4())
+
+        content = json.dumps(
+            record,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False)
+        return str(uuid.uuid5(PROPERTY_ID_NAMESPACE, content))
+
+    def to_dict(self):
+        """
+        Converts the Property object to a dictionary.
+
+        The dictionary is created once and reused until one of the setters changes the property,
+        so it must not be modified.
+
+        Returns:
+            dict: A dictionary representing the Property object.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._create_dict()
+        return self._dict_cache
+
+    def get_display_rows(self):
+        """
+        Gets the labelled values shown for the property in a listing (every attribute except the name).
+
+        The rows are created once and reused until one of the setters changes the property.
+
+        Returns:
+            tuple: Pairs of a label (e.g. "Square Footage") and a value.
+        """
+        if self._display_rows_cache is None:
+            self._display_rows_cache = tuple(
+                (key.replace("_", " ").title(), value)
+                for key, value in self.to_dict().items() if key != "name")
+        return self._display_rows_cache
+
+    def to_json(self):
+        """
+        Converts the Property object to a JSON object that also holds its ID.
+
+        The JSON is encoded once and reused until one of the setters changes the property.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON object.
+        """
+        if self._json_cache is None:
+            self._json_cache = PropertySerializer.dumps(
+                {"id": self._id, **self.to_dict()})
+        return self._json_cache
+
+    @classmethod
+    def _validate_columns(cls, size, columns):
+        """
+        Validates columns of values passed to from_columns with the rules of the setters. (protected method)
+
+        Property types are checked and title-cased once per distinct value and negative numbers are replaced
+        with 0, copying only the columns that need it.
+
+        Args:
+            size (int): The number of properties.
+            columns (dict): The columns by the name of the argument of the constructor.
+
+        Returns:
+            list: The validated columns in the order of the arguments of the constructor.
+
+        Raises:
+            ValueError: If a column is missing, has a different length or holds a value the setter rejects.
+        """
+        validated_columns = []
+        for field in cls._FIELDS:
+            column = columns.get(field)
+            if column is None or len(column) != size:
+                raise ValueError(f"{__name__}: Column {field} must hold {size} values")
+
+            if field == "property_type":
+                titles = {value: value.title() for value in set(column)}
+                if not set(titles.values()) <= set(PROPERTY_TYPES):
+                    raise ValueError(
+                        f"{__name__}: Property Type must be House, Apartment or Commercial Space")
+                if any(value != title for value, title in titles.items()):
+                    column = [titles[value] for value in column]
+
+            elif field in cls._NUMBER_FIELDS:
+                valid_types = cls._NUMBER_FIELDS[field]
+                typecode = getattr(column, "typecode", getattr(column, "format", None))
+                if typecode not in (NUMBER_TYPECODES if float in valid_types else INT_TYPECODES) and not all(
+                        issubclass(value_type, valid_types) for value_type in set(map(type, column))):
+                    raise ValueError(f"{__name__}: Column {field} must hold only values of {valid_types}")
+                if size and min(column) < 0:
+                    column = [value if value >= 0 else 0 for value in column]
+
+            validated_columns.append(column)
+        return validated_columns
+
+    def _clear_cache(self):
+        """
+        Drops the cached dictionary, display rows and JSON after the property has changed. (protected method)
+        """
+        self._dict_cache = None
+        self._display_rows_cache = None
+        self._json_cache = None
+
+    @abstractmethod
+    def _create_dict(self):
+        """
+        Creates the dictionary representing the Property object. (protected method)
+
+        This method must be implemented by concrete subclasses.
+
+        Returns:
+            dict: A dictionary representing the Property object.
+        """
+
+        pass
+
+    @classmethod
+    @abstractmethod
+    def _create_batch(cls, property_ids, columns):
+        """
+        Creates properties from validated columns, assigning the attributes directly. (protected method)
+
+        This method must be implemented by concrete subclasses.
+
+        Args:
+            property_ids (Sequence): The IDs of the properties.
+            columns (list): The validated columns in the order of the arguments of the constructor.
+
+        Returns:
+            list: The new properties.
+        """
+
+        pass
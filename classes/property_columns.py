@@ -0,0 +1,562 @@
+"""
+PropertyColumns Class
+
+This file defines the PropertyColumns class, which stores properties column by column instead of as objects.
+Numeric attributes are held in typed arrays and repeated strings (locations, property and business types)
+are dictionary-encoded as integer codes, so a catalog takes a fraction of the memory of Property objects
+and can be scanned without calling any getters. Property objects are only created for the rows that are needed.
+The columns can also be read-only memoryviews and StringColumn objects (e.g. of a memory-mapped snapshot),
+which are copied into arrays and lists only when rows are appended or deleted.
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import compress, groupby
+from classes.property import PROPERTY_TYPES
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+from classes.string_column import StringColumn
+
+HOUSE, APARTMENT, COMMERCIAL_SPACE = range(len(PROPERTY_TYPES))
+
+# Bit flags remembering which numbers were ints, so they are not turned into floats by the float columns
+PRICE_IS_INT = 1
+SQUARE_FOOTAGE_IS_INT = 2
+
+# Value stored in the integer columns of the rows that do not have the attribute
+MISSING = -1
+
+# The columns of a PropertyColumns object, with the typecodes of the numeric ones (None for lists of strings)
+COLUMN_TYPECODES = {
+    "ids": None,
+    "names": None,
+    "type_codes": "b",
+    "location_codes": "l",
+    "locations": None,
+    "prices": "d",
+    "square_footages": "d",
+    "number_flags": "B",
+    "num_of_bedrooms": "l",
+    "num_of_bathrooms": "l",
+    "floors": "l",
+    "business_type_codes": "l",
+    "business_types": None
+}
+
+# The columns holding the values of the dictionary-encoded columns rather than one value per row
+DICTIONARIES = ("locations", "business_types")
+
+# Deleting up to this many rows shifts the columns in place, more rows are deleted by compacting the columns
+IN_PLACE_MAX_ROWS = 16
+
+
+class PropertyColumns:
+    def __init__(self):
+        """
+        Initializes an empty PropertyColumns object.
+        """
+        self._ids = []
+        self._rows_by_id = {}
+        self._id_order = None
+        self._names = []
+        self._type_codes = array("b")
+        self._location_codes = array("l")
+        self._locations = []
+        self._location_codes_by_value = {}
+        self._prices = array("d")
+        self._square_footages = array("d")
+        self._number_flags = array("B")
+        self._num_of_bedrooms = array("l")
+        self._num_of_bathrooms = array("l")
+        self._floors = array("l")
+        self._business_type_codes = array("l")
+        self._business_types = []
+        self._business_type_codes_by_value = {}
+
+    @classmethod
+    def from_columns(cls, columns, id_order=None):
+        """
+        Creates a PropertyColumns object holding the given columns, without copying them.
+
+        Args:
+            columns (dict): The columns returned by to_columns. Numeric columns can be arrays or memoryviews
+                of the same typecodes and string columns can be lists or StringColumn objects.
+            id_order (array|memoryview): The rows ordered by ID (see get_id_order) or None to find rows
+                with a dictionary built on first use.
+
+        Returns:
+            PropertyColumns: The new object.
+        """
+        property_columns = cls()
+        for name in COLUMN_TYPECODES:
+            setattr(property_columns, f"_{name}", columns[name])
+
+        property_columns._rows_by_id = None
+        property_columns._id_order = id_order
+        property_columns._location_codes_by_value = {
+            value: code for code, value in enumerate(property_columns._locations)}
+        property_columns._business_type_codes_by_value = {
+            value: code for code, value in enumerate(property_columns._business_types)}
+        return property_columns
+
+    def copy(self):
+        """
+        Creates a copy of the columns that can be changed without affecting this one.
+
+        Read-only memoryviews and StringColumn objects are shared, since they are copied before any change anyway.
+
+        Returns:
+            PropertyColumns: The copy.
+        """
+        property_columns = PropertyColumns.from_columns({
+            name: column if isinstance(column, (memoryview, StringColumn)) else column[:]
+            for name, column in self.to_columns().items()}, id_order=self._id_order)
+        if self._rows_by_id is not None:
+            property_columns._rows_by_id = dict(self._rows_by_id)
+        return property_columns
+
+    def to_columns(self):
+        """
+        Gets all the columns, e.g. to save them to a snapshot.
+
+        Returns:
+            dict: The columns, named like the keys of COLUMN_TYPECODES. Numeric columns are typed arrays
+                (or memoryviews) and the other ones are lists of strings.
+        """
+        return {name: getattr(self, f"_{name}") for name in COLUMN_TYPECODES}
+
+    def __len__(self):
+        """
+        Gets the number of stored properties.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self._ids)
+
+    def get_column(self, attribute):
+        """
+        Gets the typed array holding a numeric attribute of every row.
+
+        Args:
+            attribute (str): "price", "square_footage", "num_of_bedrooms", "num_of_bathrooms" or "floors"
+                (the floor number of apartments and the number of floors of houses).
+                Rows without the attribute hold -1.
+
+        Returns:
+            array: The column.
+
+        Raises:
+            ValueError: If the attribute is not stored in a numeric column.
+        """
+        columns = {
+            "price": self._prices,
+            "square_footage": self._square_footages,
+            "num_of_bedrooms": self._num_of_bedrooms,
+            "num_of_bathrooms": self._num_of_bathrooms,
+            "floors": self._floors
+        }
+        if attribute not in columns:
+            raise ValueError(
+                f"{__name__}: There is no numeric column called {attribute}")
+
+        return columns[attribute]
+
+    def get_location_codes(self):
+        """
+        Gets the dictionary-encoded location of every row.
+
+        Returns:
+            array: The location codes.
+        """
+        return self._location_codes
+
+    def get_type_codes(self):
+        """
+        Gets the property type of every row as an index into PROPERTY_TYPES.
+
+        Returns:
+            array: The property type codes.
+        """
+        return self._type_codes
+
+    def find_location_codes(self, location):
+        """
+        Finds the codes of all stored spellings of a location, ignoring case.
+
+        Args:
+            location (str): The location.
+
+        Returns:
+            set: The matching location codes.
+        """
+        folded_location = location.casefold()
+        return {code for code, value in enumerate(self._locations)
+                if value.casefold() == folded_location}
+
+    @staticmethod
+    def find_type_codes(property_type):
+        """
+        Finds the code of a property type, ignoring case.
+
+        Args:
+            property_type (str): The property type.
+
+        Returns:
+            set: The matching property type codes (empty if the type is not supported).
+        """
+        folded_type = property_type.casefold()
+        return {code for code, value in enumerate(PROPERTY_TYPES)
+                if value.casefold() == folded_type}
+
+    def find_row(self, property_id):
+        """
+        Finds the row of a property by its ID.
+
+        Args:
+            property_id (str): The ID of the property.
+
+        Returns:
+            int: The row or None if there is no such property.
+        """
+        if self._id_order is not None:
+            position = bisect_left(self._id_order, property_id, key=self._ids.__getitem__)
+            if position < len(self._id_order) and self._ids[self._id_order[position]] == property_id:
+                return self._id_order[position]
+            return None
+
+        if self._rows_by_id is None:
+            self._rows_by_id = {property_id: row for row, property_id in enumerate(self._ids)}
+        return self._rows_by_id.get(property_id)
+
+    def get_order(self, attribute):
+        """
+        Sorts the rows by a numeric attribute. Rows with equal values keep the order they were added in.
+
+        Args:
+            attribute (str): The attribute (see get_column).
+
+        Returns:
+            tuple: The ordered rows and the attribute values in the same order (both as typed arrays).
+        """
+        column = self.get_column(attribute)
+        order = array("l", sorted(range(len(column)), key=column.__getitem__))
+        return order, array(column.format if isinstance(column, memoryview) else column.typecode,
+                            map(column.__getitem__, order))
+
+    def get_codes(self, attribute):
+        """
+        Gets the location or property type code of every row.
+
+        Args:
+            attribute (str): The encoded attribute ("location" or "property_type").
+
+        Returns:
+            array: The codes (see get_location_codes and get_type_codes).
+
+        Raises:
+            ValueError: If the attribute is not encoded as codes.
+        """
+        if attribute == "location":
+            return self._location_codes
+        if attribute == "property_type":
+            return self._type_codes
+        raise ValueError(
+            f"{__name__}: There is no code column called {attribute}")
+
+    def get_groups(self, attribute):
+        """
+        Groups the rows by their location or property type code.
+
+        Args:
+            attribute (str): The encoded attribute ("location" or "property_type").
+
+        Returns:
+            dict: The rows holding every code in the order they were added (as typed arrays), indexed by the code.
+
+        Raises:
+            ValueError: If the attribute is not encoded as codes.
+        """
+        codes = self.get_codes(attribute)
+        # The sort is stable, so the rows of every code stay in ascending order
+        order = sorted(range(len(codes)), key=codes.__getitem__)
+        return {code: array("l", rows) for code, rows in groupby(order, key=codes.__getitem__)}
+
+    def get_id_order(self):
+        """
+        Gets the rows ordered by ID, which find_row searches with a binary search instead of a dictionary.
+
+        Returns:
+            array: The ordered rows (or the memoryview they were loaded as).
+        """
+        if self._id_order is None:
+            return array("l", sorted(range(len(self._ids)), key=self._ids.__getitem__))
+        return self._id_order
+
+    def append(self, property_to_add):
+        """
+        Appends a property as a new row.
+
+        Args:
+            property_to_add (Property): The property to store.
+
+        Raises:
+            ValueError: If the property type is not supported.
+        """
+        if isinstance(property_to_add, Apartment):
+            type_code = APARTMENT
+            floors = property_to_add.get_floor_number()
+        elif isinstance(property_to_add, House):
+            type_code = HOUSE
+            floors = property_to_add.get_num_of_floors()
+        elif isinstance(property_to_add, CommercialSpace):
+            type_code = COMMERCIAL_SPACE
+            floors = MISSING
+        else:
+            raise ValueError(
+                f"{__name__}: Cannot store {type(property_to_add).__name__}")
+
+        self._make_writable()
+        self._id_order = None
+        if self._rows_by_id is not None:
+            self._rows_by_id[property_to_add.get_id()] = len(self._ids)
+        self._ids.append(property_to_add.get_id())
+        self._names.append(property_to_add.get_name())
+        self._type_codes.append(type_code)
+        self._location_codes.append(self._encode(
+            property_to_add.get_location(), self._locations, self._location_codes_by_value))
+
+        price = property_to_add.get_price()
+        square_footage = property_to_add.get_square_footage()
+        self._prices.append(price)
+        self._square_footages.append(square_footage)
+        self._number_flags.append(
+            (PRICE_IS_INT if isinstance(price, int) else 0)
+            | (SQUARE_FOOTAGE_IS_INT if isinstance(square_footage, int) else 0))
+
+        if type_code == COMMERCIAL_SPACE:
+            self._num_of_bedrooms.append(MISSING)
+            self._num_of_bathrooms.append(MISSING)
+            self._business_type_codes.append(self._encode(
+                property_to_add.get_business_type(), self._business_types, self._business_type_codes_by_value))
+        else:
+            self._num_of_bedrooms.append(property_to_add.get_num_of_bedrooms())
+            self._num_of_bathrooms.append(
+                property_to_add.get_num_of_bathrooms())
+            self._business_type_codes.append(MISSING)
+        self._floors.append(floors)
+
+    def extend(self, other):
+        """
+        Appends all rows of another PropertyColumns object (e.g. a shard read by another process)
+        without creating Property objects. Its locations and business types are encoded with the codes of this one.
+
+        Args:
+            other (PropertyColumns): The columns to append.
+        """
+        self._make_writable()
+        self._id_order = None
+        if self._rows_by_id is not None:
+            self._rows_by_id.update(
+                (property_id, row) for row, property_id in enumerate(other._ids, start=len(self._ids)))
+
+        location_codes = [self._encode(value, self._locations, self._location_codes_by_value)
+                          for value in other._locations]
+        business_type_codes = [self._encode(value, self._business_types, self._business_type_codes_by_value)
+                               for value in other._business_types]
+
+        self._ids.extend(other._ids)
+        self._names.extend(other._names)
+        self._type_codes.extend(other._type_codes)
+        self._location_codes.extend(map(location_codes.__getitem__, other._location_codes))
+        self._prices.extend(other._prices)
+        self._square_footages.extend(other._square_footages)
+        self._number_flags.extend(other._number_flags)
+        self._num_of_bedrooms.extend(other._num_of_bedrooms)
+        self._num_of_bathrooms.extend(other._num_of_bathrooms)
+        self._floors.extend(other._floors)
+        self._business_type_codes.extend(
+            MISSING if code == MISSING else business_type_codes[code] for code in other._business_type_codes)
+
+    def delete_rows(self, rows):
+        """
+        Deletes rows, moving the following rows up. Up to IN_PLACE_MAX_ROWS rows are deleted from the columns
+        in place, more are deleted by compacting every column in a single pass.
+
+        Values of the location and business type dictionaries are kept even if no row uses them anymore.
+
+        Args:
+            rows (Iterable): The rows to delete.
+
+        Returns:
+            bytearray: One byte per row before the deletion, 1 for the kept rows and 0 for the deleted ones.
+        """
+        rows = set(rows)
+        kept = bytearray(b"\x01") * len(self._ids)
+        for row in rows:
+            kept[row] = 0
+
+        if len(rows) <= IN_PLACE_MAX_ROWS:
+            self._make_writable()
+        for name, typecode in COLUMN_TYPECODES.items():
+            if name in DICTIONARIES:
+                continue
+            column = getattr(self, f"_{name}")
+            if len(rows) <= IN_PLACE_MAX_ROWS:
+                for row in sorted(rows, reverse=True):
+                    del column[row]
+            else:
+                setattr(self, f"_{name}", list(compress(column, kept)) if typecode is None
+                        else array(typecode, compress(column, kept)))
+        self._rows_by_id = None
+        self._id_order = None
+        return kept
+
+    def materialize(self, row):
+        """
+        Creates the Property object stored in a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            Property: A new Apartment, House or CommercialSpace object with the stored ID.
+        """
+        type_code = self._type_codes[row]
+        flags = self._number_flags[row]
+        price = self._prices[row]
+        square_footage = self._square_footages[row]
+
+        common_arguments = {
+            "name": self._names[row],
+            "property_type": PROPERTY_TYPES[type_code],
+            "location": self._locations[self._location_codes[row]],
+            "price": int(price) if flags & PRICE_IS_INT else price,
+            "square_footage": int(square_footage) if flags & SQUARE_FOOTAGE_IS_INT else square_footage,
+            "property_id": self._ids[row]
+        }
+
+        if type_code == APARTMENT:
+            return Apartment(
+                num_of_bedrooms=self._num_of_bedrooms[row],
+                num_of_bathrooms=self._num_of_bathrooms[row],
+                floor_number=self._floors[row],
+                **common_arguments)
+        if type_code == HOUSE:
+            return House(
+                num_of_bedrooms=self._num_of_bedrooms[row],
+                num_of_bathrooms=self._num_of_bathrooms[row],
+                num_of_floors=self._floors[row],
+                **common_arguments)
+        return CommercialSpace(
+            business_type=self._business_types[self._business_type_codes[row]],
+            **common_arguments)
+
+    def materialize_rows(self, rows=None):
+        """
+        Creates the Property objects stored in many rows at once.
+
+        The values were validated when they were added, so the objects are created with Property.from_columns,
+        which checks every column once instead of calling the setters for every property.
+
+        Args:
+            rows (Sequence): The rows or None for all rows.
+
+        Returns:
+            list: New Apartment, House and CommercialSpace objects with the stored IDs, in the order of the rows.
+        """
+        if rows is None:
+            rows = range(len(self))
+
+        rows_by_type = ([], [], [])
+        positions_by_type = ([], [], [])
+        for position, row in enumerate(rows):
+            type_code = self._type_codes[row]
+            rows_by_type[type_code].append(row)
+            positions_by_type[type_code].append(position)
+
+        properties = [None] * len(rows)
+        for type_code, property_class, extra_columns in (
+                (APARTMENT, Apartment, {"num_of_bedrooms": self._num_of_bedrooms,
+                                        "num_of_bathrooms": self._num_of_bathrooms,
+                                        "floor_number": self._floors}),
+                (HOUSE, House, {"num_of_bedrooms": self._num_of_bedrooms,
+                                "num_of_bathrooms": self._num_of_bathrooms,
+                                "num_of_floors": self._floors}),
+                (COMMERCIAL_SPACE, CommercialSpace, {})):
+            type_rows = rows_by_type[type_code]
+            if not type_rows:
+                continue
+
+            flags = [self._number_flags[row] for row in type_rows]
+            columns = {
+                "name": self._take(self._names, type_rows),
+                "property_type": [PROPERTY_TYPES[type_code]] * len(type_rows),
+                "location": [self._locations[self._location_codes[row]] for row in type_rows],
+                "price": [int(price) if flag & PRICE_IS_INT else price
+                          for price, flag in zip(map(self._prices.__getitem__, type_rows), flags)],
+                "square_footage": [int(square_footage) if flag & SQUARE_FOOTAGE_IS_INT else square_footage
+                                   for square_footage, flag in zip(
+                                       map(self._square_footages.__getitem__, type_rows), flags)]
+            }
+            for name, column in extra_columns.items():
+                columns[name] = array("l", map(column.__getitem__, type_rows))
+            if type_code == COMMERCIAL_SPACE:
+                columns["business_type"] = [self._business_types[self._business_type_codes[row]]
+                                            for row in type_rows]
+
+            created = property_class.from_columns(self._take(self._ids, type_rows), columns)
+            for position, created_property in zip(positions_by_type[type_code], created):
+                properties[position] = created_property
+        return properties
+
+    @staticmethod
+    def _take(column, rows):
+        """
+        Gets the strings of a string column in many rows. (protected method)
+
+        Args:
+            column (list|StringColumn): The column.
+            rows (Sequence): The rows.
+
+        Returns:
+            list: The strings.
+        """
+        if isinstance(column, StringColumn):
+            return column.take(rows)
+        return [column[row] for row in rows]
+
+    def _make_writable(self):
+        """
+        Copies the columns that are read-only memoryviews or StringColumn objects into arrays and lists.
+        (protected method)
+        """
+        for name, typecode in COLUMN_TYPECODES.items():
+            column = getattr(self, f"_{name}")
+            if isinstance(column, StringColumn):
+                setattr(self, f"_{name}", list(column))
+            elif isinstance(column, memoryview):
+                writable_column = array(typecode)
+                writable_column.frombytes(column.cast("B"))
+                setattr(self, f"_{name}", writable_column)
+
+    @staticmethod
+    def _encode(value, values, codes_by_value):
+        """
+        Gets the dictionary code of a value, adding the value to the dictionary if needed. (protected method)
+
+        Args:
+            value (str): The value to encode.
+            values (list): The dictionary values, indexed by code.
+            codes_by_value (dict): The codes, indexed by value.
+
+        Returns:
+            int: The code of the value.
+        """
+        code = codes_by_value.get(value)
+        if code is None:
+            code = len(values)
+            values.append(value)
+            codes_by_value[value] = code
+        return code
@@ -0,0 +1,188 @@
+"""
+PropertyExporter Class
+
+This file defines the PropertyExporter class, which saves properties to files as JSON, JSON Lines or CSV.
+The records are written one at a time, so exporting a large filter result never holds all of them in memory.
+Every export goes to a new file, which is written under a temporary name and renamed when it is complete,
+so readers never see a partially written export. The file is given the permissions of a file created with open
+(0o666 masked by the umask) rather than the private ones of the temporary file.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import time
+import uuid
+from classes.property_serializer import PROPERTY_FIELDS
+
+
+EXPORT_FORMATS = ("json", "jsonl", "csv")
+
+
+class PropertyExporter:
+    def __init__(self, directory, prefix="properties", default_format="json"):
+        """
+        Initializes a PropertyExporter object.
+
+        Args:
+            directory (str): The directory the exported files are saved to.
+            prefix (str): The beginning of the names of the exported files.
+            default_format (str): The format used when an export does not name one ("json", "jsonl" or "csv").
+
+        Raises:
+            ValueError: If the default format is not supported.
+        """
+        self._directory = directory
+        self._prefix = prefix
+        self._default_format = self._check_format(default_format)
+        self._file_mode = 0o666 & ~self._get_umask()
+
+    def export(self, properties, file_format=None):
+        """
+        Saves properties to a new file.
+
+        Every record holds the ID of the property followed by its attributes, so exported JSON and JSON Lines
+        files can be read back by PropertyManager.read_properties_from_json with the same IDs.
+
+        Args:
+            properties (Iterable): The properties to save.
+            file_format (str): The format of the file ("json", "jsonl" or "csv") or None for the default format.
+
+        Returns:
+            tuple: The path to the saved file and the number of saved properties.
+
+        Raises:
+            ValueError: If the format is not supported.
+            OSError: If the file cannot be written. No file is left behind in that case.
+        """
+        file_format = self._check_format(file_format or self._default_format)
+        path_to_file = os.path.join(self._directory, self._create_file_name(file_format))
+
+        os.makedirs(self._directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory, prefix=f".{self._prefix}-", suffix=".tmp")
+        try:
+            with open(file_descriptor, "w", encoding="utf-8", newline="") as export_file:
+                if file_format == "csv":
+                    count = self._write_csv(export_file, properties)
+                else:
+                    count = self._write_json(
+                        export_file, properties, json_lines=file_format == "jsonl")
+                export_file.flush()
+                os.fsync(export_file.fileno())
+            os.chmod(temporary_path, self._file_mode)
+            os.replace(temporary_path, path_to_file)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        return path_to_file, count
+
+    @staticmethod
+    def _get_umask():
+        """
+        Gets the umask of the process. (protected method)
+
+        The umask can only be read by replacing it, so it is read once, when the exporter is created,
+        rather than while other threads may be creating files.
+
+        Returns:
+            int: The umask.
+        """
+        umask = os.umask(0o022)
+        os.umask(umask)
+        return umask
+
+    @staticmethod
+    def _check_format(file_format):
+        """
+        Checks that an export format is supported. (protected method)
+
+        Args:
+            file_format (str): The format to check.
+
+        Returns:
+            str: The format.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"{__name__}: Unsupported export format {file_format}")
+        return file_format
+
+    def _create_file_name(self, file_format):
+        """
+        Creates a unique name for an exported file. (protected method)
+
+        Args:
+            file_format (str): The format of the file, used as its extension.
+
+        Returns:
+            str: The file name made of the prefix, the current time and a random suffix.
+        """
+        return f"{self._prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.{file_format}"
+
+    @staticmethod
+    def _create_record(prop):
+        """
+        Creates the exported record of a property. (protected method)
+
+        Args:
+            prop (Property): The property.
+
+        Returns:
+            dict: The ID of the property followed by its attributes.
+        """
+        return {"id": prop.get_id(), **prop.to_dict()}
+
+    def _write_json(self, export_file, properties, json_lines):
+        """
+        Writes properties as a JSON array with one record per line or as JSON Lines. (protected method)
+
+        Args:
+            export_file (file): The open text file.
+            properties (Iterable): The properties to write.
+            json_lines (bool): Whether to write JSON Lines instead of a JSON array.
+
+        Returns:
+            int: The number of written properties.
+        """
+        count = 0
+        if not json_lines:
+            export_file.write("[")
+
+        for prop in properties:
+            record = json.dumps(self._create_record(prop), ensure_ascii=False)
+            if json_lines:
+                export_file.write(f"{record}\n")
+            else:
+                export_file.write(f"{',' if count else ''}\n    {record}")
+            count += 1
+
+        if not json_lines:
+            export_file.write("\n]\n" if count else "]\n")
+        return count
+
+    def _write_csv(self, export_file, properties):
+        """
+        Writes properties as CSV with a header row. Attributes a property does not have are left empty.
+        (protected method)
+
+        Args:
+            export_file (file): The open text file.
+            properties (Iterable): The properties to write.
+
+        Returns:
+            int: The number of written properties.
+        """
+        writer = csv.DictWriter(export_file, fieldnames=PROPERTY_FIELDS)
+        writer.writeheader()
+
+        count = 0
+        for prop in properties:
+            writer.writerow(self._create_record(prop))
+            count += 1
+        return count
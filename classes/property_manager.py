@@ -1,170 +1,1211 @@
-"""
-PropertyManager Class
-
-This file defines the PropertyManager class, which is responsible for managing a list of properties.
-It provides methods for reading properties from JSON, adding properties, filtering properties, and sorting properties.
-"""
-
-import json
-import sys
-from classes.property import Property
-from classes.apartment import Apartment
-from classes.house import House
-from classes.commercial_space import CommercialSpace
-
-
-class PropertyManager:
-    def __init__(self):
-        """
-        Initializes a PropertyManager object with an empty list of properties.
-        """
-        self._properties = []
-
-    def get_properties(self):
-        """
-        Gets the list of properties.
-
-        Returns:
-            list: The list of properties.
-        """
-        return self._properties
-
-    def read_properties_from_json(self, path_to_file):
-        """
-        Reads properties from a JSON file and add them to the list.
-
-        Args:
-            path_to_file (str): The path to the JSON file.
-
-        Raises:
-            FileNotFoundError: If the path to the JSON file cannot be found.
-            Exception: If an error occurs.
-        """
-        try:
-            with open(path_to_file, "r") as json_file:
-                data = json.load(json_file)
-
-                for item in data:
-                    property_type = item["property_type"].lower()
-                    if property_type == "apartment":
-                        self._add_property(Apartment(**item))
-                    elif property_type == "house":
-                        self._add_property(House(**item))
-                    elif property_type == "commercial space":
-                        self._add_property(CommercialSpace(**item))
-                    else:
-                        print(
-                            f"{__name__}: Property type {property_type} not supported",
-                            file=sys.stderr)
-        except FileNotFoundError as e:
-            print(
-                f"{__name__}: File called {path_to_file} could not be found!",
-                file=sys.stderr)
-            raise e
-        except Exception as e:
-            print(f"{__name__}: An error occurred: {e}", file=sys.stderr)
-            raise e
-
-    def _add_property(self, property_to_add):
-        """
-        Adds a property to the list. (protected method)
-
-        Args:
-            property_to_add (Property): The property to add.
-
-        Raises:
-            Exception: If the given object is not an instance of Property.
-        """
-        if not (isinstance(property_to_add, Property)):
-            raise Exception(f"{__name__}: Cannot add property")
-
-        self._properties.append(property_to_add)
-
-    def filter_by_location(self, location):
-        """
-        Filters properties by location.
-
-        Args:
-            location (str): The location to filter by.
-
-        Returns:
-            list: The filtered list of properties.
-        """
-        return [prop for prop in self._properties if prop.get_location().lower()
-                == location.lower()]
-
-    def filter_by_price(self, min_price=0, max_price=None):
-        """
-        Filters properties by price range.
-
-        Args:
-            min_price (int): The minimum price.
-            max_price (int): The maximum price.
-
-        Returns:
-            list: The filtered list of properties.
-        """
-        if max_price is None:
-            max_price = max(prop.get_price() for prop in self._properties)
-
-        return [prop for prop in self._properties if min_price <=
-                prop.get_price() <= max_price]
-
-    def filter_by_square_footage(
-            self,
-            min_square_footage=0,
-            max_square_footage=None):
-        """
-        Filters properties by square footage range.
-
-        Args:
-            min_square_footage (int): The minimum square footage.
-            max_square_footage (int): The maximum square footage.
-
-        Returns:
-            list: The filtered list of properties.
-        """
-        if max_square_footage is None:
-            max_square_footage = max(prop.get_square_footage()
-                                     for prop in self._properties)
-
-        return [prop for prop in self._properties if min_square_footage <=
-                prop.get_square_footage() <= max_square_footage]
-
-    def filter_by_property_type(self, property_type):
-        """
-        Filters properties by property type.
-
-        Args:
-            property_type (str): The property type to filter by.
-
-        Returns:
-            list: The filtered list of properties.
-        """
-        return [prop for prop in self._properties if prop.get_property_type(
-        ).lower() == property_type.lower()]
-
-    def sort_properties(self, sorting_attribute, sorting_type):
-        """
-        Sorts properties based on the given attribute and sorting type.
-
-        Args:
-            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
-            sorting_type (str): The sorting type ("ascending" or "descending").
-
-        Returns:
-            list: The sorted list of properties.
-        """
-
-        reverse = True if sorting_type == "descending" else False
-
-        if sorting_attribute == "price":
-            return sorted(
-                self._properties,
-                key=lambda prop: prop.get_price(),
-                reverse=reverse)
-        else:
-            return sorted(
-                self._properties,
-                key=lambda prop: prop.get_square_footage(),
-                reverse=reverse)
+"""
+PropertyManager Class
+
+This file defines the PropertyManager class, which is responsible for managing a list of properties.
+It provides methods for reading properties from JSON, adding properties, filtering properties, and sorting properties.
+
+A catalog can be read by any number of threads at once: reading never changes the properties or the lists
+returned to other readers, and indexes built on first use are swapped in only once complete. Changes are made
+copy-on-write: they are applied to a copy of the catalog (see copy) that replaces the original once complete,
+e.g. by CatalogReloader.update, so readers never wait for a change and never see one half applied.
+"""
+
+import copy
+import heapq
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from classes.property import Property
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+from classes.property_columns import PropertyColumns
+from classes.property_reader import PropertyReader
+from classes.parallel_property_reader import ParallelPropertyReader
+from classes.property_snapshot import PropertySnapshot, ORDERED_ATTRIBUTES
+from classes.sorted_index import SortedIndex, IN_PLACE_MAX_CHANGES
+
+SORTING_KEYS = {
+    "price": Property.get_price,
+    "square_footage": Property.get_square_footage
+}
+
+# Number of created properties handed to _add_properties at once while reading a file
+LOAD_BATCH_SIZE = 10000
+
+# Top-k selection with a heap only pays off while k is small compared to the number of properties
+TOP_K_MAX_RATIO = 0.25
+
+
+class PropertyManager:
+    def __init__(self):
+        """
+        Initializes a PropertyManager object with an empty list of properties.
+        """
+        self._properties = []
+        self._version = 0
+        self._sorted_indexes = {attribute: SortedIndex(key)
+                                for attribute, key in SORTING_KEYS.items()}
+        self._sorted_indexes_version = 0
+        self._properties_by_id = {}
+        self._positions = {}
+        self._next_position = 0
+        self._location_index = {}
+        self._property_type_index = {}
+        self._metrics = None
+
+    def set_metrics(self, metrics):
+        """
+        Makes the catalog count the rows scanned and returned by its filtering, sorting and query methods.
+        Copies of the catalog (see copy) count into the same metrics.
+
+        Args:
+            metrics (RequestMetrics): The metrics to count into or None to stop counting.
+        """
+        self._metrics = metrics
+
+    def close(self):
+        """
+        Releases the resources held by the catalog. A catalog held in memory has none to release.
+        """
+
+    @contextmanager
+    def consistent_reads(self):
+        """
+        Keeps every read of the calling thread inside the block on the same version of the catalog, e.g. a page
+        of a query and the count of its matches. A catalog held in memory is only changed through copies
+        (see copy), so its reads are always consistent.
+        """
+        yield
+
+    def copy(self):
+        """
+        Creates a copy of the catalog that can be changed while this one keeps serving readers.
+
+        The lists and indexes are copied, which costs O(n) pointer copies, and the properties themselves are shared:
+        the methods changing a catalog replace properties instead of changing them.
+
+        Returns:
+            PropertyManager: The copy.
+        """
+        catalog = copy.copy(self)
+        catalog._properties = list(self._properties)
+        catalog._properties_by_id = dict(self._properties_by_id)
+        catalog._positions = dict(self._positions)
+        catalog._location_index = {value: list(bucket) for value, bucket in self._location_index.items()}
+        catalog._property_type_index = {value: list(bucket) for value, bucket in self._property_type_index.items()}
+        catalog._sorted_indexes = {attribute: index.copy() for attribute, index in self._sorted_indexes.items()}
+        return catalog
+
+    def get_properties(self):
+        """
+        Gets the list of properties.
+
+        Returns:
+            list: The list of properties.
+        """
+        return self._properties
+
+    def get_version(self):
+        """
+        Gets the version of the catalog. The version changes whenever properties are added, replaced or deleted.
+
+        Returns:
+            int: The version of the catalog.
+        """
+        return self._version
+
+    def get_by_id(self, property_id):
+        """
+        Gets a property by its ID.
+
+        Args:
+            property_id (str): The ID of the property.
+
+        Returns:
+            Property: The property with the given ID or None if there is no such property.
+        """
+        return self._properties_by_id.get(property_id)
+
+    def get_by_ids(self, property_ids):
+        """
+        Gets the properties with the given IDs.
+
+        Unknown IDs are skipped.
+
+        Args:
+            property_ids (list): The IDs of the properties.
+
+        Returns:
+            list: The properties in the order of the given IDs.
+        """
+        properties_by_id = self._properties_by_id
+        return [properties_by_id[property_id]
+                for property_id in property_ids if property_id in properties_by_id]
+
+    def read_properties_from_json(
+            self,
+            path_to_file,
+            file_format=None,
+            progress_callback=None,
+            path_to_snapshot=None,
+            paths_to_deltas=(),
+            workers=1):
+        """
+        Reads properties from a JSON or JSON Lines file and add them to the list.
+
+        The file is streamed, so only one record is parsed at a time and the raw file content is never held
+        in memory next to the created properties. The delta files are applied after it (see apply_delta).
+        If a snapshot path is given, the properties are loaded from the snapshot instead when it was created
+        from the current content of the file and the deltas. Otherwise the file is read, the deltas are applied
+        and a new snapshot is written. Processes rebuilding the same snapshot at once hold its lock while doing so
+        (see PropertySnapshot.lock), so only the first one reads the file and the others map the new snapshot.
+
+        Args:
+            path_to_file (str): The path to the JSON file.
+            file_format (str): "json" for a JSON array, "jsonl" for JSON Lines or None to decide by the file extension.
+            progress_callback (callable): A function reporting the progress of the read
+                (see PropertyReader for its arguments).
+            path_to_snapshot (str): The path to the binary snapshot of the file or None to always read the file.
+            paths_to_deltas (Iterable): The paths to the delta files to apply, in order.
+            workers (int): The number of processes parsing a JSON Lines file (see ParallelPropertyReader),
+                None for one per CPU or 1 to parse it in this process. JSON arrays are always parsed in this process.
+
+        Raises:
+            FileNotFoundError: If the path to the JSON file or to a delta file cannot be found.
+            Exception: If an error occurs.
+        """
+        paths_to_deltas = list(paths_to_deltas)
+        if path_to_snapshot is None:
+            self._read_files(path_to_file, file_format, progress_callback, paths_to_deltas, workers)
+            return
+
+        snapshot = PropertySnapshot(path_to_snapshot)
+        if self._read_current_snapshot(snapshot, path_to_file, paths_to_deltas):
+            return
+
+        with snapshot.lock():
+            # Another process may have built the snapshot while this one was waiting for the lock
+            if self._read_current_snapshot(snapshot, path_to_file, paths_to_deltas):
+                return
+            try:
+                source = PropertySnapshot.describe_source(path_to_file)
+                deltas = [PropertySnapshot.describe_source(path_to_delta) for path_to_delta in paths_to_deltas]
+            except FileNotFoundError as e:
+                print(
+                    f"{__name__}: File called {e.filename} could not be found!",
+                    file=sys.stderr)
+                raise e
+
+            self._read_files(path_to_file, file_format, progress_callback, paths_to_deltas, workers)
+            try:
+                self.write_snapshot(path_to_snapshot, source, deltas)
+            except OSError as e:
+                print(
+                    f"{__name__}: Snapshot {path_to_snapshot} could not be written: {e}",
+                    file=sys.stderr)
+
+    def _read_current_snapshot(self, snapshot, path_to_file, paths_to_deltas):
+        """
+        Adds the properties saved in a snapshot if it was created from the current content of the files.
+        (protected method)
+
+        Args:
+            snapshot (PropertySnapshot): The snapshot.
+            path_to_file (str): The path to the JSON file.
+            paths_to_deltas (list): The paths to the delta files, in order.
+
+        Returns:
+            bool: True if the snapshot was current and has been read.
+
+        Raises:
+            FileNotFoundError: If the path to the JSON file or to a delta file cannot be found.
+            Exception: If an error occurs.
+        """
+        try:
+            if not snapshot.is_current(path_to_file, paths_to_deltas):
+                return False
+            self.read_snapshot(snapshot.get_path())
+            return True
+        except FileNotFoundError as e:
+            print(
+                f"{__name__}: File called {e.filename} could not be found!",
+                file=sys.stderr)
+            raise e
+        except Exception as e:
+            print(f"{__name__}: An error occurred: {e}", file=sys.stderr)
+            raise e
+
+    def _read_files(self, path_to_file, file_format, progress_callback, paths_to_deltas, workers=1):
+        """
+        Reads properties from a JSON or JSON Lines file and applies delta files to them. (protected method)
+
+        Args:
+            path_to_file (str): The path to the JSON file.
+            file_format (str): The format of the file (see read_properties_from_json).
+            progress_callback (callable): A function reporting the progress of the read.
+            paths_to_deltas (list): The paths to the delta files to apply, in order.
+            workers (int): The number of processes parsing a JSON Lines file (see read_properties_from_json).
+
+        Raises:
+            FileNotFoundError: If the path to the JSON file or to a delta file cannot be found.
+            Exception: If an error occurs.
+        """
+        try:
+            if self._reads_in_parallel(path_to_file, file_format, workers):
+                for columns in ParallelPropertyReader(
+                        path_to_file,
+                        self._create_property,
+                        workers=workers,
+                        progress_callback=progress_callback):
+                    self._add_columns(columns)
+            else:
+                reader = PropertyReader(
+                    path_to_file,
+                    file_format=file_format,
+                    progress_callback=progress_callback)
+                properties_to_add = []
+
+                for item in reader:
+                    property_to_add = self._create_property(item)
+                    if property_to_add is not None:
+                        properties_to_add.append(property_to_add)
+                    if len(properties_to_add) == LOAD_BATCH_SIZE:
+                        self._add_properties(properties_to_add)
+                        properties_to_add = []
+
+                self._add_properties(properties_to_add)
+        except FileNotFoundError as e:
+            print(
+                f"{__name__}: File called {path_to_file} could not be found!",
+                file=sys.stderr)
+            raise e
+        except Exception as e:
+            print(f"{__name__}: An error occurred: {e}", file=sys.stderr)
+            raise e
+
+        for path_to_delta in paths_to_deltas:
+            self.apply_delta(path_to_delta)
+
+    def write_snapshot(self, path_to_snapshot, source, deltas=()):
+        """
+        Saves all properties and their sorted order to a binary snapshot (see PropertySnapshot).
+
+        Args:
+            path_to_snapshot (str): The path to the snapshot file.
+            source (dict): The description of the file the properties were read from,
+                as returned by PropertySnapshot.describe_source.
+            deltas (Iterable): The descriptions of the delta files applied after the file, in order.
+        """
+        columns = PropertyColumns()
+        for property_to_save in self.get_properties():
+            columns.append(property_to_save)
+
+        PropertySnapshot(path_to_snapshot).write(
+            columns,
+            {attribute: columns.get_order(attribute) for attribute in ORDERED_ATTRIBUTES},
+            source,
+            deltas)
+
+    def read_snapshot(self, path_to_snapshot):
+        """
+        Adds the properties saved in a binary snapshot (see PropertySnapshot).
+
+        If the catalog was empty, the sorted indexes are filled in the saved order instead of being sorted again.
+
+        Args:
+            path_to_snapshot (str): The path to the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a compatible snapshot or holds an ID that has already been added.
+        """
+        was_empty = not len(self.get_properties())
+        columns, orders = PropertySnapshot(path_to_snapshot).read()
+        properties_to_add = columns.materialize_rows()
+        self._add_properties(properties_to_add)
+
+        if was_empty:
+            for attribute in ORDERED_ATTRIBUTES:
+                self._sorted_indexes[attribute].rebuild(
+                    [properties_to_add[row] for row in orders[attribute][0]])
+            self._sorted_indexes_version = self._version
+
+    def add_property(self, property_to_add):
+        """
+        Adds a property to the catalog.
+
+        Args:
+            property_to_add (Property): The property to add.
+
+        Raises:
+            Exception: If the given object is not an instance of Property.
+            ValueError: If a property with the same ID has already been added.
+        """
+        self._check_new_properties(
+            [property_to_add], lambda property_id: self.get_by_id(property_id) is not None)
+        self.apply_changes([property_to_add])
+
+    def update_property(self, property_to_update):
+        """
+        Replaces the property with the same ID. The updated property moves to the end of the catalog,
+        as if it had been deleted and added again.
+
+        Args:
+            property_to_update (Property): The new version of the property.
+
+        Raises:
+            Exception: If the given object is not an instance of Property.
+            ValueError: If there is no property with the same ID.
+        """
+        self._check_new_properties([property_to_update], lambda property_id: False)
+        if self.get_by_id(property_to_update.get_id()) is None:
+            raise ValueError(
+                f"{__name__}: Unknown property ID {property_to_update.get_id()}")
+        self.apply_changes([property_to_update])
+
+    def delete_property(self, property_id):
+        """
+        Deletes a property from the catalog.
+
+        Args:
+            property_id (str): The ID of the property.
+
+        Returns:
+            bool: True if the property was deleted, False if there is no such property.
+        """
+        return self.apply_changes([], [property_id])[2] == 1
+
+    def apply_changes(self, properties_to_upsert, property_ids_to_delete=()):
+        """
+        Deletes and adds or replaces properties as one change of the catalog.
+
+        The deletions are applied first. A property replacing one with the same ID moves to the end of the catalog.
+        Every change is located in the sorted indexes with a binary search and they are updated instead of being
+        sorted again (see SortedIndex.update); the other indexes are only touched in the buckets holding changed
+        properties, and the list of all properties is filtered at most once per batch.
+
+        Args:
+            properties_to_upsert (list): The properties to add or replace, with IDs unique among themselves.
+            property_ids_to_delete (Iterable): The IDs of the properties to delete. Unknown IDs are skipped.
+
+        Returns:
+            tuple: The numbers of added, replaced and deleted properties.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another one of them.
+        """
+        self._check_new_properties(properties_to_upsert, lambda property_id: False)
+
+        removed = {}
+        deleted = 0
+        for property_id in property_ids_to_delete:
+            existing = self._properties_by_id.get(property_id)
+            if existing is not None and id(existing) not in removed:
+                removed[id(existing)] = existing
+                deleted += 1
+        replaced = 0
+        for property_to_upsert in properties_to_upsert:
+            existing = self._properties_by_id.get(property_to_upsert.get_id())
+            if existing is not None and id(existing) not in removed:
+                removed[id(existing)] = existing
+                replaced += 1
+        if not removed and not properties_to_upsert:
+            return 0, 0, 0
+
+        sorted_indexes_current = self._sorted_indexes_version == self._version
+        self._unindex_properties(removed)
+        self._properties.extend(properties_to_upsert)
+        for property_to_upsert in properties_to_upsert:
+            self._index_by_value(property_to_upsert)
+
+        if sorted_indexes_current:
+            for index in self._sorted_indexes.values():
+                index.update(list(removed.values()), properties_to_upsert)
+        self._version += 1
+        if sorted_indexes_current:
+            self._sorted_indexes_version = self._version
+
+        return len(properties_to_upsert) - replaced, replaced, deleted
+
+    def apply_delta(self, path_to_file, file_format=None, progress_callback=None):
+        """
+        Applies a delta file to the catalog.
+
+        A delta is a JSON or JSON Lines file of records keyed by their "id" field: a record with "deleted": true
+        is a tombstone deleting the property with that ID, any other record is a property record (as in the
+        input file) adding the property or replacing the one with the same ID. When a file holds several records
+        with one ID, the last one wins. The file is streamed and applied in batches of LOAD_BATCH_SIZE changes
+        (see apply_changes), so a delta costs time proportional to its length rather than to the catalog.
+
+        Args:
+            path_to_file (str): The path to the delta file.
+            file_format (str): "json" for a JSON array, "jsonl" for JSON Lines or None to decide by the file extension.
+            progress_callback (callable): A function reporting the progress of the read
+                (see PropertyReader for its arguments).
+
+        Returns:
+            tuple: The numbers of added, replaced and deleted properties.
+
+        Raises:
+            FileNotFoundError: If the path to the delta file cannot be found.
+            ValueError: If a record has no ID. The batches before it stay applied.
+            Exception: If an error occurs.
+        """
+        totals = (0, 0, 0)
+        try:
+            for properties_to_upsert, property_ids_to_delete in self._read_delta(
+                    path_to_file, file_format, progress_callback):
+                totals = tuple(map(sum, zip(
+                    totals, self.apply_changes(properties_to_upsert, property_ids_to_delete))))
+        except FileNotFoundError as e:
+            print(
+                f"{__name__}: File called {path_to_file} could not be found!",
+                file=sys.stderr)
+            raise e
+        except Exception as e:
+            print(f"{__name__}: An error occurred: {e}", file=sys.stderr)
+            raise e
+
+        return totals
+
+    def _read_delta(self, path_to_file, file_format=None, progress_callback=None):
+        """
+        Streams a delta file (see apply_delta) in batches of up to LOAD_BATCH_SIZE changes. (protected method)
+
+        Args:
+            path_to_file (str): The path to the delta file.
+            file_format (str): The format of the file (see apply_delta).
+            progress_callback (callable): A function reporting the progress of the read.
+
+        Yields:
+            tuple: The properties to upsert and the IDs of the properties to delete (see apply_changes).
+
+        Raises:
+            FileNotFoundError: If the path to the delta file cannot be found.
+            ValueError: If a record has no ID.
+        """
+        reader = PropertyReader(
+            path_to_file,
+            file_format=file_format,
+            progress_callback=progress_callback)
+        changes = {}
+
+        for item in reader:
+            if "id" not in item:
+                raise ValueError(f"{__name__}: Delta record without an ID")
+            property_id = str(item["id"])
+            changes.pop(property_id, None)
+            changes[property_id] = item
+            if len(changes) == LOAD_BATCH_SIZE:
+                yield self._parse_delta_records(changes)
+                changes = {}
+
+        yield self._parse_delta_records(changes)
+
+    def _parse_delta_records(self, changes):
+        """
+        Creates the changes described by a batch of delta records (see apply_delta). (protected method)
+
+        Args:
+            changes (dict): The last record of every changed ID, indexed by the ID.
+
+        Returns:
+            tuple: The properties to upsert and the IDs of the properties to delete.
+        """
+        properties_to_upsert = []
+        property_ids_to_delete = []
+        for property_id, item in changes.items():
+            if item.get("deleted"):
+                property_ids_to_delete.append(property_id)
+                continue
+            property_to_upsert = self._create_property(
+                {name: value for name, value in item.items() if name != "deleted"})
+            if property_to_upsert is not None:
+                properties_to_upsert.append(property_to_upsert)
+
+        return properties_to_upsert, property_ids_to_delete
+
+    @staticmethod
+    def _reads_in_parallel(path_to_file, file_format, workers):
+        """
+        Decides whether a file is parsed by a pool of processes. (protected method)
+
+        Args:
+            path_to_file (str): The path to the file.
+            file_format (str): The format of the file (see read_properties_from_json).
+            workers (int): The number of processes (None for one per CPU).
+
+        Returns:
+            bool: True for JSON Lines files with more than one worker.
+        """
+        return (workers is None or workers > 1) and PropertyReader.get_file_format(path_to_file, file_format) == "jsonl"
+
+    @staticmethod
+    def _create_property(item):
+        """
+        Creates a property of the right class from a record. (protected method)
+
+        The ID of the property is read from the "id" field of the record. Records without one get an ID
+        derived from their content, so the IDs stay the same across restarts and processes.
+
+        Args:
+            item (dict): The property record.
+
+        Returns:
+            Property: The created property or None if the property type is not supported.
+        """
+        fields = {name: value for name, value in item.items() if name != "id"}
+        property_id = str(item["id"]) if "id" in item else Property.generate_uuid(fields)
+
+        property_type = fields["property_type"].lower()
+        if property_type == "apartment":
+            return Apartment(**fields, property_id=property_id)
+        elif property_type == "house":
+            return House(**fields, property_id=property_id)
+        elif property_type == "commercial space":
+            return CommercialSpace(**fields, property_id=property_id)
+
+        print(
+            f"{__name__}: Property type {property_type} not supported",
+            file=sys.stderr)
+        return None
+
+    def _add_property(self, property_to_add):
+        """
+        Adds a property to the list. (protected method)
+
+        Args:
+            property_to_add (Property): The property to add.
+
+        Raises:
+            Exception: If the given object is not an instance of Property.
+            ValueError: If a property with the same ID has already been added.
+        """
+        if not (isinstance(property_to_add, Property)):
+            raise Exception(f"{__name__}: Cannot add property")
+        if property_to_add.get_id() in self._properties_by_id:
+            raise ValueError(
+                f"{__name__}: Duplicate property ID {property_to_add.get_id()}")
+
+        self._properties.append(property_to_add)
+        self._index_by_value(property_to_add)
+
+        # Keep up-to-date sorted indexes current, stale ones are rebuilt on their next use anyway
+        if self._sorted_indexes_version == self._version:
+            for index in self._sorted_indexes.values():
+                index.add(property_to_add)
+            self._sorted_indexes_version += 1
+        self._version += 1
+
+    def _add_properties(self, properties_to_add):
+        """
+        Adds many properties to the list at once. (protected method)
+
+        The sorted indexes are rebuilt once, the next time they are used, instead of once per property.
+
+        Args:
+            properties_to_add (list): The properties to add.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        self._check_new_properties(
+            properties_to_add, self._properties_by_id.__contains__)
+
+        self._properties.extend(properties_to_add)
+        for property_to_add in properties_to_add:
+            self._index_by_value(property_to_add)
+        self._version += 1
+
+    def _add_columns(self, columns):
+        """
+        Adds the properties of a PropertyColumns object, e.g. a shard read by a worker process. (protected method)
+
+        Args:
+            columns (PropertyColumns): The properties to add.
+
+        Raises:
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        self._add_properties(columns.materialize_rows())
+
+    @staticmethod
+    def _check_new_properties(properties_to_add, is_known_id):
+        """
+        Checks that all given objects are properties with IDs unique among themselves and the catalog,
+        in a single pass. (protected method)
+
+        Args:
+            properties_to_add (list): The properties about to be added.
+            is_known_id (callable): A function telling whether an ID is already in the catalog.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        new_ids = set()
+        for property_to_add in properties_to_add:
+            if not (isinstance(property_to_add, Property)):
+                raise Exception(f"{__name__}: Cannot add property")
+
+            property_id = property_to_add.get_id()
+            if property_id in new_ids or is_known_id(property_id):
+                raise ValueError(
+                    f"{__name__}: Duplicate property ID {property_id}")
+            new_ids.add(property_id)
+
+    def _get_sorted_index(self, attribute):
+        """
+        Gets the index ordering the properties by the given attribute, rebuilding it if the catalog
+        changed since it was last built. (protected method)
+
+        Args:
+            attribute (str): The sorted attribute ("price" or "square_footage").
+
+        Returns:
+            SortedIndex: The up-to-date index.
+        """
+        if self._sorted_indexes_version != self._version:
+            # New indexes are swapped in once built, so concurrent readers never see one being rebuilt
+            version = self._version
+            sorted_indexes = {}
+            for sorted_attribute, key in SORTING_KEYS.items():
+                sorted_indexes[sorted_attribute] = SortedIndex(key)
+                sorted_indexes[sorted_attribute].rebuild(self._properties)
+            self._sorted_indexes = sorted_indexes
+            self._sorted_indexes_version = version
+
+        return self._sorted_indexes[attribute]
+
+    def _index_by_value(self, property_to_index):
+        """
+        Adds a property to the ID map, the map of positions and the case-insensitive location and property type
+        indexes. (protected method)
+
+        The position only grows, so it orders the properties like the list even after others have been removed.
+
+        Args:
+            property_to_index (Property): The property to index.
+        """
+        self._properties_by_id[property_to_index.get_id()] = property_to_index
+        self._positions[id(property_to_index)] = self._next_position
+        self._next_position += 1
+        self._location_index.setdefault(
+            property_to_index.get_location().casefold(), []).append(property_to_index)
+        self._property_type_index.setdefault(
+            property_to_index.get_property_type().casefold(), []).append(property_to_index)
+
+    def _unindex_properties(self, removed):
+        """
+        Removes properties from the list, the ID and position maps and the location and property type indexes.
+        (protected method)
+
+        Up to IN_PLACE_MAX_CHANGES properties are removed from the lists in place. More are removed by filtering
+        the list once and only the index buckets holding removed properties.
+
+        Args:
+            removed (dict): The properties to remove, indexed by their id().
+        """
+        if not removed:
+            return
+
+        in_place = len(removed) <= IN_PLACE_MAX_CHANGES
+        if in_place:
+            for prop in removed.values():
+                self._properties.remove(prop)
+        else:
+            self._properties = [prop for prop in self._properties if id(prop) not in removed]
+
+        for index, get_value in (
+                (self._location_index, Property.get_location),
+                (self._property_type_index, Property.get_property_type)):
+            for value in {get_value(prop).casefold() for prop in removed.values()}:
+                if in_place:
+                    bucket = index[value]
+                    for prop in removed.values():
+                        if get_value(prop).casefold() == value:
+                            bucket.remove(prop)
+                else:
+                    bucket = [prop for prop in index[value] if id(prop) not in removed]
+                    index[value] = bucket
+                if not bucket:
+                    del index[value]
+
+        for prop in removed.values():
+            del self._properties_by_id[prop.get_id()]
+            del self._positions[id(prop)]
+
+    def filter_by_location(self, location):
+        """
+        Filters properties by location.
+
+        Args:
+            location (str): The location to filter by.
+
+        Returns:
+            list: The filtered list of properties. The list is shared with the index and must not be modified.
+        """
+        bucket = self._location_index.get(location.casefold(), [])
+        self._record_rows("filter_by_location", len(bucket), len(bucket))
+        return bucket
+
+    def filter_by_price(self, min_price=0, max_price=None):
+        """
+        Filters properties by price range.
+
+        Args:
+            min_price (int): The minimum price.
+            max_price (int): The maximum price or None for no upper bound.
+
+        Returns:
+            list: The filtered list of properties, ordered by price.
+        """
+        filtered_properties = self._get_sorted_index("price").range(min_price, max_price)
+        self._record_rows("filter_by_price", len(filtered_properties), len(filtered_properties))
+        return filtered_properties
+
+    def filter_by_square_footage(
+            self,
+            min_square_footage=0,
+            max_square_footage=None):
+        """
+        Filters properties by square footage range.
+
+        Args:
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage or None for no upper bound.
+
+        Returns:
+            list: The filtered list of properties, ordered by square footage.
+        """
+        filtered_properties = self._get_sorted_index("square_footage").range(
+            min_square_footage, max_square_footage)
+        self._record_rows("filter_by_square_footage", len(filtered_properties), len(filtered_properties))
+        return filtered_properties
+
+    def filter_by_property_type(self, property_type):
+        """
+        Filters properties by property type.
+
+        Args:
+            property_type (str): The property type to filter by.
+
+        Returns:
+            list: The filtered list of properties. The list is shared with the index and must not be modified.
+        """
+        bucket = self._property_type_index.get(property_type.casefold(), [])
+        self._record_rows("filter_by_property_type", len(bucket), len(bucket))
+        return bucket
+
+    def sort_properties(
+            self,
+            sorting_attribute,
+            sorting_type,
+            limit=None,
+            offset=0):
+        """
+        Sorts properties based on the given attribute and sorting type.
+
+        The order is read from the up-to-date sorted index, so getting a page of k properties costs O(k).
+        Properties with equal values are listed in the order they were added when sorting in ascending order
+        and in the reverse order when sorting in descending order.
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The number of properties needed or None for all of them.
+            offset (int): The number of leading sorted properties to skip.
+
+        Returns:
+            list: The sorted list of properties.
+        """
+        sorted_properties = self._sort_page(sorting_attribute, sorting_type, limit, offset)
+        self._record_rows("sort_properties", len(sorted_properties), len(sorted_properties))
+        return sorted_properties
+
+    def _sort_page(self, sorting_attribute, sorting_type, limit, offset):
+        """
+        Reads a page of all properties from the sorted index of an attribute (see sort_properties).
+        (protected method)
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The number of properties needed or None for all of them.
+            offset (int): The number of leading sorted properties to skip.
+
+        Returns:
+            list: The sorted list of properties.
+        """
+        if sorting_attribute != "price":
+            sorting_attribute = "square_footage"
+
+        ordered = self._get_sorted_index(sorting_attribute).get_items()
+        stop = None if limit is None else offset + limit
+
+        if sorting_type == "descending":
+            return list(islice(reversed(ordered), offset, stop))
+
+        return ordered[offset:stop]
+
+    @staticmethod
+    def _sort_limited(properties, key, reverse, limit):
+        """
+        Sorts properties and keeps only the first ones. (protected method)
+
+        When only a small number of properties is needed, a heap selects them in O(n log k)
+        instead of sorting the whole list. Like in sort_properties, properties with equal values keep their order
+        in ascending order and are reversed in descending order, so descending is the exact reverse of ascending.
+
+        Args:
+            properties (list): The properties to sort.
+            key (callable): The function returning the value to sort by.
+            reverse (bool): Whether to sort in descending order.
+            limit (int): The number of leading properties to keep or None to keep all of them.
+
+        Returns:
+            list: The sorted properties.
+        """
+        if reverse:
+            # Both sorts are stable, so ties come out in the order of the reversed input
+            properties = properties[::-1]
+
+        if limit is not None and limit <= len(properties) * TOP_K_MAX_RATIO:
+            if reverse:
+                return heapq.nlargest(limit, properties, key=key)
+            return heapq.nsmallest(limit, properties, key=key)
+
+        return sorted(properties, key=key, reverse=reverse)[:limit]
+
+    def _get_position_key(self, sorting_attribute=None):
+        """
+        Gets the function ordering properties by the order they were added in, after a sorted attribute if any.
+        (protected method)
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage") or None.
+
+        Returns:
+            callable: The function returning the position of a property or its value and position.
+        """
+        positions = self._positions
+        if sorting_attribute is None:
+            return lambda prop: positions[id(prop)]
+
+        value = SORTING_KEYS[sorting_attribute]
+        return lambda prop: (value(prop), positions[id(prop)])
+
+    def _sort_by_position_ties(self, properties, sorting_attribute, reverse, limit):
+        """
+        Sorts properties that are not in the order they were added and keeps only the first ones. (protected method)
+
+        Ties are ordered by the position of the properties like in sort_properties. Only the selected properties
+        and those tied with the last of them are compared by position, which is cheaper than sorting all of them
+        by value and position.
+
+        Args:
+            properties (list): The properties to sort.
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            reverse (bool): Whether to sort in descending order.
+            limit (int): The number of leading properties to keep or None to keep all of them.
+
+        Returns:
+            list: The sorted properties.
+        """
+        key = self._get_position_key(sorting_attribute)
+        if limit is None:
+            return sorted(properties, key=key, reverse=reverse)
+
+        value = SORTING_KEYS[sorting_attribute]
+        selected = self._sort_limited(properties, key=value, reverse=reverse, limit=limit)
+        if not selected:
+            return selected
+
+        # Every property ordered before the last selected value has been selected, the ties of that value may not
+        boundary = value(selected[-1])
+        candidates = [prop for prop in selected if value(prop) != boundary]
+        candidates.extend(prop for prop in properties if value(prop) == boundary)
+        return sorted(candidates, key=key, reverse=reverse)[:limit]
+
+    def _record_rows(self, method, scanned, returned):
+        """
+        Counts the rows scanned and returned by a call if the catalog has metrics (see set_metrics).
+        (protected method)
+
+        Args:
+            method (str): The name of the called method.
+            scanned (int): The number of rows examined or None if it is not known.
+            returned (int): The number of rows returned.
+        """
+        if self._metrics is not None:
+            self._metrics.count_rows(method, scanned, returned)
+
+    def query(
+            self,
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None,
+            sorting_attribute=None,
+            sorting_type="ascending",
+            limit=None,
+            offset=0):
+        """
+        Finds the properties matching all the given criteria.
+
+        Criteria left as None are ignored. The query starts from the index that matches the fewest properties
+        and only checks the remaining criteria against those candidates, so combining criteria is cheaper than
+        chaining the filter_* methods.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage") or None to keep
+                the order the properties were added in. Ties are ordered like in sort_properties.
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The maximum number of properties to return or None for no limit.
+            offset (int): The number of leading matching properties to skip.
+
+        Returns:
+            list: The matching properties.
+
+        Raises:
+            ValueError: If the sorting attribute is not supported.
+        """
+        if sorting_attribute is not None and sorting_attribute not in SORTING_KEYS:
+            raise ValueError(
+                f"{__name__}: Cannot sort by {sorting_attribute}")
+
+        stop = None if limit is None else offset + limit
+        result, driving_attribute, scanned = self._find(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage,
+            first=stop if sorting_attribute is None else None)
+
+        if sorting_attribute is not None and result is self._properties:
+            found_properties = self._sort_page(sorting_attribute, sorting_type, limit, offset)
+            scanned = len(found_properties)
+        elif sorting_attribute is not None and sorting_attribute == driving_attribute:
+            found_properties = (result[::-1] if sorting_type == "descending" else result)[offset:stop]
+        elif driving_attribute is not None and sorting_attribute is None:
+            # The candidates are ordered by the range they were found in
+            found_properties = self._sort_limited(
+                result, key=self._get_position_key(), reverse=False, limit=stop)[offset:]
+        elif driving_attribute is not None:
+            found_properties = self._sort_by_position_ties(
+                result, sorting_attribute, reverse=sorting_type == "descending", limit=stop)[offset:]
+        elif sorting_attribute is not None:
+            found_properties = self._sort_limited(
+                result,
+                key=SORTING_KEYS[sorting_attribute],
+                reverse=sorting_type == "descending",
+                limit=stop)[offset:]
+        else:
+            found_properties = result[offset:stop]
+            if result is self._properties:
+                scanned = len(found_properties)
+
+        self._record_rows("query", scanned, len(found_properties))
+        return found_properties
+
+    def count(
+            self,
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None):
+        """
+        Counts the properties matching all the given criteria.
+
+        A single criterion is counted from its index without collecting the matching properties.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            int: The number of matching properties.
+        """
+        plans = self._plan_query(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage)
+
+        if not plans:
+            self._record_rows("count", 0, 0)
+            return len(self._properties)
+        if len(plans) == 1:
+            self._record_rows("count", 0, 0)
+            return plans[0][0]
+
+        result, _, scanned = self._find(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage)
+        self._record_rows("count", scanned, 0)
+        return len(result)
+
+    def _find(
+            self,
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage,
+            first=None):
+        """
+        Collects the properties matching all the given criteria. (protected method)
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+            first (int): The number of leading matches needed in the order the properties were added or None.
+                If the most selective index is a range, whose candidates are ordered by their value, the list of
+                all properties is scanned in order for these matches instead, when that is expected to check
+                fewer properties than the range holds.
+
+        Returns:
+            tuple: The matching properties, the name of the sorted attribute they are ordered by (or None)
+                and the number of candidates checked against the criteria. The list may be shared with an index
+                and must not be modified.
+        """
+        plans = self._plan_query(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage)
+
+        if not plans:
+            return self._properties, None, 0
+
+        count, fetch, _, driving_attribute = plans[0]
+        if driving_attribute is not None and first is not None and first * len(self._properties) <= count * count:
+            return self._scan_first(plans, first)
+
+        result = fetch()
+        scanned = len(result)
+        for _, _, predicate, _ in plans[1:]:
+            result = [prop for prop in result if predicate(prop)]
+
+        return result, driving_attribute, scanned
+
+    def _scan_first(self, plans, first):
+        """
+        Collects the first properties matching a query plan by scanning all properties in order. (protected method)
+
+        Args:
+            plans (list): The access plan of the query (see _plan_query).
+            first (int): The number of matches needed.
+
+        Returns:
+            tuple: The matching properties in the order they were added, None and the number of properties checked.
+        """
+        predicates = [predicate for _, _, predicate, _ in plans]
+        matches = ((scanned, prop) for scanned, prop in enumerate(self._properties, 1)
+                   if all(predicate(prop) for predicate in predicates))
+        found = list(islice(matches, first))
+        scanned = found[-1][0] if found and len(found) == first else len(self._properties)
+        return [prop for _, prop in found], None, scanned
+
+    def _plan_query(
+            self,
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage):
+        """
+        Builds the access plan of a query, ordered from the most to the least selective index. (protected method)
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            list: Tuples of (number of matches, function fetching the matches from the index,
+                predicate checking a single property, name of the sorted attribute or None).
+        """
+        plans = []
+
+        if location is not None:
+            location_bucket = self._location_index.get(location.casefold(), [])
+            folded_location = location.casefold()
+            plans.append((len(location_bucket),
+                          lambda: location_bucket,
+                          lambda prop: prop.get_location().casefold() == folded_location,
+                          None))
+
+        if property_type is not None:
+            property_type_bucket = self._property_type_index.get(property_type.casefold(), [])
+            folded_type = property_type.casefold()
+            plans.append((len(property_type_bucket),
+                          lambda: property_type_bucket,
+                          lambda prop: prop.get_property_type().casefold() == folded_type,
+                          None))
+
+        for attribute, min_value, max_value in (
+                ("price", min_price, max_price),
+                ("square_footage", min_square_footage, max_square_footage)):
+            if min_value is None and max_value is None:
+                continue
+            plans.append(self._plan_range(attribute, min_value, max_value))
+
+        plans.sort(key=lambda plan: plan[0])
+        return plans
+
+    def _plan_range(self, attribute, min_value, max_value):
+        """
+        Builds the access plan of a range criterion on a sorted attribute. (protected method)
+
+        Args:
+            attribute (str): The sorted attribute ("price" or "square_footage").
+            min_value (int|float): The lower bound or None for no lower bound.
+            max_value (int|float): The upper bound or None for no upper bound.
+
+        Returns:
+            tuple: The plan in the format described in _plan_query.
+        """
+        index = self._get_sorted_index(attribute)
+        key = SORTING_KEYS[attribute]
+        low = float("-inf") if min_value is None else min_value
+        high = float("inf") if max_value is None else max_value
+        return (index.count(min_value, max_value),
+                lambda: index.range(min_value, max_value),
+                lambda prop: low <= key(prop) <= high,
+                attribute)
@@ -0,0 +1,246 @@
+"""
+PropertyReader Class
+
+This file defines the PropertyReader class, which streams property records from a JSON file one record at a time.
+It supports files holding a single JSON array of records as well as JSON Lines files (one record per line),
+so the whole file never has to be held in memory while properties are being created.
+"""
+
+import codecs
+import json
+import os
+import re
+import sys
+
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+WHITESPACE = re.compile(r"\s*")
+
+
+class PropertyReader:
+    def __init__(
+            self,
+            path_to_file,
+            file_format=None,
+            chunk_size=1 << 16,
+            progress_callback=None,
+            progress_interval=100000):
+        """
+        Initializes a PropertyReader object.
+
+        Args:
+            path_to_file (str): The path to the JSON or JSON Lines file.
+            file_format (str): "json" for a JSON array, "jsonl" for JSON Lines or None to decide by the file extension.
+            chunk_size (int): The number of bytes read from the file at once.
+            progress_callback (callable): A function called with the number of records read, the number of bytes
+                read and the size of the file every progress_interval records and once at the end.
+            progress_interval (int): The number of records between two progress reports.
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        self._path_to_file = path_to_file
+        self._file_format = self.get_file_format(path_to_file, file_format)
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+        self._progress_interval = progress_interval
+
+    def __iter__(self):
+        """
+        Iterates over the records of the file.
+
+        Yields:
+            dict: The next property record.
+
+        Raises:
+            FileNotFoundError: If the file cannot be found.
+            ValueError: If the file is not valid JSON or JSON Lines.
+        """
+        total_bytes = os.path.getsize(self._path_to_file)
+        with open(self._path_to_file, "rb") as input_file:
+            if self._file_format == "jsonl":
+                records = self._read_json_lines(input_file)
+            else:
+                records = self._read_json_array(input_file)
+
+            count = 0
+            for count, record in enumerate(records, start=1):
+                yield record
+                if self._progress_callback is not None and count % self._progress_interval == 0:
+                    self._progress_callback(
+                        count, input_file.tell(), total_bytes)
+
+            if self._progress_callback is not None:
+                self._progress_callback(count, total_bytes, total_bytes)
+
+    @staticmethod
+    def get_file_format(path_to_file, file_format=None):
+        """
+        Decides the format of a file.
+
+        Args:
+            path_to_file (str): The path to the file.
+            file_format (str): "json" for a JSON array, "jsonl" for JSON Lines or None to decide by the file extension.
+
+        Returns:
+            str: "json" or "jsonl".
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        if file_format is None:
+            file_format = "jsonl" if path_to_file.lower().endswith(
+                JSON_LINES_EXTENSIONS) else "json"
+        if file_format not in ("json", "jsonl"):
+            raise ValueError(
+                f"{__name__}: File format must be json or jsonl")
+        return file_format
+
+    @staticmethod
+    def print_progress(records_read, bytes_read, total_bytes):
+        """
+        Prints the progress of a read to stderr. Can be used as the progress_callback.
+
+        Args:
+            records_read (int): The number of records read so far.
+            bytes_read (int): The number of bytes read so far.
+            total_bytes (int): The size of the file.
+        """
+        percentage = 100 * bytes_read / total_bytes if total_bytes else 100
+        print(
+            f"{__name__}: Read {records_read} properties ({percentage:.1f}% of {total_bytes} bytes)",
+            file=sys.stderr)
+
+    def _read_json_lines(self, input_file):
+        """
+        Parses a JSON Lines file. Empty lines are skipped. (protected method)
+
+        Args:
+            input_file (file): The file opened in binary mode.
+
+        Yields:
+            dict: The next property record.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+        """
+        for line_number, line in enumerate(input_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"{__name__}: Invalid JSON on line {line_number}: {e}") from e
+
+    def _read_json_array(self, input_file):
+        """
+        Parses a file holding a single JSON array, one element at a time. (protected method)
+
+        Args:
+            input_file (file): The file opened in binary mode.
+
+        Yields:
+            dict: The next property record.
+
+        Raises:
+            ValueError: If the file does not hold a valid JSON array.
+        """
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        buffer = ""
+        position = 0
+        end_of_file = False
+        expecting = "["
+
+        while True:
+            # Skip whitespace, refilling the buffer when it runs out
+            while True:
+                position = WHITESPACE.match(buffer, position).end()
+                if position < len(buffer) or end_of_file:
+                    break
+                buffer, position, end_of_file = self._fill(
+                    input_file, text_decoder, buffer, position)
+
+            if position == len(buffer):
+                raise ValueError(f"{__name__}: Unexpected end of JSON array")
+
+            character = buffer[position]
+            if expecting == "[":
+                if character != "[":
+                    raise ValueError(
+                        f"{__name__}: The file must contain a JSON array")
+                position += 1
+                expecting = "first"
+            elif expecting in ("first", "separator") and character == "]":
+                return
+            elif expecting == "separator":
+                if character != ",":
+                    raise ValueError(
+                        f"{__name__}: Expected , or ] between array elements")
+                position += 1
+                expecting = "element"
+            else:
+                record, position, buffer, end_of_file = self._decode_element(
+                    input_file, text_decoder, decoder, buffer, position, end_of_file)
+                yield record
+                expecting = "separator"
+
+    def _decode_element(
+            self,
+            input_file,
+            text_decoder,
+            decoder,
+            buffer,
+            position,
+            end_of_file):
+        """
+        Decodes the array element starting at the given position, reading more of the file
+        until the element is complete. (protected method)
+
+        Args:
+            input_file (file): The file opened in binary mode.
+            text_decoder (codecs.IncrementalDecoder): The decoder turning bytes into text.
+            decoder (json.JSONDecoder): The JSON decoder.
+            buffer (str): The text read so far.
+            position (int): The position of the element in the buffer.
+            end_of_file (bool): Whether the whole file has been read.
+
+        Returns:
+            tuple: The decoded element, the position after it, the buffer and whether the whole file has been read.
+
+        Raises:
+            ValueError: If the element is not valid JSON.
+        """
+        while True:
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+                # An element touching the end of the buffer (e.g. a number) may continue in the next chunk
+                if end < len(buffer) or end_of_file:
+                    return record, end, buffer, end_of_file
+            except json.JSONDecodeError as e:
+                if end_of_file:
+                    raise ValueError(
+                        f"{__name__}: Invalid JSON array element: {e}") from e
+
+            buffer, position, end_of_file = self._fill(
+                input_file, text_decoder, buffer, position)
+
+    def _fill(self, input_file, text_decoder, buffer, position):
+        """
+        Drops the consumed part of the buffer and appends the next chunk of the file. (protected method)
+
+        Args:
+            input_file (file): The file opened in binary mode.
+            text_decoder (codecs.IncrementalDecoder): The decoder turning bytes into text.
+            buffer (str): The text read so far.
+            position (int): The position of the first character still needed.
+
+        Returns:
+            tuple: The new buffer, the position of the first character still needed in it
+                and whether the whole file has been read.
+        """
+        chunk = input_file.read(self._chunk_size)
+        end_of_file = not chunk
+        buffer = buffer[position:] + \
+            text_decoder.decode(chunk, final=end_of_file)
+        return buffer, 0, end_of_file
@@ -0,0 +1,55 @@
+"""
+PropertyRows Class
+
+This file defines the PropertyRows class, a read-only sequence of rows of a PropertyColumns object.
+It behaves like a list of properties, but creates the Property objects only when they are accessed,
+so a filter result with millions of rows costs nothing more than the row numbers until a page of it is rendered.
+"""
+
+from collections.abc import Sequence
+
+
+class PropertyRows(Sequence):
+    def __init__(self, columns, rows):
+        """
+        Initializes a PropertyRows object.
+
+        Args:
+            columns (PropertyColumns): The columns holding the properties.
+            rows (Sequence): The row numbers, in the order they are listed.
+        """
+        self._columns = columns
+        self._rows = rows
+
+    def __len__(self):
+        """
+        Gets the number of listed properties.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        """
+        Gets the property at a position or a list of the properties in a slice.
+
+        Args:
+            index (int|slice): The position or the slice.
+
+        Returns:
+            Property|list: The created property or the list of created properties.
+        """
+        if isinstance(index, slice):
+            return self._columns.materialize_rows(self._rows[index])
+
+        return self._columns.materialize(self._rows[index])
+
+    def get_rows(self):
+        """
+        Gets the listed row numbers.
+
+        Returns:
+            Sequence: The row numbers.
+        """
+        return self._rows
@@ -0,0 +1,109 @@
+"""
+PropertySerializer Class
+
+This file defines the PropertySerializer class, which encodes properties as JSON for the REST API.
+Every property caches its own JSON fragment, so listing the same properties again only joins ready-made bytes,
+and a response is produced piece by piece instead of being built as one large document first.
+orjson is used for encoding when it is installed and the standard json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+PROPERTY_FIELDS = (
+    "id",
+    "name",
+    "property_type",
+    "location",
+    "price",
+    "square_footage",
+    "num_of_bedrooms",
+    "num_of_bathrooms",
+    "floor_number",
+    "num_of_floors",
+    "business_type")
+
+
+class PropertySerializer:
+    def __init__(self, fields=None):
+        """
+        Initializes a PropertySerializer object.
+
+        Args:
+            fields (list): The names of the fields to include, in order, or None for all the fields.
+                Fields a property does not have are left out of its object.
+
+        Raises:
+            ValueError: If a field is not a property field.
+        """
+        if fields is not None:
+            unknown_fields = [
+                field for field in fields if field not in PROPERTY_FIELDS]
+            if unknown_fields:
+                raise ValueError(
+                    f"{__name__}: Unknown fields: {', '.join(unknown_fields)}")
+            fields = tuple(dict.fromkeys(fields))
+
+        self._fields = fields
+
+    @staticmethod
+    def dumps(value):
+        """
+        Encodes a value as compact JSON.
+
+        Args:
+            value (object): The value to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON.
+        """
+        if orjson is not None:
+            return orjson.dumps(value)
+        return json.dumps(value, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+
+    def serialize(self, prop):
+        """
+        Encodes one property as a JSON object.
+
+        Without a field selection the cached fragment of the property is returned.
+
+        Args:
+            prop (Property): The property to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON object.
+        """
+        if self._fields is None:
+            return prop.to_json()
+
+        property_dict = prop.to_dict()
+        return self.dumps({field: prop.get_id() if field == "id" else property_dict[field]
+                           for field in self._fields if field == "id" or field in property_dict})
+
+    def iter_document(self, properties, **metadata):
+        """
+        Encodes properties as a JSON document, one chunk at a time.
+
+        The document is an object holding the metadata followed by a "data" array with the properties.
+
+        Args:
+            properties (Iterable): The properties to encode.
+            **metadata: The JSON-serializable values written before the properties.
+
+        Yields:
+            bytes: The consecutive chunks of the document.
+        """
+        yield self.dumps(metadata)[:-1] + (b',"data":[' if metadata else b'"data":[')
+
+        separator = b""
+        for prop in properties:
+            yield separator + self.serialize(prop)
+            separator = b","
+
+        yield b"]}"
@@ -0,0 +1,306 @@
+"""
+PropertySnapshot Class
+
+This file defines the PropertySnapshot class, which saves a catalog in a compact binary file and loads it back
+without parsing JSON or validating every record again.
+A snapshot holds the columns of a PropertyColumns object, the rows ordered by price and square footage
+and the rows ordered by ID. Numeric columns are stored as raw typed arrays and IDs and names as one UTF-8 buffer
+each (see StringColumn). All of them are memory-mapped when the snapshot is read, so loading takes constant time
+and every process reading the same snapshot (e.g. the workers of a pre-forked server) shares one copy of the
+catalog in the page cache instead of holding its own. The snapshot also records the size, modification time
+and hash of the file and the delta files it was created from, so a stale snapshot is detected and can be rebuilt.
+
+File layout: the magic bytes, the length of the header (8 bytes, little-endian), the JSON header describing
+the sections, and the sections themselves, each starting at a multiple of 8 bytes.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from contextlib import contextmanager
+from classes.property_columns import COLUMN_TYPECODES, PropertyColumns
+from classes.string_column import StringColumn, OFFSET_TYPECODE
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+MAGIC = b"PROPSNAP"
+FORMAT_VERSION = 2
+HEADER_LENGTH = struct.Struct("<Q")
+ALIGNMENT = 8
+
+# The attributes whose row order is stored in the snapshot
+ORDERED_ATTRIBUTES = ("price", "square_footage")
+
+# The string columns stored as offsets and a UTF-8 buffer instead of JSON, so they can be memory-mapped
+STRING_COLUMNS = ("ids", "names")
+
+
+class PropertySnapshot:
+    def __init__(self, path_to_snapshot):
+        """
+        Initializes a PropertySnapshot object.
+
+        Args:
+            path_to_snapshot (str): The path to the snapshot file (it does not have to exist yet).
+        """
+        self._path_to_snapshot = path_to_snapshot
+
+    def get_path(self):
+        """
+        Gets the path to the snapshot file.
+
+        Returns:
+            str: The path to the snapshot file.
+        """
+        return self._path_to_snapshot
+
+    @staticmethod
+    def describe_source(path_to_source):
+        """
+        Describes the current content of a source file.
+
+        Args:
+            path_to_source (str): The path to the file the catalog is read from.
+
+        Returns:
+            dict: The size, the modification time (in nanoseconds) and the BLAKE2b hash of the file.
+        """
+        hash_object = hashlib.blake2b(digest_size=16)
+        with open(path_to_source, "rb") as source_file:
+            stat = os.fstat(source_file.fileno())
+            for chunk in iter(lambda: source_file.read(1 << 20), b""):
+                hash_object.update(chunk)
+
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": hash_object.hexdigest()}
+
+    def is_current(self, path_to_source, paths_to_deltas=()):
+        """
+        Checks whether the snapshot exists, can be read on this platform and was created from the current
+        content of a source file and of the delta files applied to it.
+
+        The files are only hashed if their modification time differs from the recorded one but their size
+        does not, so touching them does not force a rebuild.
+
+        Args:
+            path_to_source (str): The path to the file the catalog is read from.
+            paths_to_deltas (Iterable): The paths to the delta files applied after the source, in order.
+
+        Returns:
+            bool: True if the snapshot can be read instead of the source and the deltas.
+        """
+        header = self._read_header()
+        if header is None or not self.matches_source(header["source"], path_to_source):
+            return False
+
+        paths_to_deltas = list(paths_to_deltas)
+        return len(header["deltas"]) == len(paths_to_deltas) and all(
+            self.matches_source(delta, path_to_delta)
+            for delta, path_to_delta in zip(header["deltas"], paths_to_deltas))
+
+    @contextmanager
+    def lock(self):
+        """
+        Holds an exclusive lock on the snapshot, e.g. while checking and rebuilding it.
+
+        Processes loading the catalog at the same time (e.g. the workers of a pre-forked server) take the lock
+        around the check and the rebuild, so the snapshot is built by the first of them only and the others
+        wait for it and then map it. The lock is held on a file next to the snapshot. Nothing is locked on
+        platforms without fcntl or if the lock file cannot be created.
+
+        Yields:
+            None: The lock is released when the with block is left.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            lock_file = open(f"{self._path_to_snapshot}.lock", "ab")
+        except OSError:
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    @classmethod
+    def matches_source(cls, source, path_to_source):
+        """
+        Checks whether a source file still has the described content.
+
+        The file is only hashed if its modification time differs from the described one but its size does not.
+
+        Args:
+            source (dict): The description of the file, as returned by describe_source.
+            path_to_source (str): The path to the file.
+
+        Returns:
+            bool: True if the file has the described content.
+        """
+        stat = os.stat(path_to_source)
+        if stat.st_size != source["size"]:
+            return False
+        if stat.st_mtime_ns == source["mtime_ns"]:
+            return True
+        return cls.describe_source(path_to_source)["hash"] == source["hash"]
+
+    def write(self, columns, orders, source, deltas=()):
+        """
+        Saves a catalog to the snapshot file.
+
+        The file is written under a temporary name and renamed when it is complete, so a reader never sees
+        a partial snapshot and processes that have mapped the previous snapshot keep reading it.
+
+        Args:
+            columns (PropertyColumns): The columns of the catalog.
+            orders (dict): The rows ordered by each attribute of ORDERED_ATTRIBUTES and the attribute values
+                in the same order, as returned by PropertyColumns.get_order.
+            source (dict): The description of the source file, as returned by describe_source.
+            deltas (Iterable): The descriptions of the delta files applied after the source, in order.
+        """
+        sections = dict(columns.to_columns())
+        for name in STRING_COLUMNS:
+            sections[f"{name}_offsets"], sections[f"{name}_data"] = StringColumn.encode(sections.pop(name))
+        for attribute in ORDERED_ATTRIBUTES:
+            sections[f"order_{attribute}"], sections[f"values_{attribute}"] = orders[attribute]
+        sections["id_order"] = columns.get_id_order()
+
+        encoded_sections = []
+        layout = {}
+        offset = 0
+        for name, section in sections.items():
+            if isinstance(section, list):
+                data = json.dumps(section, ensure_ascii=False).encode("utf-8")
+                typecode = None
+            elif isinstance(section, bytes):
+                data = section
+                typecode = "B"
+            else:
+                data = section.cast("B") if isinstance(section, memoryview) else section
+                typecode = section.format if isinstance(section, memoryview) else section.typecode
+            length = len(data) * (data.itemsize if isinstance(data, array) else 1)
+            layout[name] = {"typecode": typecode, "offset": offset, "length": length}
+            encoded_sections.append(data)
+            offset += -(-length // ALIGNMENT) * ALIGNMENT
+
+        header = json.dumps({
+            "format_version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "itemsizes": {typecode: array(typecode).itemsize
+                          for typecode in {*COLUMN_TYPECODES.values(), OFFSET_TYPECODE} if typecode is not None},
+            "rows": len(columns),
+            "source": source,
+            "deltas": list(deltas),
+            "sections": layout
+        }).encode("utf-8")
+        start = -(-(len(MAGIC) + HEADER_LENGTH.size + len(header)) // ALIGNMENT) * ALIGNMENT
+
+        directory = os.path.dirname(self._path_to_snapshot) or "."
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory, prefix=".snapshot-", suffix=".tmp")
+        try:
+            with open(file_descriptor, "wb") as snapshot_file:
+                snapshot_file.write(MAGIC + HEADER_LENGTH.pack(len(header)) + header)
+                for name, data in zip(layout, encoded_sections):
+                    snapshot_file.seek(start + layout[name]["offset"])
+                    snapshot_file.write(data)
+                snapshot_file.truncate(start + offset)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temporary_path, self._path_to_snapshot)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def read(self):
+        """
+        Loads the catalog saved in the snapshot file.
+
+        The file is memory-mapped where possible. The numeric columns are read-only memoryviews of the mapping
+        and the IDs and names are StringColumn objects over it, so they share the page cache with every other
+        process reading the same snapshot.
+
+        Returns:
+            tuple: The PropertyColumns object and the orders (see write).
+
+        Raises:
+            ValueError: If the file is not a snapshot that can be read on this platform.
+        """
+        with open(self._path_to_snapshot, "rb") as snapshot_file:
+            header, start = self._parse_header(snapshot_file)
+            if header is None:
+                raise ValueError(
+                    f"{__name__}: {self._path_to_snapshot} is not a compatible snapshot")
+            try:
+                buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                snapshot_file.seek(0)
+                buffer = snapshot_file.read()
+
+        content = memoryview(buffer)
+        sections = {}
+        for name, section in header["sections"].items():
+            begin = start + section["offset"]
+            data = content[begin:begin + section["length"]]
+            if section["typecode"] is None:
+                sections[name] = json.loads(bytes(data).decode("utf-8"))
+            else:
+                sections[name] = data.cast(section["typecode"])
+
+        for name in STRING_COLUMNS:
+            sections[name] = StringColumn(sections.pop(f"{name}_offsets"), sections.pop(f"{name}_data"))
+        orders = {attribute: (sections.pop(f"order_{attribute}"), sections.pop(f"values_{attribute}"))
+                  for attribute in ORDERED_ATTRIBUTES}
+        id_order = sections.pop("id_order")
+        return PropertyColumns.from_columns(sections, id_order=id_order), orders
+
+    def _read_header(self):
+        """
+        Reads the header of the snapshot file. (protected method)
+
+        Returns:
+            dict: The header or None if the file does not exist or is not a snapshot readable on this platform.
+        """
+        try:
+            with open(self._path_to_snapshot, "rb") as snapshot_file:
+                return self._parse_header(snapshot_file)[0]
+        except OSError:
+            return None
+
+    @staticmethod
+    def _parse_header(snapshot_file):
+        """
+        Parses the header at the beginning of an open snapshot file. (protected method)
+
+        Args:
+            snapshot_file (file): The snapshot file opened in binary mode.
+
+        Returns:
+            tuple: The header (or None if the file is not a compatible snapshot) and the position of the sections.
+        """
+        prefix = snapshot_file.read(len(MAGIC) + HEADER_LENGTH.size)
+        if len(prefix) != len(MAGIC) + HEADER_LENGTH.size or not prefix.startswith(MAGIC):
+            return None, 0
+
+        header_length, = HEADER_LENGTH.unpack(prefix[len(MAGIC):])
+        try:
+            header = json.loads(snapshot_file.read(header_length).decode("utf-8"))
+        except ValueError:
+            return None, 0
+
+        compatible = (
+            header.get("format_version") == FORMAT_VERSION
+            and header.get("byteorder") == sys.byteorder
+            and all(array(typecode).itemsize == itemsize
+                    for typecode, itemsize in header.get("itemsizes", {}).items()))
+        start = -(-(len(prefix) + header_length) // ALIGNMENT) * ALIGNMENT
+        return (header if compatible else None), start
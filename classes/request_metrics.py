@@ -0,0 +1,142 @@
+"""
+RequestMetrics Class
+
+This file defines the RequestMetrics class, which collects the latency of the requests per route and per phase
+(e.g. query, render) as histograms, and counts the rows scanned and returned by the PropertyManager calls.
+The metrics are rendered in the Prometheus text format. Recording a value costs a binary search and one
+short locked update, so the metrics can stay enabled in production.
+Every process keeps its own metrics, so the workers of a pre-forked server are scraped separately.
+"""
+
+import threading
+from bisect import bisect_left
+
+# The upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# The prefix of the names of all metrics
+METRIC_PREFIX = "property_app"
+
+
+class RequestMetrics:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Initializes a RequestMetrics object without any recorded values.
+
+        Args:
+            buckets (tuple): The increasing upper bounds (in seconds) of the histogram buckets.
+        """
+        self._buckets = tuple(buckets)
+        self._histograms = {}
+        self._scanned_rows = {}
+        self._returned_rows = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route, phase, seconds):
+        """
+        Records the duration of a phase of a request.
+
+        Args:
+            route (str): The name of the route.
+            phase (str): The name of the phase (e.g. "total", "query", "render", "serialize").
+            seconds (float): The duration in seconds.
+        """
+        bucket = bisect_left(self._buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get((route, phase))
+            if histogram is None:
+                histogram = self._histograms[(route, phase)] = [[0] * (len(self._buckets) + 1), 0.0]
+            histogram[0][bucket] += 1
+            histogram[1] += seconds
+
+    def count_rows(self, method, scanned, returned):
+        """
+        Records the rows scanned and returned by a PropertyManager call.
+
+        Args:
+            method (str): The name of the called method (e.g. "query").
+            scanned (int): The number of rows examined or None if the storage engine does not know it.
+            returned (int): The number of rows returned.
+        """
+        with self._lock:
+            if scanned is not None:
+                self._scanned_rows[method] = self._scanned_rows.get(method, 0) + scanned
+            self._returned_rows[method] = self._returned_rows.get(method, 0) + returned
+
+    def get_count(self, route, phase):
+        """
+        Gets the number of recorded durations of a phase of a route.
+
+        Args:
+            route (str): The name of the route.
+            phase (str): The name of the phase.
+
+        Returns:
+            int: The number of recorded durations.
+        """
+        with self._lock:
+            histogram = self._histograms.get((route, phase))
+            return 0 if histogram is None else sum(histogram[0])
+
+    def get_rows(self, method):
+        """
+        Gets the numbers of rows scanned and returned by the calls of a PropertyManager method so far.
+
+        Args:
+            method (str): The name of the method.
+
+        Returns:
+            tuple: The numbers of scanned and returned rows.
+        """
+        with self._lock:
+            return self._scanned_rows.get(method, 0), self._returned_rows.get(method, 0)
+
+    def render(self):
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        with self._lock:
+            histograms = {key: (list(counts), total) for key, (counts, total) in self._histograms.items()}
+            scanned_rows = dict(self._scanned_rows)
+            returned_rows = dict(self._returned_rows)
+
+        name = f"{METRIC_PREFIX}_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Time spent handling requests, per route and phase.",
+            f"# TYPE {name} histogram"
+        ]
+        for (route, phase), (counts, total) in sorted(histograms.items()):
+            labels = f'route="{self._escape(route)}",phase="{self._escape(phase)}"'
+            cumulative = 0
+            for bound, count in zip(self._buckets + ("+Inf",), counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {total}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+        for counter, description, values in (
+                ("rows_scanned", "Rows examined by PropertyManager calls.", scanned_rows),
+                ("rows_returned", "Rows returned by PropertyManager calls.", returned_rows)):
+            name = f"{METRIC_PREFIX}_{counter}_total"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for method, value in sorted(values.items()):
+                lines.append(f'{name}{{method="{self._escape(method)}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _escape(value):
+        """
+        Escapes a label value for the Prometheus text format. (protected method)
+
+        Args:
+            value (str): The label value.
+
+        Returns:
+            str: The escaped value.
+        """
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,146 @@
+"""
+RequestProfiler Class
+
+This file defines the RequestProfiler class, which profiles requests with cProfile so that occasional slow
+requests can be diagnosed after the fact. A fraction of the requests can be sampled, and with a latency threshold
+every request is profiled and its profile kept only if the request was slower than the threshold.
+Every kept profile is written to a directory as a .prof file (readable with pstats or snakeviz) next to a .json file
+describing the request, and the oldest profiles are deleted once the directory holds too many.
+"""
+
+import cProfile
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+# The extensions of the profile and metadata files
+PROFILE_EXTENSION = ".prof"
+METADATA_EXTENSION = ".json"
+
+
+class RequestProfiler:
+    def __init__(self, directory, sample_rate=0.0, slow_threshold=None, max_files=100, random_number=random.random):
+        """
+        Initializes a RequestProfiler object.
+
+        Args:
+            directory (str): The directory the profiles are written to (created when the first one is written).
+            sample_rate (float): The fraction of the requests whose profile is always kept (0 to sample none).
+            slow_threshold (float): The number of seconds above which the profile of a request is kept or None
+                to keep only the sampled ones. Every request is profiled while a threshold is set.
+            max_files (int): The maximum number of profiles kept in the directory.
+            random_number (callable): The function returning a random number between 0 and 1.
+        """
+        self._directory = directory
+        self._sample_rate = sample_rate
+        self._slow_threshold = slow_threshold
+        self._max_files = max_files
+        self._random_number = random_number
+        self._lock = threading.Lock()
+        self._written = 0
+
+    def is_enabled(self):
+        """
+        Checks whether any request can be profiled.
+
+        Returns:
+            bool: True if requests are sampled or compared to a threshold.
+        """
+        return self._sample_rate > 0 or self._slow_threshold is not None
+
+    def start(self):
+        """
+        Starts profiling a request in the calling thread if it is sampled or a threshold is set.
+
+        Returns:
+            tuple: The running profiler and whether the request was sampled, or None if the request is not
+                profiled (also when another profiler is already active).
+        """
+        sampled = self._sample_rate > 0 and self._random_number() < self._sample_rate
+        if not sampled and self._slow_threshold is None:
+            return None
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return None
+        return profile, sampled
+
+    def stop(self, profiling, seconds, describe):
+        """
+        Stops profiling a request and writes its profile if it was sampled or slower than the threshold.
+
+        Args:
+            profiling (tuple): The value returned by start (None if the request was not profiled).
+            seconds (float): The duration of the request.
+            describe (callable): Returns the description of the request saved with the profile (e.g. its route,
+                parameters and catalog size), called only when the profile is kept and after the profiler stopped.
+
+        Returns:
+            str: The path to the written profile or None if the profile was not kept.
+        """
+        if profiling is None:
+            return None
+
+        profile, sampled = profiling
+        profile.disable()
+        slow = self._slow_threshold is not None and seconds >= self._slow_threshold
+        if not sampled and not slow:
+            return None
+
+        try:
+            return self._write(profile, {
+                **describe(),
+                "seconds": seconds,
+                "reason": "slow" if slow else "sampled",
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "pid": os.getpid()
+            })
+        except OSError as e:
+            print(f"{__name__}: Profile could not be written to {self._directory}: {e}", file=sys.stderr)
+            return None
+
+    def _write(self, profile, metadata):
+        """
+        Writes a profile and its metadata, then deletes the oldest profiles over the limit. (protected method)
+
+        Args:
+            profile (cProfile.Profile): The stopped profiler.
+            metadata (dict): The description of the request.
+
+        Returns:
+            str: The path to the written profile.
+        """
+        with self._lock:
+            self._written += 1
+            name = f"{time.time_ns()}-{os.getpid()}-{self._written}-{metadata.get('route') or 'request'}"
+
+        os.makedirs(self._directory, exist_ok=True)
+        path_to_profile = os.path.join(self._directory, name + PROFILE_EXTENSION)
+        profile.dump_stats(path_to_profile)
+        with open(os.path.join(self._directory, name + METADATA_EXTENSION), "w", encoding="utf-8") as metadata_file:
+            json.dump(metadata, metadata_file, indent=4, default=str)
+
+        self._rotate()
+        return path_to_profile
+
+    def _rotate(self):
+        """
+        Deletes the oldest profiles and their metadata while the directory holds more than max_files profiles.
+        (protected method)
+        """
+        names = sorted(
+            (name[:-len(PROFILE_EXTENSION)] for name in os.listdir(self._directory)
+             if name.endswith(PROFILE_EXTENSION)),
+            key=lambda name: int(name.split("-", 1)[0]) if name.split("-", 1)[0].isdigit() else 0)
+
+        for name in names[:max(len(names) - self._max_files, 0)]:
+            for extension in (PROFILE_EXTENSION, METADATA_EXTENSION):
+                try:
+                    os.remove(os.path.join(self._directory, name + extension))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,211 @@
+"""
+SortedIndex Class
+
+This file defines the SortedIndex class, which keeps properties ordered by a numeric attribute
+so that range queries can be answered with a binary search instead of a scan over every property.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from operator import itemgetter
+
+# Batches of up to this many changes are applied in place, larger ones rebuild the lists once
+IN_PLACE_MAX_CHANGES = 16
+
+
+class SortedIndex:
+    def __init__(self, key):
+        """
+        Initializes an empty SortedIndex object.
+
+        Args:
+            key (callable): A function returning the value a property is ordered by (e.g. Property.get_price).
+        """
+        self._key = key
+        self._keys = []
+        self._items = []
+
+    def __len__(self):
+        """
+        Gets the number of indexed properties.
+
+        Returns:
+            int: The number of indexed properties.
+        """
+        return len(self._items)
+
+    def get_items(self):
+        """
+        Gets the indexed properties in ascending order of their key.
+
+        Returns:
+            list: The ordered list of properties.
+        """
+        return self._items
+
+    def add(self, item):
+        """
+        Adds a single property to the index, keeping the index ordered.
+
+        Properties with equal keys keep the order in which they were added.
+
+        Args:
+            item (Property): The property to add.
+        """
+        key = self._key(item)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._items.insert(position, item)
+
+    def copy(self):
+        """
+        Creates a copy of the index that can be changed without affecting this one.
+
+        Returns:
+            SortedIndex: The copy, holding the same properties.
+        """
+        index = SortedIndex(self._key)
+        index._keys = list(self._keys)
+        index._items = list(self._items)
+        return index
+
+    def remove(self, item):
+        """
+        Removes a single property from the index.
+
+        Args:
+            item (Property): The indexed property to remove.
+
+        Raises:
+            ValueError: If the property is not in the index.
+        """
+        position = self._find(item)
+        del self._keys[position]
+        del self._items[position]
+
+    def update(self, removed_items, added_items):
+        """
+        Removes and adds properties in one step, keeping the index ordered.
+
+        Every change is located with a binary search. Up to IN_PLACE_MAX_CHANGES changes are applied to the
+        lists in place, larger batches rebuild them once from the unchanged slices between the changes,
+        so a batch costs O(k log n) comparisons and a single copy instead of one shift of the lists per change.
+        The added properties are placed after the indexed properties with equal keys, in the given order.
+
+        Args:
+            removed_items (list): The indexed properties to remove (each at most once).
+            added_items (list): The properties to add.
+
+        Raises:
+            ValueError: If a property to remove is not in the index.
+        """
+        if len(removed_items) + len(added_items) <= IN_PLACE_MAX_CHANGES:
+            for item in removed_items:
+                self.remove(item)
+            for item in added_items:
+                self.add(item)
+            return
+
+        keys, items = self._keys, self._items
+        if removed_items:
+            positions = sorted(self._find(item) for item in removed_items)
+            starts = [0] + [position + 1 for position in positions]
+            ends = positions + [len(items)]
+            keys = list(chain.from_iterable(keys[start:end] for start, end in zip(starts, ends)))
+            items = list(chain.from_iterable(items[start:end] for start, end in zip(starts, ends)))
+
+        if added_items:
+            additions = sorted(((self._key(item), item) for item in added_items), key=itemgetter(0))
+            merged_keys, merged_items = [], []
+            start = 0
+            for key, item in additions:
+                position = bisect_right(keys, key, start)
+                merged_keys += keys[start:position]
+                merged_items += items[start:position]
+                merged_keys.append(key)
+                merged_items.append(item)
+                start = position
+            keys = merged_keys + keys[start:]
+            items = merged_items + items[start:]
+
+        self._keys = keys
+        self._items = items
+
+    def rebuild(self, items):
+        """
+        Replaces the content of the index with the given properties.
+
+        This sorts the properties once instead of inserting them separately, which is what bulk loads should use.
+
+        Args:
+            items (list): The properties to index.
+        """
+        ordered = sorted(items, key=self._key)
+        self._keys = [self._key(item) for item in ordered]
+        self._items = ordered
+
+    def range(self, min_value=None, max_value=None):
+        """
+        Gets the properties whose key lies in the given (inclusive) range.
+
+        Args:
+            min_value (int|float): The lower bound or None for no lower bound.
+            max_value (int|float): The upper bound or None for no upper bound.
+
+        Returns:
+            list: The matching properties in ascending order of their key.
+        """
+        start, end = self._bounds(min_value, max_value)
+        return self._items[start:end]
+
+    def count(self, min_value=None, max_value=None):
+        """
+        Counts the properties whose key lies in the given (inclusive) range without collecting them.
+
+        Args:
+            min_value (int|float): The lower bound or None for no lower bound.
+            max_value (int|float): The upper bound or None for no upper bound.
+
+        Returns:
+            int: The number of matching properties.
+        """
+        start, end = self._bounds(min_value, max_value)
+        return max(end - start, 0)
+
+    def _bounds(self, min_value, max_value):
+        """
+        Finds the slice of the index covering the given (inclusive) range. (protected method)
+
+        Args:
+            min_value (int|float): The lower bound or None for no lower bound.
+            max_value (int|float): The upper bound or None for no upper bound.
+
+        Returns:
+            tuple: The start and end positions of the range.
+        """
+        start = 0 if min_value is None else bisect_left(self._keys, min_value)
+        end = len(self._keys) if max_value is None else bisect_right(
+            self._keys, max_value)
+        return start, end
+
+    def _find(self, item):
+        """
+        Finds the position of an indexed property. (protected method)
+
+        The properties with the same key are found with a binary search and only those are compared.
+
+        Args:
+            item (Property): The property to find.
+
+        Returns:
+            int: The position of the property.
+
+        Raises:
+            ValueError: If the property is not in the index.
+        """
+        key = self._key(item)
+        for position in range(bisect_left(self._keys, key), bisect_right(self._keys, key)):
+            if self._items[position] is item:
+                return position
+
+        raise ValueError(f"{__name__}: Property {item.get_id()} is not indexed")
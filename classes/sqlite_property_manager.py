@@ -0,0 +1,816 @@
+"""
+SQLitePropertyManager Class (inherits from PropertyManager)
+
+This file defines the SQLitePropertyManager class, a storage engine keeping the property catalog in a SQLite
+database instead of process memory. Every filter, sort and query is a single SQL query served by the indexes
+on location, property type, price and square footage, and the results are SQLitePropertyRows sequences that
+only fetch the accessed properties. A database file is shared by every worker process using it, and each process
+keeps a pool of connections that its threads borrow for one query or transaction at a time.
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import uuid
+from contextlib import contextmanager
+from classes.property_manager import PropertyManager, LOAD_BATCH_SIZE, SORTING_KEYS
+from classes.property_reader import PropertyReader
+from classes.parallel_property_reader import ParallelPropertyReader
+from classes.property_snapshot import PropertySnapshot
+from classes.sqlite_property_rows import SQLitePropertyRows
+
+# The columns holding the attributes of the properties, named like the keys of Property.to_dict
+PROPERTY_COLUMNS = (
+    "name",
+    "property_type",
+    "location",
+    "price",
+    "square_footage",
+    "num_of_bedrooms",
+    "num_of_bathrooms",
+    "floor_number",
+    "num_of_floors",
+    "business_type")
+
+# Price and square footage have no declared type, so SQLite keeps ints and floats as they were added.
+# The secondary indexes also hold the position, so they serve the ordering of ties too.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS properties (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    property_type TEXT NOT NULL,
+    property_type_key TEXT NOT NULL,
+    location TEXT NOT NULL,
+    location_key TEXT NOT NULL,
+    price NOT NULL,
+    square_footage NOT NULL,
+    num_of_bedrooms INTEGER,
+    num_of_bathrooms INTEGER,
+    floor_number INTEGER,
+    num_of_floors INTEGER,
+    business_type TEXT
+);
+CREATE INDEX IF NOT EXISTS properties_location ON properties (location_key);
+CREATE INDEX IF NOT EXISTS properties_property_type ON properties (property_type_key);
+CREATE INDEX IF NOT EXISTS properties_price ON properties (price);
+CREATE INDEX IF NOT EXISTS properties_square_footage ON properties (square_footage);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO metadata (key, value) VALUES ('version', '0');
+"""
+
+# The number of properties fetched from a cursor at once
+FETCH_SIZE = 1000
+
+# The largest number of IDs looked up with one query (below the default limit of SQL parameters)
+MAX_IDS_PER_QUERY = 500
+
+
+class SQLitePropertyManager(PropertyManager):
+    def __init__(self, path_to_database=None, timeout=30, pool_size=8):
+        """
+        Initializes a SQLitePropertyManager object, creating the tables and indexes if they do not exist yet.
+
+        Args:
+            path_to_database (str): The path to the database file or None for a private in-memory database.
+            timeout (int|float): The number of seconds to wait for a database locked by another connection.
+            pool_size (int): The maximum number of idle connections kept open by a process.
+        """
+        super().__init__()
+        if path_to_database is None:
+            self._database = f"file:/properties-{uuid.uuid4().hex}?vfs=memdb"
+            self._uri = True
+        else:
+            self._database = path_to_database
+            self._uri = False
+        self._timeout = timeout
+        self._pool_size = pool_size
+        self._pool = queue.LifoQueue()
+        self._pool_pid = os.getpid()
+        self._pool_lock = threading.Lock()
+        self._reading = threading.local()
+
+        # This connection is never pooled, it keeps an in-memory database alive until the manager is closed
+        self._schema_connection = self._open_connection()
+        self._schema_connection.executescript(SCHEMA)
+
+    def close(self):
+        """
+        Closes all connections of the process. Closing the manager drops an in-memory database.
+        """
+        with self._pool_lock:
+            while not self._pool.empty():
+                self._pool.get_nowait().close()
+        self._schema_connection.close()
+
+    def copy(self):
+        """
+        Gets the catalog to change instead of a copy.
+
+        The database is shared by every manager and process using it and SQLite keeps readers isolated from
+        a running transaction, so a change applied to this manager is already invisible to readers until
+        it is committed.
+
+        Returns:
+            SQLitePropertyManager: This manager.
+        """
+        return self
+
+    @contextmanager
+    def consistent_reads(self):
+        """
+        Runs every read of the calling thread inside the block in one read transaction on one connection, so they
+        all see the same committed version of the catalog even if another connection or process commits a change
+        meanwhile (e.g. a reload between the query of a page and the count of its matches). Nested blocks share
+        the transaction of the outer one.
+        """
+        if getattr(self._reading, "connection", None) is not None:
+            yield
+            return
+
+        with self._connect() as connection:
+            connection.execute("BEGIN")
+            self._reading.connection = connection
+            try:
+                yield
+            finally:
+                self._reading.connection = None
+                connection.execute("COMMIT")
+
+    def get_version(self):
+        """
+        Gets the version of the catalog, shared by every process using the database.
+
+        Returns:
+            int: The version of the catalog.
+        """
+        with self._connect_for_reading() as connection:
+            return int(connection.execute(
+                "SELECT value FROM metadata WHERE key = 'version'").fetchone()[0])
+
+    def get_properties(self):
+        """
+        Gets all properties.
+
+        Returns:
+            SQLitePropertyRows: The properties in the order they were added.
+        """
+        return SQLitePropertyRows(self)
+
+    def get_by_id(self, property_id):
+        """
+        Gets a property by its ID.
+
+        Args:
+            property_id (str): The ID of the property.
+
+        Returns:
+            Property: The property with the given ID or None if there is no such property.
+        """
+        properties = self.get_by_ids([property_id])
+        return properties[0] if properties else None
+
+    def get_by_ids(self, property_ids):
+        """
+        Gets the properties with the given IDs.
+
+        Unknown IDs are skipped.
+
+        Args:
+            property_ids (list): The IDs of the properties.
+
+        Returns:
+            list: The properties in the order of the given IDs.
+        """
+        property_ids = [str(property_id) for property_id in property_ids]
+        properties_by_id = {}
+        for start in range(0, len(property_ids), MAX_IDS_PER_QUERY):
+            chunk = property_ids[start:start + MAX_IDS_PER_QUERY]
+            for prop in self._select_rows(
+                    f"id IN ({', '.join('?' * len(chunk))})", chunk, "position"):
+                properties_by_id[prop.get_id()] = prop
+
+        return [properties_by_id[property_id]
+                for property_id in property_ids if property_id in properties_by_id]
+
+    def read_properties_from_json(
+            self,
+            path_to_file,
+            file_format=None,
+            progress_callback=None,
+            path_to_snapshot=None,
+            paths_to_deltas=(),
+            workers=1):
+        """
+        Reads properties from a JSON or JSON Lines file into the database and applies delta files to them.
+
+        The database remembers the files it was last read from: reading the same files again while their content
+        is unchanged adds nothing (e.g. when several workers start on one database), and reading changed or
+        other files replaces the properties read before. The whole read is one transaction, so other
+        connections keep seeing the previous catalog until it is complete.
+
+        Args:
+            path_to_file (str): The path to the JSON file.
+            file_format (str): "json" for a JSON array, "jsonl" for JSON Lines or None to decide by the file extension.
+            progress_callback (callable): A function reporting the progress of the read
+                (see PropertyReader for its arguments).
+            path_to_snapshot (str): Ignored, the database itself persists the catalog.
+            paths_to_deltas (Iterable): The paths to the delta files to apply, in order (see apply_delta).
+            workers (int): The number of processes parsing a JSON Lines file (see ParallelPropertyReader),
+                None for one per CPU or 1 to parse it in this process. JSON arrays are always parsed in this process.
+
+        Raises:
+            FileNotFoundError: If the path to the JSON file or to a delta file cannot be found.
+            Exception: If an error occurs.
+        """
+        try:
+            with self._connect() as connection:
+                self._replace_properties(
+                    connection, path_to_file, file_format, progress_callback, list(paths_to_deltas), workers)
+        except FileNotFoundError as e:
+            print(
+                f"{__name__}: File called {path_to_file} could not be found!",
+                file=sys.stderr)
+            raise e
+        except Exception as e:
+            print(f"{__name__}: An error occurred: {e}", file=sys.stderr)
+            raise e
+
+    def _replace_properties(self, connection, path_to_file, file_format, progress_callback, paths_to_deltas, workers=1):
+        """
+        Replaces the properties with the ones of a file and its deltas unless they were read from their
+        current content. (protected method)
+
+        Args:
+            connection (sqlite3.Connection): The connection to run the transaction on.
+            path_to_file (str): The path to the JSON file.
+            file_format (str): The format of the file (see read_properties_from_json).
+            progress_callback (callable): A function reporting the progress of the read.
+            paths_to_deltas (list): The paths to the delta files to apply, in order.
+            workers (int): The number of processes parsing a JSON Lines file (see read_properties_from_json).
+        """
+        paths = [path_to_file, *paths_to_deltas]
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT value FROM metadata WHERE key = 'source'").fetchone()
+            source = None if row is None else json.loads(row[0])
+            if source is not None and self._matches_sources([source, *source.get("deltas", [])], paths):
+                connection.execute("COMMIT")
+                return
+
+            source = {"path": os.path.abspath(path_to_file),
+                      **PropertySnapshot.describe_source(path_to_file),
+                      "deltas": [{"path": os.path.abspath(path_to_delta),
+                                  **PropertySnapshot.describe_source(path_to_delta)}
+                                 for path_to_delta in paths_to_deltas]}
+            connection.execute("DELETE FROM properties")
+            if self._reads_in_parallel(path_to_file, file_format, workers):
+                for columns in ParallelPropertyReader(
+                        path_to_file,
+                        self._create_property,
+                        workers=workers,
+                        progress_callback=progress_callback):
+                    self._insert_properties(connection, columns.materialize_rows())
+            else:
+                reader = PropertyReader(
+                    path_to_file,
+                    file_format=file_format,
+                    progress_callback=progress_callback)
+                properties_to_add = []
+                for item in reader:
+                    property_to_add = self._create_property(item)
+                    if property_to_add is not None:
+                        properties_to_add.append(property_to_add)
+                    if len(properties_to_add) == LOAD_BATCH_SIZE:
+                        self._insert_properties(connection, properties_to_add)
+                        properties_to_add = []
+                self._insert_properties(connection, properties_to_add)
+
+            for path_to_delta in paths_to_deltas:
+                for properties_to_upsert, property_ids_to_delete in self._read_delta(path_to_delta):
+                    self._write_changes(connection, properties_to_upsert, property_ids_to_delete)
+
+            connection.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('source', ?)", (json.dumps(source),))
+            self._increment_version(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("PRAGMA optimize")
+
+    @staticmethod
+    def _matches_sources(sources, paths):
+        """
+        Checks whether files are the described ones and still have the described content. (protected method)
+
+        Args:
+            sources (list): The descriptions of the files, each with its "path".
+            paths (list): The paths to the files, in the same order.
+
+        Returns:
+            bool: True if every file matches its description.
+        """
+        return len(sources) == len(paths) and all(
+            source["path"] == os.path.abspath(path) and PropertySnapshot.matches_source(source, path)
+            for source, path in zip(sources, paths))
+
+    def read_snapshot(self, path_to_snapshot):
+        """
+        Adds the properties saved in a binary snapshot (see PropertySnapshot).
+
+        Args:
+            path_to_snapshot (str): The path to the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a compatible snapshot or holds an ID that has already been added.
+        """
+        columns, _ = PropertySnapshot(path_to_snapshot).read()
+        self._add_properties(columns.materialize_rows())
+
+    def _add_property(self, property_to_add):
+        """
+        Adds a property to the database. (protected method)
+
+        Args:
+            property_to_add (Property): The property to add.
+
+        Raises:
+            Exception: If the given object is not an instance of Property.
+            ValueError: If a property with the same ID has already been added.
+        """
+        self._add_properties([property_to_add])
+
+    def _add_properties(self, properties_to_add):
+        """
+        Adds many properties to the database in one transaction. (protected method)
+
+        Args:
+            properties_to_add (list): The properties to add.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._insert_properties(connection, properties_to_add)
+                self._increment_version(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def apply_changes(self, properties_to_upsert, property_ids_to_delete=()):
+        """
+        Deletes and adds or replaces properties in one transaction.
+
+        The deletions are applied first. A property replacing one with the same ID is deleted and inserted
+        at the end of the catalog. SQLite updates its indexes for every changed row, in O(log n) each.
+
+        Args:
+            properties_to_upsert (list): The properties to add or replace, with IDs unique among themselves.
+            property_ids_to_delete (Iterable): The IDs of the properties to delete. Unknown IDs are skipped.
+
+        Returns:
+            tuple: The numbers of added, replaced and deleted properties.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another one of them.
+        """
+        self._check_new_properties(properties_to_upsert, lambda property_id: False)
+        property_ids_to_delete = list(property_ids_to_delete)
+        if not property_ids_to_delete and not properties_to_upsert:
+            return 0, 0, 0
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                counts = self._write_changes(connection, properties_to_upsert, property_ids_to_delete)
+                self._increment_version(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        return counts
+
+    def _write_changes(self, connection, properties_to_upsert, property_ids_to_delete):
+        """
+        Deletes and adds or replaces properties inside the current transaction (see apply_changes).
+        (protected method)
+
+        Args:
+            connection (sqlite3.Connection): The connection running the transaction.
+            properties_to_upsert (list): The properties to add or replace, with IDs unique among themselves.
+            property_ids_to_delete (Iterable): The IDs of the properties to delete. Unknown IDs are skipped.
+
+        Returns:
+            tuple: The numbers of added, replaced and deleted properties.
+        """
+        property_ids_to_delete = list(dict.fromkeys(str(property_id) for property_id in property_ids_to_delete))
+        upserted_ids = [property_to_upsert.get_id() for property_to_upsert in properties_to_upsert]
+        deleted = self._delete_properties(connection, property_ids_to_delete)
+        replaced = self._delete_properties(connection, upserted_ids)
+        self._insert_properties(connection, properties_to_upsert)
+        return len(upserted_ids) - replaced, replaced, deleted
+
+    def filter_by_location(self, location):
+        """
+        Filters properties by location.
+
+        Args:
+            location (str): The location to filter by.
+
+        Returns:
+            SQLitePropertyRows: The properties with the given location, in the order they were added.
+        """
+        return SQLitePropertyRows(self, "location_key = ?", (location.casefold(),))
+
+    def filter_by_property_type(self, property_type):
+        """
+        Filters properties by property type.
+
+        Args:
+            property_type (str): The property type to filter by.
+
+        Returns:
+            SQLitePropertyRows: The properties of the given type, in the order they were added.
+        """
+        return SQLitePropertyRows(self, "property_type_key = ?", (property_type.casefold(),))
+
+    def filter_by_price(self, min_price=0, max_price=None):
+        """
+        Filters properties by price range.
+
+        Args:
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+
+        Returns:
+            SQLitePropertyRows: The properties in the price range, ordered by price.
+        """
+        return SQLitePropertyRows(
+            self, *self._build_condition(min_price=min_price, max_price=max_price), order="price, position")
+
+    def filter_by_square_footage(
+            self,
+            min_square_footage=0,
+            max_square_footage=None):
+        """
+        Filters properties by square footage range.
+
+        Args:
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            SQLitePropertyRows: The properties in the square footage range, ordered by square footage.
+        """
+        return SQLitePropertyRows(
+            self,
+            *self._build_condition(min_square_footage=min_square_footage, max_square_footage=max_square_footage),
+            order="square_footage, position")
+
+    def sort_properties(
+            self,
+            sorting_attribute,
+            sorting_type,
+            limit=None,
+            offset=0):
+        """
+        Sorts properties based on the given attribute and sorting type.
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The number of properties needed or None for all of them.
+            offset (int): The number of leading sorted properties to skip.
+
+        Returns:
+            SQLitePropertyRows: The sorted properties.
+        """
+        if sorting_attribute != "price":
+            sorting_attribute = "square_footage"
+
+        return SQLitePropertyRows(
+            self, order=self._build_order(sorting_attribute, sorting_type), offset=offset, limit=limit)
+
+    def query(
+            self,
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None,
+            sorting_attribute=None,
+            sorting_type="ascending",
+            limit=None,
+            offset=0):
+        """
+        Finds the properties matching all the given criteria with one SQL query.
+
+        Criteria left as None are ignored.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage") or None to keep
+                the order the properties were added in.
+            sorting_type (str): The sorting type ("ascending" or "descending").
+            limit (int): The maximum number of properties to return or None for no limit.
+            offset (int): The number of leading matching properties to skip.
+
+        Returns:
+            SQLitePropertyRows: The matching properties.
+
+        Raises:
+            ValueError: If the sorting attribute is not supported.
+        """
+        if sorting_attribute is not None and sorting_attribute not in SORTING_KEYS:
+            raise ValueError(
+                f"{__name__}: Cannot sort by {sorting_attribute}")
+
+        condition, parameters = self._build_condition(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage)
+        order = "position" if sorting_attribute is None else self._build_order(sorting_attribute, sorting_type)
+        return SQLitePropertyRows(self, condition, parameters, order, offset=offset, limit=limit)
+
+    def count(
+            self,
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None):
+        """
+        Counts the properties matching all the given criteria.
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            int: The number of matching properties.
+        """
+        return self._count_rows(*self._build_condition(
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_square_footage,
+            max_square_footage))
+
+    def _open_connection(self):
+        """
+        Opens a new connection to the database. (protected method)
+
+        Returns:
+            sqlite3.Connection: The connection, in autocommit mode so transactions are started explicitly.
+        """
+        connection = sqlite3.connect(
+            self._database,
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            uri=self._uri)
+        if not self._uri:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    @contextmanager
+    def _connect(self):
+        """
+        Borrows a connection from the pool of the process, opening a new one if none is idle. (protected method)
+
+        A forked process starts with an empty pool instead of sharing the connections of its parent.
+
+        Yields:
+            sqlite3.Connection: The connection, used by a single thread until it is given back.
+        """
+        with self._pool_lock:
+            if self._pool_pid != os.getpid():
+                self._pool = queue.LifoQueue()
+                self._pool_pid = os.getpid()
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                connection = None
+
+        if connection is None:
+            connection = self._open_connection()
+        try:
+            yield connection
+        finally:
+            with self._pool_lock:
+                if self._pool_pid == os.getpid() and self._pool.qsize() < self._pool_size:
+                    self._pool.put(connection)
+                    connection = None
+            if connection is not None:
+                connection.close()
+
+    @contextmanager
+    def _connect_for_reading(self):
+        """
+        Gets the connection of the read transaction of the calling thread (see consistent_reads) or borrows one
+        from the pool outside of it. (protected method)
+
+        Yields:
+            sqlite3.Connection: The connection.
+        """
+        connection = getattr(self._reading, "connection", None)
+        if connection is not None:
+            yield connection
+            return
+
+        with self._connect() as connection:
+            yield connection
+
+    @staticmethod
+    def _build_condition(
+            location=None,
+            property_type=None,
+            min_price=None,
+            max_price=None,
+            min_square_footage=None,
+            max_square_footage=None):
+        """
+        Builds the SQL condition matching all the given criteria. (protected method)
+
+        Args:
+            location (str): The location to filter by.
+            property_type (str): The property type to filter by.
+            min_price (int): The minimum price.
+            max_price (int): The maximum price.
+            min_square_footage (int): The minimum square footage.
+            max_square_footage (int): The maximum square footage.
+
+        Returns:
+            tuple: The condition and the values of its parameters.
+        """
+        criteria = (
+            ("location_key = ?", None if location is None else location.casefold()),
+            ("property_type_key = ?", None if property_type is None else property_type.casefold()),
+            ("price >= ?", min_price),
+            ("price <= ?", max_price),
+            ("square_footage >= ?", min_square_footage),
+            ("square_footage <= ?", max_square_footage))
+
+        conditions = [condition for condition, value in criteria if value is not None]
+        parameters = tuple(value for _, value in criteria if value is not None)
+        return " AND ".join(conditions) or "1", parameters
+
+    @staticmethod
+    def _build_order(sorting_attribute, sorting_type):
+        """
+        Builds the SQL ordering by a sorted attribute. Ties are ordered like in PropertyManager.sort_properties.
+        (protected method)
+
+        Args:
+            sorting_attribute (str): The attribute to sort by ("price" or "square_footage").
+            sorting_type (str): The sorting type ("ascending" or "descending").
+
+        Returns:
+            str: The ordering.
+        """
+        if sorting_type == "descending":
+            return f"{sorting_attribute} DESC, position DESC"
+        return f"{sorting_attribute}, position"
+
+    def _count_rows(self, condition, parameters):
+        """
+        Counts the properties matching an SQL condition. (protected method)
+
+        Args:
+            condition (str): The SQL condition.
+            parameters (tuple): The values of the parameters of the condition.
+
+        Returns:
+            int: The number of matching properties.
+        """
+        with self._connect_for_reading() as connection:
+            return connection.execute(
+                f"SELECT COUNT(*) FROM properties WHERE {condition}", parameters).fetchone()[0]
+
+    def _select_rows(self, condition, parameters, order, limit=None, offset=0):
+        """
+        Streams the properties matching an SQL condition. (protected method)
+
+        The fetched rows are counted as rows returned by "select" (see PropertyManager.set_metrics). The rows
+        scanned are not counted, since SQLite examines them inside the database.
+
+        Args:
+            condition (str): The SQL condition.
+            parameters (tuple): The values of the parameters of the condition.
+            order (str): The SQL ordering.
+            limit (int): The maximum number of properties or None for no limit.
+            offset (int): The number of leading matching properties to skip.
+
+        Yields:
+            Property: The matching properties.
+        """
+        with self._connect_for_reading() as connection:
+            cursor = connection.execute(
+                f"SELECT id, {', '.join(PROPERTY_COLUMNS)} FROM properties WHERE {condition} "
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                (*parameters, -1 if limit is None else limit, offset))
+            fetched = 0
+            try:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                while rows:
+                    fetched += len(rows)
+                    for row in rows:
+                        yield self._create_property(
+                            {name: value for name, value in zip(("id",) + PROPERTY_COLUMNS, row)
+                             if value is not None})
+                    rows = cursor.fetchmany(FETCH_SIZE)
+            finally:
+                cursor.close()
+                self._record_rows("select", None, fetched)
+
+    def _insert_properties(self, connection, properties_to_add):
+        """
+        Inserts properties inside the current transaction. (protected method)
+
+        Args:
+            connection (sqlite3.Connection): The connection running the transaction.
+            properties_to_add (list): The properties to insert.
+
+        Raises:
+            Exception: If any of the given objects is not an instance of Property.
+            ValueError: If any of the given properties has the same ID as another property.
+        """
+        self._check_new_properties(properties_to_add, lambda property_id: False)
+
+        rows = []
+        for property_to_add in properties_to_add:
+            property_dict = property_to_add.to_dict()
+            rows.append((
+                property_to_add.get_id(),
+                property_dict["property_type"].casefold(),
+                property_dict["location"].casefold(),
+                *(property_dict.get(name) for name in PROPERTY_COLUMNS)))
+
+        try:
+            connection.executemany(
+                f"INSERT INTO properties (id, property_type_key, location_key, {', '.join(PROPERTY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(PROPERTY_COLUMNS) + 3))})",
+                rows)
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"{__name__}: Duplicate property ID ({e})")
+
+    @staticmethod
+    def _delete_properties(connection, property_ids):
+        """
+        Deletes properties by their IDs inside the current transaction. (protected method)
+
+        Args:
+            connection (sqlite3.Connection): The connection running the transaction.
+            property_ids (list): The IDs of the properties. Unknown IDs are skipped.
+
+        Returns:
+            int: The number of deleted properties.
+        """
+        deleted = 0
+        for start in range(0, len(property_ids), MAX_IDS_PER_QUERY):
+            chunk = property_ids[start:start + MAX_IDS_PER_QUERY]
+            deleted += connection.execute(
+                f"DELETE FROM properties WHERE id IN ({', '.join('?' * len(chunk))})", chunk).rowcount
+        return deleted
+
+    @staticmethod
+    def _increment_version(connection):
+        """
+        Increments the catalog version inside the current transaction. (protected method)
+
+        Args:
+            connection (sqlite3.Connection): The connection running the transaction.
+        """
+        connection.execute(
+            "UPDATE metadata SET value = CAST(value AS INTEGER) + 1 WHERE key = 'version'")
@@ -0,0 +1,109 @@
+"""
+SQLitePropertyRows Class
+
+This file defines the SQLitePropertyRows class, a read-only sequence of the properties selected by an SQL query
+of a SQLitePropertyManager. Its length is counted by the database and only the accessed slice of the result
+is fetched (with LIMIT and OFFSET), so a filter result is never loaded as a whole to render one page of it.
+Iterating over it streams the whole result.
+"""
+
+from collections.abc import Sequence
+
+
+class SQLitePropertyRows(Sequence):
+    def __init__(
+            self,
+            property_manager,
+            condition="1",
+            parameters=(),
+            order="position",
+            offset=0,
+            limit=None):
+        """
+        Initializes a SQLitePropertyRows object.
+
+        Args:
+            property_manager (SQLitePropertyManager): The manager whose database is queried.
+            condition (str): The SQL condition selecting the properties.
+            parameters (tuple): The values of the parameters of the condition.
+            order (str): The SQL ordering of the properties.
+            offset (int): The number of leading selected properties to skip.
+            limit (int): The maximum number of listed properties or None for no limit.
+        """
+        self._property_manager = property_manager
+        self._condition = condition
+        self._parameters = tuple(parameters)
+        self._order = order
+        self._offset = offset
+        self._limit = limit
+        self._length = None
+
+    def __len__(self):
+        """
+        Gets the number of listed properties. The number is counted once.
+
+        Returns:
+            int: The number of listed properties.
+        """
+        if self._length is None:
+            length = max(self._property_manager._count_rows(
+                self._condition, self._parameters) - self._offset, 0)
+            self._length = length if self._limit is None else min(length, self._limit)
+
+        return self._length
+
+    def __getitem__(self, index):
+        """
+        Gets the property at a position or a list of the properties in a slice.
+
+        Args:
+            index (int|slice): The position or the slice.
+
+        Returns:
+            Property|list: The property or the list of properties.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            return list(self._fetch(start, max(stop - start, 0)))
+
+        if index < 0:
+            index += len(self)
+        if index < 0 or (self._limit is not None and index >= self._limit):
+            raise IndexError("SQLitePropertyRows index out of range")
+
+        properties = list(self._fetch(index, 1))
+        if not properties:
+            raise IndexError("SQLitePropertyRows index out of range")
+        return properties[0]
+
+    def __iter__(self):
+        """
+        Streams the listed properties from the database.
+
+        Yields:
+            Property: The consecutive properties.
+        """
+        return self._fetch(0, self._limit)
+
+    def _fetch(self, start, count):
+        """
+        Fetches a range of the listed properties. (protected method)
+
+        Args:
+            start (int): The position of the first property.
+            count (int): The number of properties or None for all the remaining ones.
+
+        Returns:
+            Iterator: The properties.
+        """
+        if self._limit is not None:
+            remaining = max(self._limit - start, 0)
+            count = remaining if count is None else min(count, remaining)
+
+        return self._property_manager._select_rows(
+            self._condition, self._parameters, self._order, limit=count, offset=self._offset + start)
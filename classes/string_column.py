@@ -0,0 +1,109 @@
+"""
+StringColumn Class
+
+This file defines the StringColumn class, a read-only sequence of strings stored as one UTF-8 buffer and the
+offsets of the strings in it. The string columns of a snapshot are read as StringColumn objects over the
+memory-mapped file, so the strings are shared by every process mapping the snapshot and a str object is only
+created for the strings that are accessed.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+# The typecode of the offsets (8 bytes, so the buffer can exceed 4 GiB)
+OFFSET_TYPECODE = "q"
+
+
+class StringColumn(Sequence):
+    def __init__(self, offsets, data):
+        """
+        Initializes a StringColumn object.
+
+        Args:
+            offsets (array|memoryview): The start of every string in the buffer followed by the end of the last one.
+            data (bytes|memoryview): The UTF-8 encoded strings, one after another.
+        """
+        self._offsets = offsets
+        self._data = memoryview(data)
+
+    @staticmethod
+    def encode(strings):
+        """
+        Encodes strings as the offsets and the buffer of a StringColumn.
+
+        Args:
+            strings (Iterable): The strings.
+
+        Returns:
+            tuple: The offsets (as a typed array) and the buffer (as bytes).
+        """
+        offsets = array(OFFSET_TYPECODE, [0])
+        chunks = []
+        end = 0
+        for string in strings:
+            chunk = string.encode("utf-8")
+            chunks.append(chunk)
+            end += len(chunk)
+            offsets.append(end)
+
+        return offsets, b"".join(chunks)
+
+    def __len__(self):
+        """
+        Gets the number of strings.
+
+        Returns:
+            int: The number of strings.
+        """
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        """
+        Gets the string at a position or a list of the strings in a slice.
+
+        Args:
+            index (int|slice): The position or the slice.
+
+        Returns:
+            str|list: The decoded string or the list of strings.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StringColumn index out of range")
+
+        return self._data[self._offsets[index]:self._offsets[index + 1]].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        """
+        Iterates over the strings.
+
+        Yields:
+            str: The decoded strings, in order.
+        """
+        data = self._data
+        for start, end in zip(self._offsets, self._offsets[1:]):
+            yield data[start:end].tobytes().decode("utf-8")
+
+    def take(self, positions):
+        """
+        Gets the strings at many positions at once, several times faster than reading them one by one.
+
+        Args:
+            positions (Iterable): The positions, which must not be negative.
+
+        Returns:
+            list: The decoded strings.
+
+        Raises:
+            IndexError: If a position is out of range.
+        """
+        data = self._data
+        offsets = self._offsets
+        return [data[offsets[position]:offsets[position + 1]].tobytes().decode("utf-8") for position in positions]
@@ -0,0 +1,319 @@
+"""
+Shared Unit Tests for the Storage Engines
+
+This file contains the unit tests every storage engine of the property catalog has to pass (PropertyManager,
+ColumnarPropertyManager and SQLitePropertyManager), so the engines can be swapped without changing the results.
+The test module of every engine runs them by mixing PropertyManagerContractTests into its TestCase.
+"""
+
+import json
+import os
+import tempfile
+from unittest import mock
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+
+
+class PropertyManagerContractTests:
+    """
+    Test cases shared by the storage engines, mixed into a unittest.TestCase defining create_property_manager.
+    """
+
+    def create_property_manager(self):
+        """
+        Creates an empty catalog of the tested storage engine.
+
+        Returns:
+            PropertyManager: The empty catalog.
+        """
+        raise NotImplementedError
+
+    def setUp(self):
+        """
+        Sets up a catalog of the tested storage engine holding a small catalog.
+        """
+        self.property_manager = self.create_property_manager()
+        self.addCleanup(self.property_manager.close)
+        self.apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Sofia",
+            price=150000,
+            square_footage=1100,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=3
+        )
+        self.apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Sofia",
+            price=250000,
+            square_footage=1400,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=7
+        )
+        self.apartment3 = Apartment(
+            name="Apartment 3",
+            property_type="Apartment",
+            location="Varna",
+            price=120000,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=2
+        )
+        self.house1 = House(
+            name="House 1",
+            property_type="House",
+            location="sofia",
+            price=180000,
+            square_footage=2000,
+            num_of_bedrooms=4,
+            num_of_bathrooms=2,
+            num_of_floors=2
+        )
+        self.commercial_space1 = CommercialSpace(
+            name="Commercial Space 1",
+            property_type="Commercial Space",
+            location="Sofia",
+            price=190000,
+            square_footage=1050,
+            business_type="Office"
+        )
+        self.property_manager._add_properties([
+            self.apartment1,
+            self.apartment2,
+            self.apartment3,
+            self.house1,
+            self.commercial_space1])
+
+    def assert_properties(self, properties, expected):
+        """
+        Asserts that the given properties are the expected ones, in the same order.
+
+        Args:
+            properties (Sequence): The properties returned by the manager.
+            expected (list): The expected properties.
+        """
+        self.assertEqual([prop.get_id() for prop in properties], [
+                         prop.get_id() for prop in expected])
+
+    def test_get_properties(self):
+        """
+        Tests the get_properties method.
+        """
+        properties = self.property_manager.get_properties()
+        self.assertEqual(len(properties), 5)
+        self.assertEqual(properties[3].to_dict(), self.house1.to_dict())
+
+    def test_get_by_ids(self):
+        """
+        Tests the get_by_id and get_by_ids methods.
+        """
+        self.assertEqual(self.property_manager.get_by_id(
+            self.house1.get_id()).to_dict(), self.house1.to_dict())
+        self.assertIsNone(self.property_manager.get_by_id("unknown-id"))
+        self.assert_properties(
+            self.property_manager.get_by_ids(
+                [self.apartment3.get_id(), "unknown-id", self.apartment1.get_id()]),
+            [self.apartment3, self.apartment1])
+
+    def test_add_property_invalid(self):
+        """
+        Tests the _add_property method with invalid data.
+        """
+        with self.assertRaises(Exception):
+            self.property_manager._add_property({"name": "Not a property"})
+
+    def test_add_property_duplicate_id(self):
+        """
+        Tests that the _add_property method rejects an ID that is already in the catalog.
+        """
+        with self.assertRaises(ValueError):
+            self.property_manager._add_property(self.house1)
+        self.assertEqual(len(self.property_manager.get_properties()), 5)
+
+    def test_read_properties_from_json(self):
+        """
+        Tests the read_properties_from_json method.
+        """
+        records = [self.apartment1.to_dict(), self.house1.to_dict(),
+                   self.commercial_space1.to_dict()]
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "properties.json")
+            with open(path_to_file, "w") as json_file:
+                json.dump(records, json_file)
+
+            property_manager = self.create_property_manager()
+            self.addCleanup(property_manager.close)
+            property_manager.read_properties_from_json(path_to_file)
+
+        self.assertEqual([prop.to_dict()
+                         for prop in property_manager.get_properties()], records)
+
+    @mock.patch("classes.parallel_property_reader.MIN_SHARD_SIZE", 100)
+    def test_read_properties_from_json_lines_in_parallel(self):
+        """
+        Tests that a JSON Lines file read by several processes gives the same properties in the same order.
+        """
+        records = [self.apartment1.to_dict(), self.house1.to_dict(), self.commercial_space1.to_dict(),
+                   self.apartment2.to_dict(), self.apartment3.to_dict()]
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "properties.jsonl")
+            with open(path_to_file, "w") as json_file:
+                json_file.write("\n".join(json.dumps(record) for record in records))
+
+            property_manager = self.create_property_manager()
+            self.addCleanup(property_manager.close)
+            property_manager.read_properties_from_json(path_to_file, workers=2)
+
+            self.assertEqual([prop.to_dict()
+                             for prop in property_manager.get_properties()], records)
+            self.assertEqual(len(property_manager.filter_by_location("sofia")), 4)
+
+    def test_filter_by_location(self):
+        """
+        Tests the filter_by_location method.
+        """
+        self.assert_properties(
+            self.property_manager.filter_by_location("SOFIA"),
+            [self.apartment1, self.apartment2, self.house1, self.commercial_space1])
+        self.assert_properties(
+            self.property_manager.filter_by_location("Burgas"), [])
+
+    def test_filter_by_property_type(self):
+        """
+        Tests the filter_by_property_type method.
+        """
+        self.assert_properties(
+            self.property_manager.filter_by_property_type("house"), [self.house1])
+
+    def test_filter_by_price(self):
+        """
+        Tests the filter_by_price method.
+        """
+        self.assert_properties(
+            self.property_manager.filter_by_price(150000, 190000),
+            [self.apartment1, self.house1, self.commercial_space1])
+        self.assert_properties(
+            self.property_manager.filter_by_price(200000, None), [self.apartment2])
+
+    def test_filter_by_square_footage(self):
+        """
+        Tests the filter_by_square_footage method.
+        """
+        self.assert_properties(
+            self.property_manager.filter_by_square_footage(1200, 1500),
+            [self.apartment3, self.apartment2])
+
+    def test_sort_properties(self):
+        """
+        Tests the sort_properties method with and without paging.
+        """
+        self.assert_properties(
+            self.property_manager.sort_properties("price", "ascending"),
+            [self.apartment3, self.apartment1, self.house1, self.commercial_space1, self.apartment2])
+        self.assert_properties(
+            self.property_manager.sort_properties(
+                "square_footage", "descending", limit=2, offset=1),
+            [self.apartment2, self.apartment3])
+
+    def test_sort_properties_after_adding(self):
+        """
+        Tests that sorting sees a property added after the catalog was sorted.
+        """
+        self.property_manager.sort_properties("price", "ascending")
+        apartment4 = Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Varna",
+            price=100,
+            square_footage=10,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+        self.property_manager._add_property(apartment4)
+        self.assert_properties(
+            self.property_manager.sort_properties(
+                "price", "ascending", limit=1),
+            [apartment4])
+
+    def test_query(self):
+        """
+        Tests the query and count methods with combined criteria.
+        """
+        self.assert_properties(
+            self.property_manager.query(
+                location="sofia", property_type="Apartment", max_price=200000, min_square_footage=1000),
+            [self.apartment1])
+        self.assert_properties(
+            self.property_manager.query(
+                location="Sofia", sorting_attribute="price", sorting_type="descending", limit=2),
+            [self.apartment2, self.commercial_space1])
+        self.assertEqual(self.property_manager.count(), 5)
+        self.assertEqual(self.property_manager.count(min_price=180000), 3)
+
+    def test_query_offset(self):
+        """
+        Tests the query method with an offset.
+        """
+        self.assert_properties(
+            self.property_manager.query(
+                location="Sofia", sorting_attribute="price", sorting_type="descending", limit=2, offset=1),
+            [self.commercial_space1, self.house1])
+        self.assert_properties(
+            self.property_manager.query(location="Sofia", offset=3), [self.commercial_space1])
+
+    def test_query_invalid_sorting_attribute(self):
+        """
+        Tests the query method with an unsupported sorting attribute.
+        """
+        with self.assertRaises(ValueError):
+            self.property_manager.query(sorting_attribute="name")
+
+    def test_query_tie_order(self):
+        """
+        Tests that properties with equal values are listed in the order they were added when sorting in ascending
+        order and in the reverse order when sorting in descending order, and that unsorted queries keep the order
+        the properties were added in, whichever criterion the engine starts from.
+        """
+        property_manager = self.create_property_manager()
+        self.addCleanup(property_manager.close)
+        added = [CommercialSpace(
+            name=f"Commercial Space {number}",
+            property_type="Commercial Space",
+            location=("Sofia", "Varna")[number % 2],
+            price=(300, 100, 200)[number % 3],
+            square_footage=(20, 10)[number % 2 ^ number // 4 % 2],
+            business_type="Office"
+        ) for number in range(12)]
+        property_manager._add_properties(added)
+
+        def expected(criterion, sorting_attribute=None, sorting_type="ascending"):
+            matching = [prop for prop in added if criterion(prop)]
+            if sorting_attribute is None:
+                return matching
+            ordered = sorted(matching, key=lambda prop: prop.to_dict()[sorting_attribute])
+            return ordered[::-1] if sorting_type == "descending" else ordered
+
+        for criteria, criterion in (
+                ({}, lambda prop: True),
+                ({"location": "sofia"}, lambda prop: prop.get_location() == "Sofia"),
+                ({"min_price": 150}, lambda prop: prop.get_price() >= 150),
+                ({"max_square_footage": 10}, lambda prop: prop.get_square_footage() <= 10),
+                ({"min_price": 150, "location": "Varna"},
+                 lambda prop: prop.get_price() >= 150 and prop.get_location() == "Varna")):
+            for sorting_attribute in (None, "price", "square_footage"):
+                for sorting_type in ("ascending", "descending"):
+                    with self.subTest(criteria=criteria, sorting_attribute=sorting_attribute,
+                                      sorting_type=sorting_type):
+                        matching = expected(criterion, sorting_attribute, sorting_type)
+                        for limit, offset in ((None, 0), (1, 0), (2, 1)):
+                            stop = None if limit is None else offset + limit
+                            self.assert_properties(property_manager.query(
+                                **criteria, sorting_attribute=sorting_attribute, sorting_type=sorting_type,
+                                limit=limit, offset=offset), matching[offset:stop])
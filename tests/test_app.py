@@ -0,0 +1,197 @@
+"""
+Unit Tests for the Flask App
+
+This file contains unit tests for the routes of the app, served through the Flask test client.
+The app is imported with a configuration keeping every file it writes in a temporary directory, and every test
+serves its own catalog through a CatalogReloader of its own.
+"""
+
+import configparser
+import importlib
+import json
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+from classes.catalog_reloader import CatalogReloader
+from classes.request_metrics import RequestMetrics
+from classes.request_profiler import RequestProfiler
+from classes.sqlite_property_manager import SQLitePropertyManager
+
+app_module = None
+app_directory = None
+
+
+def setUpModule():
+    """
+    Imports the app configured to read an empty catalog from a temporary directory and not to watch for reloads.
+    """
+    global app_module, app_directory
+    app_directory = tempfile.TemporaryDirectory()
+    path_to_catalog = os.path.join(app_directory.name, "properties.json")
+    with open(path_to_catalog, "w", encoding="utf-8") as catalog_file:
+        catalog_file.write("[]")
+
+    config = configparser.ConfigParser()
+    config["FILES"] = {
+        "Input": path_to_catalog,
+        "Output": os.path.join(app_directory.name, "exports", "selected_properties.json"),
+        "Deltas": ""
+    }
+    config["STORAGE"] = {"Engine": "memory", "Snapshot": ""}
+    config["PROFILING"] = {"Enabled": "false"}
+    config["RELOAD"] = {"Watch": "false", "Signal": ""}
+    path_to_config = os.path.join(app_directory.name, "config.ini")
+    with open(path_to_config, "w", encoding="utf-8") as config_file:
+        config.write(config_file)
+
+    with mock.patch.dict(os.environ, {"PROPERTY_APP_CONFIG": path_to_config}):
+        app_module = importlib.import_module("app")
+
+
+def tearDownModule():
+    """
+    Removes the temporary directory of the app.
+    """
+    app_directory.cleanup()
+
+
+class TestApp(unittest.TestCase):
+    """
+    Test cases for the routes of the app.
+    """
+
+    def setUp(self):
+        """
+        Sets up a catalog file with a few properties, served from SQLite catalogs loaded anew on every reload.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.path_to_file = os.path.join(self.temporary_directory.name, "properties.json")
+        records = [{
+            "name": f"Commercial Space {number}",
+            "property_type": "Commercial Space",
+            "location": ("Sofia", "Varna")[number % 2],
+            "price": 1000 * (-number % 6 + 1),
+            "square_footage": 100 + 10 * (number % 3),
+            "business_type": "Office"
+        } for number in range(6)]
+        with open(self.path_to_file, "w") as json_file:
+            json.dump(records, json_file)
+
+        self.loaded_managers = []
+        self.catalog_reloader = CatalogReloader(self.load_catalog, self.path_to_file)
+        self.addCleanup(lambda: self.catalog_reloader.get_manager().close())
+        patcher = mock.patch.object(app_module, "catalog_reloader", self.catalog_reloader)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        app_module.page_cache.clear()
+        self.client = app_module.app.test_client()
+
+    def load_catalog(self):
+        """
+        Loads the catalog file into a new SQLite database.
+
+        Returns:
+            SQLitePropertyManager: The loaded property manager.
+        """
+        property_manager = SQLitePropertyManager(os.path.join(
+            self.temporary_directory.name, f"properties-{len(self.loaded_managers)}.sqlite3"))
+        property_manager.read_properties_from_json(self.path_to_file)
+        self.loaded_managers.append(property_manager)
+        return property_manager
+
+    def test_streamed_response_keeps_catalog_pinned(self):
+        """
+        Tests that a catalog replaced while a streamed API response is being produced stays open until its end.
+        """
+        response = self.client.get("/api/properties?sorting_attribute=price", buffered=False)
+        chunks = iter(response.response)
+        body = next(chunks)
+
+        with mock.patch.object(self.loaded_managers[0], "close", wraps=self.loaded_managers[0].close) as close:
+            self.catalog_reloader.reload()
+            self.assertIsNot(self.catalog_reloader.get_manager(), self.loaded_managers[0])
+            body += next(chunks)
+            close.assert_not_called()
+            body += b"".join(chunks)
+            response.close()
+            close.assert_called_once()
+
+        document = json.loads(body)
+        self.assertEqual(document["total"], 6)
+        self.assertEqual([prop["price"] for prop in document["data"]], [1000, 2000, 3000, 4000, 5000, 6000])
+
+    def test_page_after_last_page(self):
+        """
+        Tests that the last page of a listing is rendered and that a page after it is not found.
+        """
+        for path, showing in (("/?limit=4", "Showing 5-6 of 6"),
+                              ("/search?location=sofia&limit=2", "Showing 3-3 of 3"),
+                              ("/search?sorting_attribute=price&limit=4", "Showing 5-6 of 6")):
+            with self.subTest(path=path):
+                self.assertIn(showing, self.client.get(f"{path}&page=2").get_data(as_text=True))
+                self.assertEqual(self.client.get(f"{path}&page=3").status_code, 404)
+                self.assertEqual(self.client.get(f"{path}&page=100").status_code, 404)
+
+        response = self.client.post("/sort", data={
+            "sorting_attribute": "price", "sorting_type": "descending", "limit": "4", "page": "2"})
+        self.assertIn("Showing 5-6 of 6", response.get_data(as_text=True))
+        self.assertEqual(self.client.post("/sort", data={
+            "sorting_attribute": "price", "sorting_type": "descending", "limit": "4", "page": "3"}).status_code, 404)
+
+    def test_export_keeps_listing_order(self):
+        """
+        Tests that exporting a listing ordered by the range it filters by keeps that order, and that the export
+        query is measured.
+        """
+        request_metrics = RequestMetrics()
+        with mock.patch.object(app_module, "request_metrics", request_metrics):
+            for path, data, attribute, expected in (
+                    ("/filter_by_price", {"min_price": "2000", "max_price": ""}, "price", [5, 4, 3, 2, 1]),
+                    ("/filter_by_square_footage", {"min_square_footage": "110", "max_square_footage": ""},
+                     "square_footage", [1, 4, 2, 5])):
+                with self.subTest(path=path):
+                    page = self.client.post(path, data=data).get_data(as_text=True)
+                    export_form = page[page.index('action="/export"'):]
+                    export_form = export_form[:export_form.index("</form>")]
+                    export_data = dict(re.findall(r'type="hidden" name="([^"]+)" value="([^"]*)"', export_form))
+                    self.assertEqual(export_data["sorting_attribute"], attribute)
+
+                    response = self.client.post("/export", data={**export_data, "format": "jsonl"})
+                    path_to_file = re.search(r"Path to file: <strong>([^<]+)</strong>",
+                                             response.get_data(as_text=True)).group(1)
+                    with open(path_to_file, encoding="utf-8") as json_lines_file:
+                        self.assertEqual([json.loads(line)["name"] for line in json_lines_file],
+                                         [f"Commercial Space {number}" for number in expected])
+
+        self.assertEqual(request_metrics.get_count("export", "query"), 2)
+
+    def test_streamed_response_measured_until_its_end(self):
+        """
+        Tests that the duration and the profile of a streamed API response include producing its body.
+        """
+        request_metrics = RequestMetrics()
+        path_to_profiles = os.path.join(self.temporary_directory.name, "profiles")
+        request_profiler = RequestProfiler(path_to_profiles, sample_rate=1)
+        with mock.patch.object(app_module, "request_metrics", request_metrics), \
+                mock.patch.object(app_module, "request_profiler", request_profiler):
+            response = self.client.get("/api/properties", buffered=False)
+            chunks = iter(response.response)
+            next(chunks)
+            self.assertEqual(request_metrics.get_count("api_properties", "total"), 0)
+            self.assertFalse(os.path.exists(path_to_profiles))
+            b"".join(chunks)
+            response.close()
+
+        self.assertEqual(request_metrics.get_count("api_properties", "total"), 1)
+        self.assertEqual(request_metrics.get_count("api_properties", "serialize"), 1)
+        names = [name for name in os.listdir(path_to_profiles) if name.endswith(".json")]
+        self.assertEqual(len(names), 1)
+        with open(os.path.join(path_to_profiles, names[0]), encoding="utf-8") as metadata_file:
+            self.assertIn("serialize", json.load(metadata_file)["phases"])
+
+
+if __name__ == '__main__':
+    unittest.main()
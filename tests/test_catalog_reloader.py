@@ -0,0 +1,316 @@
+"""
+Unit Tests for the CatalogReloader Class
+
+This file contains unit tests for the CatalogReloader class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import os
+import random
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from classes.catalog_reloader import CatalogReloader
+from classes.commercial_space import CommercialSpace
+from classes.columnar_property_manager import ColumnarPropertyManager
+from classes.property_manager import PropertyManager
+from classes.sqlite_property_manager import SQLitePropertyManager
+
+
+class TestCatalogReloader(unittest.TestCase):
+    """
+    Test cases for the CatalogReloader class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a catalog file with one property and a reloader of it.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.path_to_file = os.path.join(self.temporary_directory.name, "properties.json")
+        self.write_catalog(1)
+        self.reloaded = threading.Event()
+        self.catalog_reloader = CatalogReloader(
+            self.load_catalog, self.path_to_file, on_reload=self.reloaded.set)
+        self.addCleanup(self.catalog_reloader.stop)
+
+    def write_catalog(self, count):
+        """
+        Writes a catalog file with the given number of properties.
+
+        Args:
+            count (int): The number of properties.
+        """
+        records = [{
+            "name": f"Commercial Space {number}",
+            "property_type": "Commercial Space",
+            "location": "Sofia",
+            "price": 1000 * number,
+            "square_footage": 100,
+            "business_type": "Office"
+        } for number in range(count)]
+        with open(self.path_to_file, "w") as json_file:
+            json.dump(records, json_file)
+
+    def load_catalog(self):
+        """
+        Loads the catalog file into a new PropertyManager.
+
+        Returns:
+            PropertyManager: The loaded catalog.
+        """
+        property_manager = PropertyManager()
+        property_manager.read_properties_from_json(self.path_to_file)
+        return property_manager
+
+    def test_initial_catalog(self):
+        """
+        Tests that the first catalog is loaded when the reloader is created.
+        """
+        generation, property_manager = self.catalog_reloader.get_current()
+        self.assertEqual(generation, 0)
+        self.assertEqual(len(property_manager.get_properties()), 1)
+        self.assertIs(self.catalog_reloader.get_manager(), property_manager)
+
+    def test_reload(self):
+        """
+        Tests that a reload swaps in a new catalog and leaves the previous one unchanged.
+        """
+        previous_manager = self.catalog_reloader.get_manager()
+        self.write_catalog(3)
+
+        self.assertTrue(self.catalog_reloader.reload())
+        generation, property_manager = self.catalog_reloader.get_current()
+        self.assertEqual(generation, 1)
+        self.assertEqual(len(property_manager.get_properties()), 3)
+        self.assertEqual(len(previous_manager.get_properties()), 1)
+        self.assertTrue(self.reloaded.is_set())
+
+    def test_reload_failure_keeps_catalog(self):
+        """
+        Tests that the current catalog is kept when the new one cannot be loaded.
+        """
+        previous_manager = self.catalog_reloader.get_manager()
+        with open(self.path_to_file, "w") as json_file:
+            json_file.write("[{")
+
+        self.assertFalse(self.catalog_reloader.reload())
+        self.assertEqual(self.catalog_reloader.get_current(), (0, previous_manager))
+        self.assertFalse(self.reloaded.is_set())
+
+    def test_request_reload(self):
+        """
+        Tests that a requested reload is run by the background thread.
+        """
+        self.catalog_reloader.start()
+        self.write_catalog(2)
+        self.catalog_reloader.request_reload()
+
+        self.assertTrue(self.reloaded.wait(5))
+        self.assertEqual(len(self.catalog_reloader.get_manager().get_properties()), 2)
+
+    def test_watch_file(self):
+        """
+        Tests that the background thread reloads the catalog when the file changes.
+        """
+        self.catalog_reloader.start(poll_interval=0.01)
+        self.write_catalog(4)
+
+        self.assertTrue(self.reloaded.wait(5))
+        self.assertEqual(len(self.catalog_reloader.get_manager().get_properties()), 4)
+
+    def test_watch_other_path(self):
+        """
+        Tests that the background thread reloads the catalog when a file is added to a watched directory.
+        """
+        path_to_directory = os.path.join(self.temporary_directory.name, "deltas")
+        os.mkdir(path_to_directory)
+        catalog_reloader = CatalogReloader(
+            self.load_catalog, self.path_to_file, on_reload=self.reloaded.set, watched_paths=(path_to_directory,))
+        self.addCleanup(catalog_reloader.stop)
+        catalog_reloader.start(poll_interval=0.01)
+        with open(os.path.join(path_to_directory, "delta.json"), "w") as json_file:
+            json_file.write("[]")
+
+        self.assertTrue(self.reloaded.wait(5))
+        self.assertEqual(catalog_reloader.get_current()[0], 1)
+
+    def test_install_signal_handler_unknown_signal(self):
+        """
+        Tests that an unknown signal is not installed.
+        """
+        self.assertFalse(self.catalog_reloader.install_signal_handler("SIGNOTHING"))
+
+    def test_fork_hook_registered_once(self):
+        """
+        Tests that starting the reloader again after stopping it does not register another fork hook.
+        """
+        with mock.patch("os.register_at_fork") as register_at_fork:
+            for _ in range(3):
+                self.catalog_reloader.start()
+                self.catalog_reloader.stop()
+
+        register_at_fork.assert_called_once()
+
+    def test_close_replaced_catalog(self):
+        """
+        Tests that a replaced catalog is closed at once without readers and otherwise when its last reader
+        releases it.
+        """
+        previous_manager = self.catalog_reloader.get_manager()
+        with mock.patch.object(previous_manager, "close") as close:
+            self.catalog_reloader.reload()
+            close.assert_called_once()
+
+        generation, acquired_manager = self.catalog_reloader.acquire()
+        self.assertEqual(generation, 1)
+        self.catalog_reloader.acquire()
+        with mock.patch.object(acquired_manager, "close") as close:
+            self.catalog_reloader.release(acquired_manager)
+            self.catalog_reloader.reload()
+            close.assert_not_called()
+            self.catalog_reloader.release(acquired_manager)
+            close.assert_called_once()
+
+        current_manager = self.catalog_reloader.get_manager()
+        self.catalog_reloader.acquire()
+        with mock.patch.object(current_manager, "close") as close:
+            self.catalog_reloader.release(current_manager)
+            close.assert_not_called()
+
+    def test_update_in_place_keeps_catalog_open(self):
+        """
+        Tests that a catalog changed in place, as SQLite catalogs are, is not closed when it is swapped in again.
+        """
+        catalog_reloader = CatalogReloader(SQLitePropertyManager, self.path_to_file)
+        property_manager = catalog_reloader.get_manager()
+        self.addCleanup(property_manager.close)
+
+        catalog_reloader.update(lambda catalog: catalog.read_properties_from_json(self.path_to_file))
+
+        self.assertIs(catalog_reloader.get_manager(), property_manager)
+        self.assertEqual(property_manager.count(), 1)
+
+    def test_update(self):
+        """
+        Tests that a change is applied to a copy that is swapped in, leaving the previous catalog unchanged.
+        """
+        previous_manager = self.catalog_reloader.get_manager()
+        property_id = previous_manager.get_properties()[0].get_id()
+
+        self.assertTrue(self.catalog_reloader.update(
+            lambda catalog: catalog.delete_property(property_id)))
+        generation, property_manager = self.catalog_reloader.get_current()
+        self.assertEqual(generation, 1)
+        self.assertEqual(len(property_manager.get_properties()), 0)
+        self.assertEqual(len(previous_manager.get_properties()), 1)
+        self.assertTrue(self.reloaded.is_set())
+
+        with self.assertRaises(ValueError):
+            self.catalog_reloader.update(lambda catalog: catalog.update_property(
+                previous_manager.get_properties()[0]))
+        self.assertIs(self.catalog_reloader.get_manager(), property_manager)
+
+    def test_update_with_concurrent_reads(self):
+        """
+        Stress test: threads reading the current catalog never see a partially applied change while other
+        threads keep changing it, with every storage engine.
+        """
+        for manager_class in (PropertyManager, ColumnarPropertyManager, SQLitePropertyManager):
+            with self.subTest(manager_class=manager_class.__name__):
+                self.run_stress_test(manager_class)
+
+    def run_stress_test(self, manager_class, readers=4, writers=2, changes=25, size=200):
+        """
+        Runs reader and writer threads against one catalog and fails on the first inconsistency a reader sees.
+
+        Every change replaces some properties, deletes as many and adds new ones, so every catalog holds
+        the same number of properties and the same number in every location.
+
+        Args:
+            manager_class (type): The storage engine.
+            readers (int): The number of reader threads.
+            writers (int): The number of writer threads.
+            changes (int): The number of changes made by every writer.
+            size (int): The number of properties in the catalog.
+        """
+        locations = ("Sofia", "Varna")
+
+        def create_property(number, location, property_id=None):
+            return CommercialSpace(
+                name=f"Commercial Space {number}",
+                property_type="Commercial Space",
+                location=location,
+                price=random.randrange(1000, 100000),
+                square_footage=random.randrange(10, 1000),
+                business_type="Office",
+                property_id=property_id)
+
+        def load_catalog():
+            catalog = manager_class()
+            catalog._add_properties([create_property(number, locations[number % 2]) for number in range(size)])
+            return catalog
+
+        catalog_reloader = CatalogReloader(load_catalog, self.path_to_file)
+        self.addCleanup(lambda: catalog_reloader.get_manager().close()
+                        if hasattr(catalog_reloader.get_manager(), "close") else None)
+        errors = []
+        writing = threading.Event()
+        writing.set()
+
+        def change(catalog, number):
+            current = list(catalog.get_properties())
+            chosen = random.sample(current, 4)
+            replaced = [create_property(number, prop.get_location(), prop.get_id()) for prop in chosen[:2]]
+            added = [create_property(number, prop.get_location(), f"{number}-{index}")
+                     for index, prop in enumerate(chosen[2:])]
+            catalog.apply_changes(replaced + added, [prop.get_id() for prop in chosen[2:]])
+
+        def write(writer):
+            try:
+                for number in range(changes):
+                    catalog_reloader.update(lambda catalog: change(catalog, f"{writer}-{number}"))
+            except Exception as e:
+                errors.append(e)
+
+        def read():
+            try:
+                while writing.is_set() and not errors:
+                    _, catalog = catalog_reloader.acquire()
+                    try:
+                        prices = [prop.get_price() for prop in catalog.sort_properties("price", "ascending")]
+                        self.assertEqual(prices, sorted(prices))
+                        self.assertEqual(len(prices), size)
+                        self.assertEqual(catalog.count(), size)
+                        for location in locations:
+                            self.assertEqual(len(catalog.filter_by_location(location)), size // 2)
+                            self.assertEqual(catalog.count(location=location, max_price=100000), size // 2)
+                        page = list(catalog.query(location="sofia", sorting_attribute="square_footage", limit=10))
+                        square_footages = [prop.get_square_footage() for prop in page]
+                        self.assertEqual(square_footages, sorted(square_footages))
+                        self.assertEqual({prop.get_location() for prop in page}, {"Sofia"})
+                    finally:
+                        catalog_reloader.release(catalog)
+            except Exception as e:
+                errors.append(e)
+
+        reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+        writer_threads = [threading.Thread(target=write, args=(writer,)) for writer in range(writers)]
+        for thread in reader_threads + writer_threads:
+            thread.start()
+        for thread in writer_threads:
+            thread.join()
+        writing.clear()
+        for thread in reader_threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(catalog_reloader.get_current()[0], writers * changes)
+        self.assertEqual(catalog_reloader.get_manager().count(), size)
+
+
+if __name__ == '__main__':
+    unittest.main()
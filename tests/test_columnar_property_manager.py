@@ -0,0 +1,148 @@
+"""
+Unit Tests for the ColumnarPropertyManager Class
+
+This file contains unit tests for the ColumnarPropertyManager class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import unittest
+from unittest import mock
+from classes.columnar_property_manager import ColumnarPropertyManager
+from classes.apartment import Apartment
+from classes.request_metrics import RequestMetrics
+from tests.property_manager_contract import PropertyManagerContractTests
+
+
+class TestColumnarPropertyManager(PropertyManagerContractTests, unittest.TestCase):
+    """
+    Test cases for the ColumnarPropertyManager class.
+    """
+
+    def create_property_manager(self):
+        """
+        Creates an empty ColumnarPropertyManager instance.
+
+        Returns:
+            ColumnarPropertyManager: The empty catalog.
+        """
+        return ColumnarPropertyManager()
+
+    def test_apply_changes(self):
+        """
+        Tests that changes update the columns, the cached orders and the cached groups like building them again
+        would.
+        """
+        self.property_manager.sort_properties("price", "ascending")
+        self.property_manager.sort_properties("square_footage", "ascending")
+        self.property_manager.filter_by_location("sofia")
+        self.property_manager.filter_by_property_type("house")
+        updated_apartment3 = Apartment(
+            name="Apartment 3",
+            property_type="Apartment",
+            location="Varna",
+            price=150000,
+            square_footage=900,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=2,
+            property_id=self.apartment3.get_id()
+        )
+        apartment4 = Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Burgas",
+            price=250000,
+            square_footage=1400,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+
+        with mock.patch.object(self.property_manager._columns, "get_groups") as get_groups:
+            self.assertEqual(self.property_manager.apply_changes(
+                [updated_apartment3, apartment4], [self.house1.get_id(), "unknown-id"]), (1, 1, 1))
+            self.assertTrue(self.property_manager.delete_property(self.apartment1.get_id()))
+            self.assert_properties(
+                self.property_manager.filter_by_location("sofia"), [self.apartment2, self.commercial_space1])
+            self.assert_properties(self.property_manager.filter_by_location("burgas"), [apartment4])
+            self.assert_properties(self.property_manager.filter_by_property_type("house"), [])
+            self.assert_properties(
+                self.property_manager.filter_by_property_type("apartment"),
+                [self.apartment2, updated_apartment3, apartment4])
+        get_groups.assert_not_called()
+
+        expected = [self.apartment2, self.commercial_space1, updated_apartment3, apartment4]
+        self.assert_properties(self.property_manager.get_properties(), expected)
+        self.assertEqual(self.property_manager.get_by_id(self.apartment3.get_id()).to_dict(),
+                         updated_apartment3.to_dict())
+        self.assert_properties(
+            self.property_manager.sort_properties("price", "ascending"),
+            [updated_apartment3, self.commercial_space1, self.apartment2, apartment4])
+        self.assert_properties(
+            self.property_manager.sort_properties("square_footage", "descending"),
+            [apartment4, self.apartment2, self.commercial_space1, updated_apartment3])
+        self.assert_properties(
+            self.property_manager.query(location="varna", max_square_footage=1000), [updated_apartment3])
+
+    def test_query_sorted_without_criteria(self):
+        """
+        Tests that a sorted query without criteria reads the cached order instead of sorting the rows.
+        """
+        self.property_manager.sort_properties("price", "ascending")
+
+        with mock.patch.object(self.property_manager, "_sort_limited") as sort_limited:
+            self.assert_properties(
+                self.property_manager.query(sorting_attribute="price", sorting_type="descending", limit=2, offset=1),
+                [self.commercial_space1, self.house1])
+        sort_limited.assert_not_called()
+
+    def test_copy(self):
+        """
+        Tests that changing a copy of the catalog leaves the original columns and orders unchanged.
+        """
+        self.property_manager.sort_properties("price", "ascending")
+        catalog = self.property_manager.copy()
+        catalog.delete_property(self.apartment1.get_id())
+        catalog.add_property(Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Burgas",
+            price=1,
+            square_footage=1,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        ))
+
+        self.assert_properties(self.property_manager.get_properties(), [
+            self.apartment1, self.apartment2, self.apartment3, self.house1, self.commercial_space1])
+        self.assert_properties(self.property_manager.sort_properties("price", "ascending", limit=2),
+                               [self.apartment3, self.apartment1])
+        self.assertEqual(self.property_manager.count(location="Burgas"), 0)
+        self.assertEqual(catalog.count(location="Burgas"), 1)
+        self.assertEqual(len(catalog.get_properties()), 5)
+
+    def test_metrics(self):
+        """
+        Tests that the filtering, sorting and query methods count the rows they scan and return.
+        """
+        metrics = RequestMetrics()
+        self.property_manager.set_metrics(metrics)
+
+        self.property_manager.filter_by_location("sofia")
+        self.property_manager.filter_by_price(150000, 190000)
+        self.property_manager.sort_properties("price", "ascending", limit=2)
+        self.property_manager.query(location="Sofia", min_price=150000)
+        self.property_manager.count(location="Sofia", min_price=150000)
+
+        self.assertEqual(metrics.get_rows("filter_by_location"), (4, 4))
+        self.assertEqual(metrics.get_rows("filter_by_price"), (3, 3))
+        self.assertEqual(metrics.get_rows("sort_properties"), (2, 2))
+        self.assertEqual(metrics.get_rows("query"), (4, 4))
+        self.assertEqual(metrics.get_rows("count"), (4, 0))
+        self.assertEqual(list(self.property_manager.copy().filter_by_property_type("house").get_rows()), [3])
+        self.assertEqual(metrics.get_rows("filter_by_property_type"), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
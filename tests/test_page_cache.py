@@ -0,0 +1,122 @@
+"""
+Unit Tests for the PageCache Class
+
+This file contains unit tests for the PageCache class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import unittest
+from werkzeug.datastructures import MultiDict
+from classes.page_cache import PageCache
+
+
+class TestPageCache(unittest.TestCase):
+    """
+    Test cases for the PageCache class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a small PageCache instance with a controllable clock.
+        """
+        self.now = 0
+        self.page_cache = PageCache(
+            max_entries=2,
+            max_bytes=10,
+            ttl=5,
+            clock=lambda: self.now)
+
+    def test_get_missing(self):
+        """
+        Tests the get method with a key that is not cached.
+        """
+        self.assertIsNone(self.page_cache.get("missing"))
+
+    def test_put_and_get(self):
+        """
+        Tests that a cached page is returned with a stable ETag.
+        """
+        body, etag = self.page_cache.put("home", b"page")
+        self.assertEqual(body, b"page")
+        self.assertEqual(self.page_cache.get("home"), (b"page", etag))
+        self.assertEqual(self.page_cache.put("other", b"page")[1], etag)
+        self.assertNotEqual(self.page_cache.put("other", b"Page")[1], etag)
+
+    def test_evicts_least_recently_used(self):
+        """
+        Tests that the least recently used page is evicted when there are too many pages.
+        """
+        self.page_cache.put("a", b"1")
+        self.page_cache.put("b", b"2")
+        self.page_cache.get("a")
+        self.page_cache.put("c", b"3")
+
+        self.assertIsNotNone(self.page_cache.get("a"))
+        self.assertIsNone(self.page_cache.get("b"))
+        self.assertIsNotNone(self.page_cache.get("c"))
+
+    def test_evicts_by_size(self):
+        """
+        Tests that pages are evicted when the cache holds too many bytes and that oversized pages are not cached.
+        """
+        self.page_cache.put("a", b"12345")
+        self.page_cache.put("b", b"123456")
+        self.assertIsNone(self.page_cache.get("a"))
+        self.assertEqual(self.page_cache.get_size(), 6)
+
+        self.page_cache.put("c", b"12345678901")
+        self.assertIsNone(self.page_cache.get("c"))
+        self.assertEqual(len(self.page_cache), 1)
+
+    def test_replace(self):
+        """
+        Tests that putting a cached key again replaces the page and its size.
+        """
+        self.page_cache.put("a", b"12345")
+        self.page_cache.put("a", b"12")
+        self.assertEqual(self.page_cache.get("a")[0], b"12")
+        self.assertEqual(self.page_cache.get_size(), 2)
+
+    def test_expires(self):
+        """
+        Tests that pages expire after their time to live.
+        """
+        self.page_cache.put("a", b"1")
+        self.now = 4.9
+        self.assertIsNotNone(self.page_cache.get("a"))
+        self.now = 5
+        self.assertIsNone(self.page_cache.get("a"))
+        self.assertEqual(len(self.page_cache), 0)
+
+    def test_make_key(self):
+        """
+        Tests that the key keeps the parameter values exactly as sent and tells the query string and the form apart.
+        """
+        def make_key(query_parameters=(), form_parameters=()):
+            return PageCache.make_key(
+                "/filter", (MultiDict(query_parameters), MultiDict(form_parameters)), "0.1",
+                ignored=("selected_properties",))
+
+        self.assertNotEqual(make_key(form_parameters=[("location", "Sofia ")]),
+                            make_key(form_parameters=[("location", "Sofia")]))
+        self.assertNotEqual(make_key(form_parameters=[("max_price", "")]), make_key())
+        self.assertNotEqual(make_key(query_parameters=[("location", "Sofia")]),
+                            make_key(form_parameters=[("location", "Sofia")]))
+        self.assertNotEqual(make_key(form_parameters=[("a", "1"), ("a", "2")]),
+                            make_key(form_parameters=[("a", "2"), ("a", "1")]))
+        self.assertEqual(make_key(form_parameters=[("location", "Sofia"), ("page", "2")]),
+                         make_key(form_parameters=[("page", "2"), ("location", "Sofia"),
+                                                   ("selected_properties", "id-1")]))
+
+    def test_clear(self):
+        """
+        Tests the clear method.
+        """
+        self.page_cache.put("a", b"1")
+        self.page_cache.clear()
+        self.assertEqual(len(self.page_cache), 0)
+        self.assertEqual(self.page_cache.get_size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit Tests for the ParallelPropertyReader Class
+
+This file contains unit tests for the ParallelPropertyReader class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from classes.parallel_property_reader import ParallelPropertyReader
+from classes.property_manager import PropertyManager
+
+
+class TestParallelPropertyReader(unittest.TestCase):
+    """
+    Test cases for the ParallelPropertyReader class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a JSON Lines file with properties of every type and an empty line.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path_to_file = os.path.join(self.temporary_directory.name, "properties.jsonl")
+        self.records = []
+        for number in range(30):
+            record = {
+                "id": f"property-{number}",
+                "name": f"Property {number}",
+                "location": ("Sofia", "Varna", "Burgas")[number % 3],
+                "price": 1000 * number + 0.5 * (number % 2),
+                "square_footage": 50 + number
+            }
+            if number % 3 == 0:
+                record.update(property_type="Commercial Space", business_type=("Office", "Retail")[number % 2])
+            else:
+                record.update(property_type="Apartment" if number % 3 == 1 else "House", num_of_bedrooms=2,
+                              num_of_bathrooms=1, **{"floor_number" if number % 3 == 1 else "num_of_floors": 3})
+            self.records.append(record)
+
+        with open(self.path_to_file, "w", encoding="utf-8") as json_file:
+            for number, record in enumerate(self.records):
+                json_file.write(json.dumps(record) + "\n")
+                if number == 10:
+                    json_file.write("\n")
+
+    def tearDown(self):
+        """
+        Deletes the temporary directory.
+        """
+        self.temporary_directory.cleanup()
+
+    def test_find_shards(self):
+        """
+        Tests that the shards cover the whole file and end at line breaks.
+        """
+        shards = ParallelPropertyReader.find_shards(self.path_to_file, 100)
+        with open(self.path_to_file, "rb") as input_file:
+            data = input_file.read()
+
+        self.assertGreater(len(shards), 1)
+        self.assertEqual(shards[0][0], 0)
+        self.assertEqual(shards[-1][1], len(data))
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    @mock.patch("classes.parallel_property_reader.MIN_SHARD_SIZE", 200)
+    def test_iter(self):
+        """
+        Tests that the shards read by the workers hold all properties in the order of the file.
+        """
+        reports = []
+        shards = list(ParallelPropertyReader(
+            self.path_to_file, PropertyManager._create_property, workers=2,
+            progress_callback=lambda *report: reports.append(report)))
+
+        self.assertGreater(len(shards), 1)
+        self.assertEqual(
+            [{"id": prop.get_id(), **prop.to_dict()} for columns in shards for prop in columns.materialize_rows()],
+            [{"id": record.pop("id"), **record} for record in self.records])
+        self.assertEqual(reports[-1], (30, os.path.getsize(self.path_to_file), os.path.getsize(self.path_to_file)))
+
+    def test_iter_invalid_json(self):
+        """
+        Tests that an invalid line is reported with its position in the file.
+        """
+        with open(self.path_to_file, "a", encoding="utf-8") as json_file:
+            json_file.write("{invalid\n")
+
+        with self.assertRaisesRegex(ValueError, "Invalid JSON at byte"):
+            list(ParallelPropertyReader(self.path_to_file, PropertyManager._create_property, workers=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,149 +1,273 @@
-"""
-Unit Tests for the Property Class (tested using the derived Apartment Class)
-
-This file contains unit tests for the Property and Apartment classes.
-It uses the unittest framework for testing various methods and functionalities.
-"""
-
-import unittest
-from classes.property import Property
-from classes.apartment import Apartment
-
-
-class TestProperty(unittest.TestCase):
-    """
-    Test cases for the Property class.
-    """
-
-    def setUp(self):
-        """
-        Sets up a sample Apartment instance for testing.
-        """
-        self.property = Apartment(
-            name="Sample Property",
-            property_type="Apartment",
-            location="Sample Location",
-            price=100000,
-            square_footage=1500,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-
-    def test_generate_uuid(self):
-        """
-        Tests the generate_uuid function.
-        """
-        # Tests if the generate_uuid function returns a string
-        uuid_value = Property.generate_uuid()
-        self.assertIsInstance(uuid_value, str)
-
-    def test_get_name(self):
-        """
-        Tests the get_name method.
-        """
-        self.assertEqual(self.property.get_name(), "Sample Property")
-
-    def test_get_id(self):
-        """
-        Tests the get_id method.
-        """
-        self.assertEqual(len(self.property.get_id()), 36)
-
-    def test_set_name(self):
-        """
-        Tests the set_name method.
-        """
-        self.property.set_name("New Name")
-        self.assertEqual(self.property.get_name(), "New Name")
-
-    def test_get_property_type(self):
-        """
-        Tests the get_property_type method.
-        """
-        self.assertEqual(self.property.get_property_type(), "Apartment")
-
-    def test_set_property_type_valid(self):
-        """
-        Tests the set_property_type method with a valid property type.
-        """
-        self.property.set_property_type("House")
-        self.assertEqual(self.property.get_property_type(), "House")
-
-    def test_set_property_type_invalid(self):
-        """
-        Tests the set_property_type method with an invalid property type.
-        """
-        with self.assertRaises(ValueError):
-            self.property.set_property_type("Invalid Type")
-
-    def test_get_location(self):
-        """
-        Tests the get_location method.
-        """
-        self.assertEqual(self.property.get_location(), "Sample Location")
-
-    def test_set_location(self):
-        """
-        Tests the set_location method.
-        """
-        self.property.set_location("New Location")
-        self.assertEqual(self.property.get_location(), "New Location")
-
-    def test_get_price(self):
-        """
-        Tests the get_price method.
-        """
-        self.assertEqual(self.property.get_price(), 100000)
-
-    def test_set_price_valid(self):
-        """
-        Tests the set_price method with a valid price.
-        """
-        self.property.set_price(150000)
-        self.assertEqual(self.property.get_price(), 150000)
-
-    def test_price_negative(self):
-        """
-        Tests the set_price method with a negative square footage.
-        """
-        self.property.set_price(-500)
-        self.assertEqual(self.property.get_price(), 0)
-
-    def test_set_price_invalid(self):
-        """
-        Tests the set_price method with an invalid price.
-        """
-        with self.assertRaises(ValueError):
-            self.property.set_price("Invalid Price")
-
-    def test_get_square_footage(self):
-        """
-        Tests the get_square_footage method.
-        """
-        self.assertEqual(self.property.get_square_footage(), 1500)
-
-    def test_set_square_footage_valid(self):
-        """
-        Tests the set_square_footage method with a valid square footage.
-        """
-        self.property.set_square_footage(2000)
-        self.assertEqual(self.property.get_square_footage(), 2000)
-
-    def test_set_square_footage_invalid(self):
-        """
-        Tests the set_square_footage method with an invalid square footage.
-        """
-        with self.assertRaises(ValueError):
-            self.property.set_square_footage("Invalid Footage")
-
-    def test_set_square_footage_negative(self):
-        """
-        Tests the set_square_footage method with a negative square footage.
-        """
-        self.property.set_square_footage(-500)
-        self.assertEqual(self.property.get_square_footage(), 0)
-
-
-if __name__ == '__main__':
-    unittest.main()
+"""
+Unit Tests for the Property Class (tested using the derived Apartment Class)
+
+This file contains unit tests for the Property and Apartment classes.
+It uses the unittest framework for testing various methods and functionalities.
+"""
+
+import json
+import unittest
+from array import array
+from classes.property import Property
+from classes.apartment import Apartment
+
+
+class TestProperty(unittest.TestCase):
+    """
+    Test cases for the Property class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a sample Apartment instance for testing.
+        """
+        self.property = Apartment(
+            name="Sample Property",
+            property_type="Apartment",
+            location="Sample Location",
+            price=100000,
+            square_footage=1500,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+
+    def test_generate_uuid(self):
+        """
+        Tests the generate_uuid function.
+        """
+        # Tests if the generate_uuid function returns a string
+        uuid_value = Property.generate_uuid()
+        self.assertIsInstance(uuid_value, str)
+
+    def test_generate_uuid_from_record(self):
+        """
+        Tests that the generate_uuid function derives the same UUID from the same record content.
+        """
+        record = {"name": "Sample Property", "price": 100000}
+        same_record = {"price": 100000, "name": "Sample Property"}
+        other_record = {"name": "Sample Property", "price": 100001}
+
+        self.assertEqual(Property.generate_uuid(record),
+                         Property.generate_uuid(same_record))
+        self.assertNotEqual(Property.generate_uuid(record),
+                            Property.generate_uuid(other_record))
+        self.assertEqual(len(Property.generate_uuid(record)), 36)
+
+    def test_init_with_property_id(self):
+        """
+        Tests creating a property with a given ID.
+        """
+        apartment = Apartment(
+            name="Sample Property",
+            property_type="Apartment",
+            location="Sample Location",
+            price=100000,
+            square_footage=1500,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5,
+            property_id="apartment-1"
+        )
+        self.assertEqual(apartment.get_id(), "apartment-1")
+
+    def test_get_name(self):
+        """
+        Tests the get_name method.
+        """
+        self.assertEqual(self.property.get_name(), "Sample Property")
+
+    def test_get_id(self):
+        """
+        Tests the get_id method.
+        """
+        self.assertEqual(len(self.property.get_id()), 36)
+
+    def test_set_name(self):
+        """
+        Tests the set_name method.
+        """
+        self.property.set_name("New Name")
+        self.assertEqual(self.property.get_name(), "New Name")
+
+    def test_get_property_type(self):
+        """
+        Tests the get_property_type method.
+        """
+        self.assertEqual(self.property.get_property_type(), "Apartment")
+
+    def test_set_property_type_valid(self):
+        """
+        Tests the set_property_type method with a valid property type.
+        """
+        self.property.set_property_type("House")
+        self.assertEqual(self.property.get_property_type(), "House")
+
+    def test_set_property_type_invalid(self):
+        """
+        Tests the set_property_type method with an invalid property type.
+        """
+        with self.assertRaises(ValueError):
+            self.property.set_property_type("Invalid Type")
+
+    def test_get_location(self):
+        """
+        Tests the get_location method.
+        """
+        self.assertEqual(self.property.get_location(), "Sample Location")
+
+    def test_set_location(self):
+        """
+        Tests the set_location method.
+        """
+        self.property.set_location("New Location")
+        self.assertEqual(self.property.get_location(), "New Location")
+
+    def test_get_price(self):
+        """
+        Tests the get_price method.
+        """
+        self.assertEqual(self.property.get_price(), 100000)
+
+    def test_set_price_valid(self):
+        """
+        Tests the set_price method with a valid price.
+        """
+        self.property.set_price(150000)
+        self.assertEqual(self.property.get_price(), 150000)
+
+    def test_price_negative(self):
+        """
+        Tests the set_price method with a negative square footage.
+        """
+        self.property.set_price(-500)
+        self.assertEqual(self.property.get_price(), 0)
+
+    def test_set_price_invalid(self):
+        """
+        Tests the set_price method with an invalid price.
+        """
+        with self.assertRaises(ValueError):
+            self.property.set_price("Invalid Price")
+
+    def test_get_square_footage(self):
+        """
+        Tests the get_square_footage method.
+        """
+        self.assertEqual(self.property.get_square_footage(), 1500)
+
+    def test_set_square_footage_valid(self):
+        """
+        Tests the set_square_footage method with a valid square footage.
+        """
+        self.property.set_square_footage(2000)
+        self.assertEqual(self.property.get_square_footage(), 2000)
+
+    def test_set_square_footage_invalid(self):
+        """
+        Tests the set_square_footage method with an invalid square footage.
+        """
+        with self.assertRaises(ValueError):
+            self.property.set_square_footage("Invalid Footage")
+
+    def test_set_square_footage_negative(self):
+        """
+        Tests the set_square_footage method with a negative square footage.
+        """
+        self.property.set_square_footage(-500)
+        self.assertEqual(self.property.get_square_footage(), 0)
+
+    def test_slots(self):
+        """
+        Tests that the Property object stores its fields in slots instead of a per-instance __dict__.
+        """
+        self.assertFalse(hasattr(self.property, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.property.unknown_attribute = 1
+
+    def test_to_dict_cached(self):
+        """
+        Tests that the to_dict method reuses the dictionary until a setter changes the property.
+        """
+        property_dict = self.property.to_dict()
+        self.assertIs(self.property.to_dict(), property_dict)
+
+        self.property.set_price(120000)
+        self.assertIsNot(self.property.to_dict(), property_dict)
+        self.assertEqual(self.property.to_dict()["price"], 120000)
+
+    def test_to_json(self):
+        """
+        Tests that the to_json method encodes the ID and the attributes once until a setter changes the property.
+        """
+        property_json = self.property.to_json()
+        self.assertEqual(json.loads(property_json), {
+                         "id": self.property.get_id(), **self.property.to_dict()})
+        self.assertIs(self.property.to_json(), property_json)
+
+        self.property.set_name("Renamed Property")
+        self.assertEqual(json.loads(self.property.to_json())["name"], "Renamed Property")
+
+    def test_get_display_rows(self):
+        """
+        Tests that the get_display_rows method labels every attribute except the name and follows the setters.
+        """
+        display_rows = self.property.get_display_rows()
+        self.assertEqual(display_rows[:2], (("Property Type", "Apartment"),
+                                            ("Location", "Sample Location")))
+        self.assertEqual(len(display_rows), 7)
+        self.assertIs(self.property.get_display_rows(), display_rows)
+
+        self.property.set_location("Sofia")
+        self.assertIn(("Location", "Sofia"), self.property.get_display_rows())
+
+    def test_from_columns(self):
+        """
+        Tests that from_columns creates the same properties as the constructor, following the rules of the setters.
+        """
+        apartments = Apartment.from_columns(["a", "b"], {
+            "name": ["First", "Second"],
+            "property_type": ["apartment", "Apartment"],
+            "location": ["Sofia", "Varna"],
+            "price": array("d", [100000.5, -1]),
+            "square_footage": [1500, 80.5],
+            "num_of_bedrooms": array("l", [2, -3]),
+            "num_of_bathrooms": [1, True],
+            "floor_number": [5, 0]
+        })
+
+        self.assertEqual([apartment.get_id() for apartment in apartments], ["a", "b"])
+        self.assertEqual(apartments[0].to_dict(), Apartment(
+            "First", "apartment", "Sofia", 100000.5, 1500, 2, 1, 5).to_dict())
+        self.assertEqual(apartments[1].to_dict(), Apartment(
+            "Second", "Apartment", "Varna", -1, 80.5, -3, True, 0).to_dict())
+        self.assertEqual(Apartment.from_columns([], {field: [] for field in Apartment._FIELDS}), [])
+
+    def test_from_columns_invalid(self):
+        """
+        Tests that from_columns rejects the columns holding values a setter rejects, or of the wrong length.
+        """
+        columns = {
+            "name": ["First"],
+            "property_type": ["Apartment"],
+            "location": ["Sofia"],
+            "price": [100000],
+            "square_footage": [1500],
+            "num_of_bedrooms": [2],
+            "num_of_bathrooms": [1],
+            "floor_number": [5]
+        }
+
+        for field, column in (("price", ["100000"]),
+                              ("square_footage", [None]),
+                              ("num_of_bedrooms", array("d", [2])),
+                              ("floor_number", [5.5]),
+                              ("property_type", ["Castle"]),
+                              ("name", []),
+                              ("location", None)):
+            with self.subTest(field=field), self.assertRaises(ValueError):
+                Apartment.from_columns(["a"], {**columns, field: column})
+
+
+if __name__ == '__main__':
+    unittest.main()
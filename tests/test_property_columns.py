@@ -0,0 +1,235 @@
+"""
+Unit Tests for the PropertyColumns and PropertyRows Classes
+
+This file contains unit tests for the PropertyColumns class and the PropertyRows sequence built on top of it.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import unittest
+from classes.property_columns import PropertyColumns, PROPERTY_TYPES
+from classes.property_rows import PropertyRows
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+
+
+class TestPropertyColumns(unittest.TestCase):
+    """
+    Test cases for the PropertyColumns and PropertyRows classes.
+    """
+
+    def setUp(self):
+        """
+        Sets up a PropertyColumns instance holding one property of every type.
+        """
+        self.apartment = Apartment(
+            name="Sample Apartment",
+            property_type="Apartment",
+            location="Sofia",
+            price=120000,
+            square_footage=75.5,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=4
+        )
+        self.house = House(
+            name="Sample House",
+            property_type="House",
+            location="Varna",
+            price=250000.5,
+            square_footage=2000,
+            num_of_bedrooms=4,
+            num_of_bathrooms=2,
+            num_of_floors=2
+        )
+        self.commercial_space = CommercialSpace(
+            name="Sample Commercial Space",
+            property_type="Commercial Space",
+            location="sofia",
+            price=500000,
+            square_footage=1500,
+            business_type="Call Center"
+        )
+        self.columns = PropertyColumns()
+        for property_to_add in [self.apartment,
+                                self.house, self.commercial_space]:
+            self.columns.append(property_to_add)
+
+    def test_len(self):
+        """
+        Tests the __len__ method.
+        """
+        self.assertEqual(len(self.columns), 3)
+
+    def test_materialize(self):
+        """
+        Tests that the materialize method recreates equal properties with the same IDs and number types.
+        """
+        for row, original in enumerate(
+                [self.apartment, self.house, self.commercial_space]):
+            materialized = self.columns.materialize(row)
+            self.assertIs(type(materialized), type(original))
+            self.assertEqual(materialized.get_id(), original.get_id())
+            self.assertEqual(materialized.to_dict(), original.to_dict())
+            self.assertIs(
+                type(materialized.get_price()), type(original.get_price()))
+            self.assertIs(type(materialized.get_square_footage()),
+                          type(original.get_square_footage()))
+
+    def test_materialize_rows(self):
+        """
+        Tests that materialize_rows creates the same properties as materialize, in the order of the rows.
+        """
+        for rows in ([2, 0, 1, 0], [1], []):
+            with self.subTest(rows=rows):
+                materialized = self.columns.materialize_rows(rows)
+                self.assertEqual([type(prop) for prop in materialized],
+                                 [type(self.columns.materialize(row)) for row in rows])
+                self.assertEqual([prop.to_json() for prop in materialized],
+                                 [self.columns.materialize(row).to_json() for row in rows])
+
+        self.assertEqual([prop.get_id() for prop in self.columns.materialize_rows()], [
+            self.apartment.get_id(), self.house.get_id(), self.commercial_space.get_id()])
+
+    def test_get_column(self):
+        """
+        Tests the get_column method.
+        """
+        self.assertEqual(list(self.columns.get_column("price")), [
+                         120000, 250000.5, 500000])
+        self.assertEqual(list(self.columns.get_column("floors")), [4, 2, -1])
+        with self.assertRaises(ValueError):
+            self.columns.get_column("name")
+
+    def test_find_location_codes(self):
+        """
+        Tests that the find_location_codes method matches every spelling of a location.
+        """
+        codes = self.columns.find_location_codes("SOFIA")
+        location_codes = self.columns.get_location_codes()
+        self.assertEqual(
+            {location_codes[0], location_codes[2]}, codes)
+        self.assertEqual(self.columns.find_location_codes("Burgas"), set())
+
+    def test_get_groups(self):
+        """
+        Tests that the get_groups method lists the rows of every code in the order they were added.
+        """
+        self.columns.append(Apartment(
+            name="Second Apartment",
+            property_type="Apartment",
+            location="Varna",
+            price=1,
+            square_footage=1,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        ))
+        location_codes = self.columns.get_codes("location")
+
+        self.assertEqual({PROPERTY_TYPES[code]: list(rows)
+                          for code, rows in self.columns.get_groups("property_type").items()},
+                         {"Apartment": [0, 3], "House": [1], "Commercial Space": [2]})
+        self.assertEqual({code: list(rows) for code, rows in self.columns.get_groups("location").items()},
+                         {location_codes[0]: [0], location_codes[1]: [1, 3], location_codes[2]: [2]})
+        with self.assertRaises(ValueError):
+            self.columns.get_groups("price")
+
+    def test_find_type_codes(self):
+        """
+        Tests the find_type_codes method.
+        """
+        codes = PropertyColumns.find_type_codes("house")
+        self.assertEqual([PROPERTY_TYPES[code] for code in codes], ["House"])
+        self.assertEqual(PropertyColumns.find_type_codes("Garage"), set())
+
+    def test_find_row(self):
+        """
+        Tests the find_row method.
+        """
+        self.assertEqual(self.columns.find_row(self.house.get_id()), 1)
+        self.assertIsNone(self.columns.find_row("unknown-id"))
+
+    def test_find_row_with_id_order(self):
+        """
+        Tests that find_row searches the order of the IDs when it is known, until a row is appended.
+        """
+        ids = [self.apartment.get_id(), self.house.get_id(), self.commercial_space.get_id()]
+        columns = PropertyColumns.from_columns(self.columns.to_columns(), id_order=self.columns.get_id_order())
+
+        self.assertEqual(sorted(ids), [ids[row] for row in columns.get_id_order()])
+        for row, property_id in enumerate(ids):
+            self.assertEqual(columns.find_row(property_id), row)
+        self.assertIsNone(columns.find_row("unknown-id"))
+        self.assertIsNone(columns.find_row(max(ids) + "z"))
+
+        apartment = Apartment(
+            name="Another Apartment",
+            property_type="Apartment",
+            location="Sofia",
+            price=1,
+            square_footage=1,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+        columns.append(apartment)
+        self.assertEqual(columns.find_row(apartment.get_id()), 3)
+        self.assertEqual(columns.find_row(ids[0]), 0)
+
+    def test_append_invalid(self):
+        """
+        Tests the append method with an object that is not a supported property.
+        """
+        with self.assertRaises(ValueError):
+            self.columns.append({"name": "Not a property"})
+
+    def test_property_rows(self):
+        """
+        Tests that PropertyRows creates the properties of the listed rows on access.
+        """
+        rows = PropertyRows(self.columns, [2, 0])
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0].get_id(), self.commercial_space.get_id())
+        self.assertEqual(rows[-1].get_id(), self.apartment.get_id())
+        self.assertEqual([prop.get_id() for prop in rows[1:]], [
+                         self.apartment.get_id()])
+        self.assertEqual([prop.get_name() for prop in rows], [
+                         "Sample Commercial Space", "Sample Apartment"])
+        self.assertEqual(rows.get_rows(), [2, 0])
+
+    def test_extend(self):
+        """
+        Tests that extend appends the rows of other columns, encoding their locations and business types again.
+        """
+        other = PropertyColumns()
+        other.append(self.commercial_space)
+        other.append(self.house)
+        self.columns.find_row(self.apartment.get_id())
+
+        self.columns.extend(PropertyColumns.from_columns(other.to_columns()))
+
+        self.assertEqual(len(self.columns), 5)
+        self.assertEqual([prop.to_json() for prop in self.columns.materialize_rows([3, 4])],
+                         [self.commercial_space.to_json(), self.house.to_json()])
+        self.assertEqual(self.columns.find_row(self.house.get_id()), 4)
+        self.assertEqual(self.columns.find_location_codes("Sofia"), {0, 2})
+        self.assertEqual(list(self.columns.get_location_codes()), [0, 1, 2, 2, 1])
+
+    def test_delete_rows(self):
+        """
+        Tests that the delete_rows method compacts every column and the ID lookup.
+        """
+        kept = self.columns.delete_rows([1])
+
+        self.assertEqual(list(kept), [1, 0, 1])
+        self.assertEqual(len(self.columns), 2)
+        self.assertEqual(self.columns.materialize(1).to_dict(), self.commercial_space.to_dict())
+        self.assertEqual(self.columns.find_row(self.commercial_space.get_id()), 1)
+        self.assertIsNone(self.columns.find_row(self.house.get_id()))
+        self.assertEqual(list(self.columns.get_column("price")), [120000, 500000])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Unit Tests for the PropertyExporter Class
+
+This file contains unit tests for the PropertyExporter class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from classes.property_exporter import PropertyExporter
+from classes.property_manager import PropertyManager
+from classes.apartment import Apartment
+from classes.house import House
+
+
+class TestPropertyExporter(unittest.TestCase):
+    """
+    Test cases for the PropertyExporter class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a PropertyExporter writing to a temporary directory and sample properties.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.directory = self.temporary_directory.name
+        self.property_exporter = PropertyExporter(self.directory, prefix="selection")
+        self.apartment = Apartment(
+            name="Sample Apartment",
+            property_type="Apartment",
+            location="София",
+            price=120000,
+            square_footage=75.5,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=4
+        )
+        self.house = House(
+            name="Sample House",
+            property_type="House",
+            location="Varna",
+            price=250000,
+            square_footage=2000,
+            num_of_bedrooms=4,
+            num_of_bathrooms=2,
+            num_of_floors=2
+        )
+
+    def test_export_json(self):
+        """
+        Tests that a JSON export can be read back with the same IDs and attributes.
+        """
+        path_to_file, count = self.property_exporter.export([self.apartment, self.house])
+        self.assertEqual(count, 2)
+        self.assertEqual(os.path.dirname(path_to_file), self.directory)
+        self.assertTrue(os.path.basename(path_to_file).startswith("selection-"))
+        self.assertTrue(path_to_file.endswith(".json"))
+
+        property_manager = PropertyManager()
+        property_manager.read_properties_from_json(path_to_file)
+        self.assertEqual(
+            [(prop.get_id(), prop.to_dict()) for prop in property_manager.get_properties()],
+            [(prop.get_id(), prop.to_dict()) for prop in [self.apartment, self.house]])
+
+    def test_export_empty_json(self):
+        """
+        Tests exporting no properties as JSON.
+        """
+        path_to_file, count = self.property_exporter.export([])
+        self.assertEqual(count, 0)
+        with open(path_to_file, encoding="utf-8") as json_file:
+            self.assertEqual(json.load(json_file), [])
+
+    def test_export_json_lines(self):
+        """
+        Tests exporting properties as JSON Lines from an iterator.
+        """
+        path_to_file, count = self.property_exporter.export(
+            iter([self.apartment, self.house]), file_format="jsonl")
+        self.assertEqual(count, 2)
+        with open(path_to_file, encoding="utf-8") as json_lines_file:
+            records = [json.loads(line) for line in json_lines_file]
+        self.assertEqual(records[0], {"id": self.apartment.get_id(), **self.apartment.to_dict()})
+        self.assertEqual(records[1]["name"], "Sample House")
+
+    def test_export_csv(self):
+        """
+        Tests exporting properties as CSV, leaving the attributes a property does not have empty.
+        """
+        path_to_file, _ = self.property_exporter.export(
+            [self.apartment, self.house], file_format="csv")
+        with open(path_to_file, encoding="utf-8", newline="") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+
+        self.assertEqual(rows[0]["id"], self.apartment.get_id())
+        self.assertEqual(rows[0]["location"], "София")
+        self.assertEqual(rows[0]["num_of_floors"], "")
+        self.assertEqual(rows[1]["num_of_floors"], "2")
+
+    def test_export_new_file_every_time(self):
+        """
+        Tests that exports never overwrite each other.
+        """
+        first_path, _ = self.property_exporter.export([self.apartment])
+        second_path, _ = self.property_exporter.export([self.house])
+        self.assertNotEqual(first_path, second_path)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    @unittest.skipIf(os.name == "nt", "file modes are not supported on Windows")
+    def test_export_file_mode(self):
+        """
+        Tests that an export gets the permissions of a file created with open under the current umask.
+        """
+        previous_umask = os.umask(0o027)
+        try:
+            path_to_file, _ = PropertyExporter(self.directory).export([self.apartment])
+        finally:
+            os.umask(previous_umask)
+
+        self.assertEqual(os.stat(path_to_file).st_mode & 0o777, 0o640)
+
+    def test_export_invalid_format(self):
+        """
+        Tests exporting with an unsupported format and creating an exporter with one.
+        """
+        with self.assertRaises(ValueError):
+            self.property_exporter.export([self.apartment], file_format="xml")
+        with self.assertRaises(ValueError):
+            PropertyExporter(self.directory, default_format="xml")
+
+    def test_export_failure_leaves_no_file(self):
+        """
+        Tests that a failed export removes its temporary file and does not create the export file.
+        """
+        def failing_properties():
+            yield self.apartment
+            raise RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            self.property_exporter.export(failing_properties())
+        with mock.patch("classes.property_exporter.os.replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.property_exporter.export([self.apartment])
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
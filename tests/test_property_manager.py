@@ -1,425 +1,1239 @@
-"""
-Unit Tests for the PropertyManager Class
-
-This file contains unit tests for the PropertyManager class.
-It uses the unittest framework to test various methods and functionalities.
-"""
-import json
-import os
-import unittest
-from classes.property_manager import PropertyManager
-from classes.apartment import Apartment
-from classes.house import House
-
-
-class TestPropertyManager(unittest.TestCase):
-    """
-    Test cases for the PropertyManager class.
-    """
-
-    def setUp(self):
-        """
-        Sets up a sample PropertyManager instance for testing.
-        """
-        self.property_manager = PropertyManager()
-
-    def test_get_properties(self):
-        """
-        Tests the get_properties method.
-        """
-        self.assertEqual(self.property_manager.get_properties(), [])
-
-    def test_read_properties_from_json(self):
-        """
-        Tests the read_properties_from_json method.
-        """
-        # Create a temporary JSON file with sample data
-        house_dict = {
-            "name": "Sample House",
-            "property_type": "House",
-            "location": "Sample Location",
-            "price": 250000,
-            "square_footage": 2000,
-            "num_of_bedrooms": 3,
-            "num_of_bathrooms": 2,
-            "num_of_floors": 2
-        }
-        apartment_dict = {
-            "name": "Sample Apartment",
-            "property_type": "Apartment",
-            "location": "Sample Location",
-            "price": 1200,
-            "square_footage": 1000,
-            "num_of_bedrooms": 2,
-            "num_of_bathrooms": 2,
-            "floor_number": 5
-        }
-        commercial_space_dict = {
-            "name": "Sample Commercial Space",
-            "property_type": "Commercial Space",
-            "location": "Sample Location",
-            "price": 500000,
-            "square_footage": 1500,
-            "business_type": "Call Center",
-        }
-        other_property = {
-            "name": "Sample Commercial Space",
-            "property_type": "Garage",
-            "location": "Sample Location",
-            "price": 500000,
-            "square_footage": 1500,
-            "business_type": "Call Center",
-        }
-        test_json_data = [
-            house_dict,
-            apartment_dict,
-            commercial_space_dict,
-            other_property]
-        test_json_path = "test_properties.json"
-        with open(test_json_path, "w") as json_file:
-            json.dump(test_json_data, json_file)
-
-        # Test reading properties from the created JSON file
-        self.property_manager.read_properties_from_json(test_json_path)
-
-        # Check if the properties have been added to the manager
-        self.assertEqual(len(self.property_manager.get_properties()), 3)
-
-        # Remove the temporary JSON file
-        os.remove(test_json_path)
-
-    def test_read_properties_from_json_invalid_json(self):
-        """
-        Tests the read_properties_from_json method with an invalid JSON file.
-        """
-        with self.assertRaises(FileNotFoundError):
-            self.property_manager.read_properties_from_json(
-                "invalid_file.json")
-
-    def test_read_properties_from_json_missing_property_type(self):
-        """
-        Tests the read_properties_from_json method with a JSON file missing the "property_type" key.
-        """
-        # Create a temporary JSON file with missing "property_type"
-        invalid_json_data = [
-            {"name": "Apt1", "location": "City", "price": 1500, "square_footage": 1200}]
-        invalid_json_path = "invalid_properties.json"
-        with open(invalid_json_path, "w") as json_file:
-            json.dump(invalid_json_data, json_file)
-
-        # Test reading properties from the created JSON file
-        with self.assertRaises(Exception):
-            self.property_manager.read_properties_from_json(invalid_json_path)
-
-        # Remove the temporary JSON file
-        os.remove(invalid_json_path)
-
-    def test_add_property(self):
-        """
-        Tests the _add_property method.
-        """
-        apartment = Apartment(
-            name="Test Apartment",
-            property_type="Apartment",
-            location="Test Location",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        self.property_manager._add_property(apartment)
-        self.assertIn(apartment, self.property_manager.get_properties())
-
-    def test_add_property_invalid(self):
-        """
-        Tests the _add_property method with invalid data.
-        """
-        apartment_dict = {
-            "name": "Sample Apartment",
-            "property_type": "Apartment",
-            "location": "Sample Location",
-            "price": 1200,
-            "square_footage": 1000,
-            "num_of_bedrooms": 2,
-            "num_of_bathrooms": 2,
-            "floor_number": 5
-        }
-        with self.assertRaises(Exception):
-            self.property_manager._add_property(apartment_dict)
-
-    def test_filter_by_location(self):
-        """
-        Tests the filter_by_location method.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-
-        filtered_properties = self.property_manager.filter_by_location(
-            "Location A")
-        self.assertEqual(filtered_properties, [apartment1])
-
-    def test_filter_by_price(self):
-        """
-        Tests the filter_by_price method.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-
-        filtered_properties = self.property_manager.filter_by_price(
-            min_price=1600, max_price=2000)
-        self.assertEqual(filtered_properties, [apartment2])
-
-    def test_filter_by_price_max_is_none(self):
-        """
-       Tests the filter_by_price method with the max price being None.
-       """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-
-        filtered_properties = self.property_manager.filter_by_price(
-            min_price=1600, max_price=None)
-        self.assertEqual(filtered_properties, [apartment2])
-
-    def test_filter_by_square_footage(self):
-        """
-        Tests the filter_by_square_footage method.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-
-        filtered_properties = self.property_manager.filter_by_square_footage(
-            min_square_footage=1300, max_square_footage=1600)
-        self.assertEqual(filtered_properties, [apartment2])
-
-    def test_filter_by_square_footage_max_is_none(self):
-        """
-        Tests the filter_by_square_footage with the max square_footage being None.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-
-        filtered_properties = self.property_manager.filter_by_square_footage(
-            min_square_footage=1300, max_square_footage=None)
-        self.assertEqual(filtered_properties, [apartment2])
-
-    def test_filter_by_property_type(self):
-        """
-        Tests the filter_by_property_type method.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        house1 = House(
-            name="House 1",
-            property_type="House",
-            location="Location B",
-            price=2000,
-            square_footage=1800,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            num_of_floors=2,
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(house1)
-
-        filtered_properties = self.property_manager.filter_by_property_type(
-            "House")
-        self.assertEqual(filtered_properties, [house1])
-
-    def test_sort_properties_by_price(self):
-        """
-        Tests the sort_properties method. Sorts elements by price.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        house1 = House(
-            name="House 1",
-            property_type="House",
-            location="Location C",
-            price=2000,
-            square_footage=1800,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            num_of_floors=2
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-        self.property_manager._add_property(house1)
-
-        sorted_properties = self.property_manager.sort_properties(
-            sorting_attribute="price", sorting_type="ascending")
-        expected_order = [apartment1, apartment2, house1]
-        self.assertEqual(sorted_properties, expected_order)
-
-    def test_sort_properties_by_square_footage(self):
-        """
-        Tests the sort_properties method. Sorts elements by square footage.
-        """
-        apartment1 = Apartment(
-            name="Apartment 1",
-            property_type="Apartment",
-            location="Location A",
-            price=1500,
-            square_footage=1200,
-            num_of_bedrooms=2,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        apartment2 = Apartment(
-            name="Apartment 2",
-            property_type="Apartment",
-            location="Location B",
-            price=1800,
-            square_footage=1500,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            floor_number=5
-        )
-        house1 = House(
-            name="House 1",
-            property_type="House",
-            location="Location C",
-            price=2000,
-            square_footage=1800,
-            num_of_bedrooms=3,
-            num_of_bathrooms=2,
-            num_of_floors=2
-        )
-        self.property_manager._add_property(apartment1)
-        self.property_manager._add_property(apartment2)
-        self.property_manager._add_property(house1)
-
-        sorted_properties = self.property_manager.sort_properties(
-            sorting_attribute="square_footage", sorting_type="ascending")
-        expected_order = [apartment1, apartment2, house1]
-        self.assertEqual(sorted_properties, expected_order)
-
-
-if __name__ == '__main__':
-    unittest.main()
+"""
+Unit Tests for the PropertyManager Class
+
+This file contains unit tests for the PropertyManager class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from classes.property_manager import PropertyManager
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+from classes.request_metrics import RequestMetrics
+from tests.property_manager_contract import PropertyManagerContractTests
+
+
+class TestPropertyManager(unittest.TestCase):
+    """
+    Test cases for the PropertyManager class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a sample PropertyManager instance for testing.
+        """
+        self.property_manager = PropertyManager()
+
+    def test_get_properties(self):
+        """
+        Tests the get_properties method.
+        """
+        self.assertEqual(self.property_manager.get_properties(), [])
+
+    def test_get_by_id(self):
+        """
+        Tests the get_by_id method.
+        """
+        apartment = Apartment(
+            name="Test Apartment",
+            property_type="Apartment",
+            location="Test Location",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment)
+        self.assertIs(self.property_manager.get_by_id(
+            apartment.get_id()), apartment)
+        self.assertIsNone(self.property_manager.get_by_id("unknown-id"))
+
+    def test_get_by_ids(self):
+        """
+        Tests the get_by_ids method.
+        """
+        apartment = Apartment(
+            name="Test Apartment",
+            property_type="Apartment",
+            location="Test Location",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        house = House(
+            name="Test House",
+            property_type="House",
+            location="Test Location",
+            price=2000,
+            square_footage=1800,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2,
+        )
+        self.property_manager._add_properties([apartment, house])
+
+        selected_properties = self.property_manager.get_by_ids(
+            [house.get_id(), "unknown-id", apartment.get_id()])
+        self.assertEqual(selected_properties, [house, apartment])
+
+    def test_read_properties_from_json(self):
+        """
+        Tests the read_properties_from_json method.
+        """
+        # Create a temporary JSON file with sample data
+        house_dict = {
+            "name": "Sample House",
+            "property_type": "House",
+            "location": "Sample Location",
+            "price": 250000,
+            "square_footage": 2000,
+            "num_of_bedrooms": 3,
+            "num_of_bathrooms": 2,
+            "num_of_floors": 2
+        }
+        apartment_dict = {
+            "name": "Sample Apartment",
+            "property_type": "Apartment",
+            "location": "Sample Location",
+            "price": 1200,
+            "square_footage": 1000,
+            "num_of_bedrooms": 2,
+            "num_of_bathrooms": 2,
+            "floor_number": 5
+        }
+        commercial_space_dict = {
+            "name": "Sample Commercial Space",
+            "property_type": "Commercial Space",
+            "location": "Sample Location",
+            "price": 500000,
+            "square_footage": 1500,
+            "business_type": "Call Center",
+        }
+        other_property = {
+            "name": "Sample Commercial Space",
+            "property_type": "Garage",
+            "location": "Sample Location",
+            "price": 500000,
+            "square_footage": 1500,
+            "business_type": "Call Center",
+        }
+        test_json_data = [
+            house_dict,
+            apartment_dict,
+            commercial_space_dict,
+            other_property]
+        test_json_path = "test_properties.json"
+        with open(test_json_path, "w") as json_file:
+            json.dump(test_json_data, json_file)
+
+        # Test reading properties from the created JSON file
+        self.property_manager.read_properties_from_json(test_json_path)
+
+        # Check if the properties have been added to the manager
+        self.assertEqual(len(self.property_manager.get_properties()), 3)
+
+        # Remove the temporary JSON file
+        os.remove(test_json_path)
+
+    def test_read_properties_from_json_lines(self):
+        """
+        Tests the read_properties_from_json method with a JSON Lines file.
+        """
+        records = [
+            {
+                "name": f"Sample Apartment {number}",
+                "property_type": "Apartment",
+                "location": "Sample Location",
+                "price": 1200 + number,
+                "square_footage": 1000,
+                "num_of_bedrooms": 2,
+                "num_of_bathrooms": 2,
+                "floor_number": 5
+            }
+            for number in range(3)
+        ]
+        test_json_path = "test_properties.jsonl"
+        with open(test_json_path, "w") as json_file:
+            json_file.write("\n".join(json.dumps(record) for record in records))
+
+        reports = []
+        self.property_manager.read_properties_from_json(
+            test_json_path, progress_callback=lambda *report: reports.append(report))
+
+        self.assertEqual([prop.to_dict() for prop in self.property_manager.get_properties()], records)
+        self.assertEqual(reports[-1][0], 3)
+
+        os.remove(test_json_path)
+
+    @mock.patch("classes.parallel_property_reader.MIN_SHARD_SIZE", 200)
+    def test_read_properties_from_json_lines_in_parallel(self):
+        """
+        Tests that a JSON Lines file read by several processes gives the same catalog as read by one,
+        and that duplicate IDs in different shards are rejected.
+        """
+        records = [
+            {
+                "id": f"apartment-{number}",
+                "name": f"Sample Apartment {number}",
+                "property_type": "Apartment",
+                "location": ("Sofia", "Varna")[number % 2],
+                "price": 1200 + number,
+                "square_footage": 1000,
+                "num_of_bedrooms": 2,
+                "num_of_bathrooms": 2,
+                "floor_number": 5
+            }
+            for number in range(20)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "properties.jsonl")
+            with open(path_to_file, "w") as json_file:
+                json_file.write("\n".join(json.dumps(record) for record in records))
+
+            self.property_manager.read_properties_from_json(path_to_file)
+            property_manager = PropertyManager()
+            property_manager.read_properties_from_json(path_to_file, workers=2)
+
+            self.assertEqual([prop.to_json() for prop in property_manager.get_properties()],
+                             [prop.to_json() for prop in self.property_manager.get_properties()])
+            self.assertEqual(len(property_manager.filter_by_location("varna")), 10)
+
+            with open(path_to_file, "a") as json_file:
+                json_file.write("\n" + json.dumps(records[0]))
+            with self.assertRaises(ValueError):
+                PropertyManager().read_properties_from_json(path_to_file, workers=2)
+
+    def test_read_properties_from_json_stable_ids(self):
+        """
+        Tests that reading the same file twice gives the properties the same IDs and that IDs from the file are kept.
+        """
+        records = [
+            {
+                "id": "apartment-1",
+                "name": "Sample Apartment",
+                "property_type": "Apartment",
+                "location": "Sample Location",
+                "price": 1200,
+                "square_footage": 1000,
+                "num_of_bedrooms": 2,
+                "num_of_bathrooms": 2,
+                "floor_number": 5
+            },
+            {
+                "name": "Sample Commercial Space",
+                "property_type": "Commercial Space",
+                "location": "Sample Location",
+                "price": 500000,
+                "square_footage": 1500,
+                "business_type": "Call Center",
+            }
+        ]
+        test_json_path = "test_properties.json"
+        with open(test_json_path, "w") as json_file:
+            json.dump(records, json_file)
+
+        other_property_manager = PropertyManager()
+        self.property_manager.read_properties_from_json(test_json_path)
+        other_property_manager.read_properties_from_json(test_json_path)
+
+        ids = [prop.get_id() for prop in self.property_manager.get_properties()]
+        self.assertEqual(ids[0], "apartment-1")
+        self.assertEqual(
+            ids, [prop.get_id() for prop in other_property_manager.get_properties()])
+
+        os.remove(test_json_path)
+
+    def test_read_properties_from_json_duplicate_ids(self):
+        """
+        Tests that the read_properties_from_json method rejects records with the same ID.
+        """
+        record = {
+            "name": "Sample Commercial Space",
+            "property_type": "Commercial Space",
+            "location": "Sample Location",
+            "price": 500000,
+            "square_footage": 1500,
+            "business_type": "Call Center",
+        }
+        test_json_path = "test_properties.json"
+        with open(test_json_path, "w") as json_file:
+            json.dump([record, dict(record)], json_file)
+
+        with self.assertRaises(ValueError):
+            self.property_manager.read_properties_from_json(test_json_path)
+
+        os.remove(test_json_path)
+
+    def test_add_property_duplicate_id(self):
+        """
+        Tests that the _add_property and _add_properties methods reject an ID that is already in the catalog.
+        """
+        apartment = Apartment(
+            name="Test Apartment",
+            property_type="Apartment",
+            location="Test Location",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment)
+
+        with self.assertRaises(ValueError):
+            self.property_manager._add_property(apartment)
+        with self.assertRaises(ValueError):
+            self.property_manager._add_properties([apartment])
+        self.assertEqual(len(self.property_manager.get_properties()), 1)
+
+    def test_read_properties_from_json_invalid_json(self):
+        """
+        Tests the read_properties_from_json method with an invalid JSON file.
+        """
+        with self.assertRaises(FileNotFoundError):
+            self.property_manager.read_properties_from_json(
+                "invalid_file.json")
+
+    def test_read_properties_from_json_missing_property_type(self):
+        """
+        Tests the read_properties_from_json method with a JSON file missing the "property_type" key.
+        """
+        # Create a temporary JSON file with missing "property_type"
+        invalid_json_data = [
+            {"name": "Apt1", "location": "City", "price": 1500, "square_footage": 1200}]
+        invalid_json_path = "invalid_properties.json"
+        with open(invalid_json_path, "w") as json_file:
+            json.dump(invalid_json_data, json_file)
+
+        # Test reading properties from the created JSON file
+        with self.assertRaises(Exception):
+            self.property_manager.read_properties_from_json(invalid_json_path)
+
+        # Remove the temporary JSON file
+        os.remove(invalid_json_path)
+
+    def test_add_property(self):
+        """
+        Tests the _add_property method.
+        """
+        apartment = Apartment(
+            name="Test Apartment",
+            property_type="Apartment",
+            location="Test Location",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment)
+        self.assertIn(apartment, self.property_manager.get_properties())
+
+    def test_add_property_invalid(self):
+        """
+        Tests the _add_property method with invalid data.
+        """
+        apartment_dict = {
+            "name": "Sample Apartment",
+            "property_type": "Apartment",
+            "location": "Sample Location",
+            "price": 1200,
+            "square_footage": 1000,
+            "num_of_bedrooms": 2,
+            "num_of_bathrooms": 2,
+            "floor_number": 5
+        }
+        with self.assertRaises(Exception):
+            self.property_manager._add_property(apartment_dict)
+
+    def test_add_properties(self):
+        """
+        Tests the _add_properties method.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1800,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1500,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_properties([apartment1, apartment2])
+        self.assertEqual(
+            self.property_manager.get_properties(), [
+                apartment1, apartment2])
+        self.assertEqual(
+            self.property_manager.filter_by_price(), [
+                apartment2, apartment1])
+
+    def test_add_properties_invalid(self):
+        """
+        Tests the _add_properties method with invalid data.
+        """
+        with self.assertRaises(Exception):
+            self.property_manager._add_properties([{"name": "Not a property"}])
+        self.assertEqual(self.property_manager.get_properties(), [])
+
+    def test_filter_by_location(self):
+        """
+        Tests the filter_by_location method.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+
+        filtered_properties = self.property_manager.filter_by_location(
+            "Location A")
+        self.assertEqual(filtered_properties, [apartment1])
+
+    def test_filter_by_location_case_insensitive(self):
+        """
+        Tests that the filter_by_location method ignores the case of the location.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Sofia",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        house1 = House(
+            name="House 1",
+            property_type="House",
+            location="SOFIA",
+            price=2000,
+            square_footage=1800,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2,
+        )
+        self.property_manager._add_properties([apartment1, house1])
+
+        self.assertEqual(self.property_manager.filter_by_location(
+            "sofia"), [apartment1, house1])
+        self.assertEqual(self.property_manager.filter_by_location("Varna"), [])
+
+    def test_filter_by_price(self):
+        """
+        Tests the filter_by_price method.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+
+        filtered_properties = self.property_manager.filter_by_price(
+            min_price=1600, max_price=2000)
+        self.assertEqual(filtered_properties, [apartment2])
+
+    def test_filter_by_price_max_is_none(self):
+        """
+       Tests the filter_by_price method with the max price being None.
+       """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+
+        filtered_properties = self.property_manager.filter_by_price(
+            min_price=1600, max_price=None)
+        self.assertEqual(filtered_properties, [apartment2])
+
+    def test_filter_by_price_empty(self):
+        """
+        Tests the filter_by_price method without any properties.
+        """
+        self.assertEqual(self.property_manager.filter_by_price(
+            min_price=0, max_price=None), [])
+
+    def test_filter_by_price_sorted_by_price(self):
+        """
+        Tests that the filter_by_price method returns properties ordered by price with inclusive bounds.
+        """
+        house1 = House(
+            name="House 1",
+            property_type="House",
+            location="Location A",
+            price=3000,
+            square_footage=1800,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2,
+        )
+        house2 = House(
+            name="House 2",
+            property_type="House",
+            location="Location A",
+            price=1000,
+            square_footage=1900,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2,
+        )
+        house3 = House(
+            name="House 3",
+            property_type="House",
+            location="Location A",
+            price=2000,
+            square_footage=2000,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2,
+        )
+        self.property_manager._add_property(house1)
+        self.property_manager._add_property(house2)
+        self.property_manager._add_property(house3)
+
+        filtered_properties = self.property_manager.filter_by_price(
+            min_price=1000, max_price=3000)
+        self.assertEqual(filtered_properties, [house2, house3, house1])
+
+    def test_filter_by_square_footage(self):
+        """
+        Tests the filter_by_square_footage method.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+
+        filtered_properties = self.property_manager.filter_by_square_footage(
+            min_square_footage=1300, max_square_footage=1600)
+        self.assertEqual(filtered_properties, [apartment2])
+
+    def test_filter_by_square_footage_max_is_none(self):
+        """
+        Tests the filter_by_square_footage with the max square_footage being None.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+
+        filtered_properties = self.property_manager.filter_by_square_footage(
+            min_square_footage=1300, max_square_footage=None)
+        self.assertEqual(filtered_properties, [apartment2])
+
+    def test_filter_by_property_type(self):
+        """
+        Tests the filter_by_property_type method.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        house1 = House(
+            name="House 1",
+            property_type="House",
+            location="Location B",
+            price=2000,
+            square_footage=1800,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2,
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(house1)
+
+        filtered_properties = self.property_manager.filter_by_property_type(
+            "House")
+        self.assertEqual(filtered_properties, [house1])
+
+    def test_filter_by_property_type_case_insensitive(self):
+        """
+        Tests that the filter_by_property_type method ignores the case of the property type.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_property(apartment1)
+
+        self.assertEqual(self.property_manager.filter_by_property_type(
+            "APARTMENT"), [apartment1])
+        self.assertEqual(
+            self.property_manager.filter_by_property_type("Commercial Space"), [])
+
+    def test_sort_properties_by_price(self):
+        """
+        Tests the sort_properties method. Sorts elements by price.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        house1 = House(
+            name="House 1",
+            property_type="House",
+            location="Location C",
+            price=2000,
+            square_footage=1800,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+        self.property_manager._add_property(house1)
+
+        sorted_properties = self.property_manager.sort_properties(
+            sorting_attribute="price", sorting_type="ascending")
+        expected_order = [apartment1, apartment2, house1]
+        self.assertEqual(sorted_properties, expected_order)
+
+    def test_sort_properties_by_square_footage(self):
+        """
+        Tests the sort_properties method. Sorts elements by square footage.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1800,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        house1 = House(
+            name="House 1",
+            property_type="House",
+            location="Location C",
+            price=2000,
+            square_footage=1800,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            num_of_floors=2
+        )
+        self.property_manager._add_property(apartment1)
+        self.property_manager._add_property(apartment2)
+        self.property_manager._add_property(house1)
+
+        sorted_properties = self.property_manager.sort_properties(
+            sorting_attribute="square_footage", sorting_type="ascending")
+        expected_order = [apartment1, apartment2, house1]
+        self.assertEqual(sorted_properties, expected_order)
+
+    def test_sort_properties_with_limit(self):
+        """
+        Tests the sort_properties method when only the first properties are needed.
+        """
+        apartments = [
+            Apartment(
+                name=f"Apartment {number}",
+                property_type="Apartment",
+                location="Location A",
+                price=price,
+                square_footage=1000,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=1
+            )
+            for number, price in enumerate([500, 100, 900, 300, 700, 200, 800, 400, 600, 100])
+        ]
+        self.property_manager._add_properties(apartments)
+
+        ascending = self.property_manager.sort_properties(
+            sorting_attribute="price", sorting_type="ascending", limit=2)
+        self.assertEqual(ascending, [apartments[1], apartments[9]])
+
+        descending = self.property_manager.sort_properties(
+            sorting_attribute="price", sorting_type="descending", limit=2)
+        self.assertEqual(descending, [apartments[2], apartments[6]])
+
+        everything = self.property_manager.sort_properties(
+            sorting_attribute="price", sorting_type="ascending", limit=100)
+        self.assertEqual(len(everything), 10)
+
+    def test_sort_properties_with_offset(self):
+        """
+        Tests the sort_properties method when reading a later page of the order.
+        """
+        apartments = [
+            Apartment(
+                name=f"Apartment {price}",
+                property_type="Apartment",
+                location="Location A",
+                price=price,
+                square_footage=1000,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=1
+            )
+            for price in [500, 100, 400, 200, 300]
+        ]
+        self.property_manager._add_properties(apartments)
+
+        self.assertEqual(self.property_manager.sort_properties(
+            "price", "ascending", limit=2, offset=2), [apartments[4], apartments[2]])
+        self.assertEqual(self.property_manager.sort_properties(
+            "price", "descending", limit=2, offset=1), [apartments[2], apartments[4]])
+        self.assertEqual(self.property_manager.sort_properties(
+            "price", "descending", limit=2, offset=4), [apartments[1]])
+
+    def test_sort_properties_after_adding(self):
+        """
+        Tests that the sort_properties method reflects properties added after a sort.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Location A",
+            price=1500,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Location B",
+            price=1000,
+            square_footage=1500,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=5
+        )
+        self.property_manager._add_properties([apartment1])
+        version = self.property_manager.get_version()
+        self.assertEqual(self.property_manager.sort_properties(
+            "price", "ascending"), [apartment1])
+
+        self.property_manager._add_property(apartment2)
+        self.assertNotEqual(self.property_manager.get_version(), version)
+        self.assertEqual(self.property_manager.sort_properties(
+            "price", "ascending"), [apartment2, apartment1])
+
+    def add_query_sample(self):
+        """
+        Adds a small catalog used by the query tests.
+
+        Returns:
+            tuple: The added properties.
+        """
+        apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Sofia",
+            price=150000,
+            square_footage=1100,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=3
+        )
+        apartment2 = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Sofia",
+            price=250000,
+            square_footage=1400,
+            num_of_bedrooms=3,
+            num_of_bathrooms=2,
+            floor_number=7
+        )
+        apartment3 = Apartment(
+            name="Apartment 3",
+            property_type="Apartment",
+            location="Varna",
+            price=120000,
+            square_footage=1200,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=2
+        )
+        house1 = House(
+            name="House 1",
+            property_type="House",
+            location="Sofia",
+            price=180000,
+            square_footage=2000,
+            num_of_bedrooms=4,
+            num_of_bathrooms=2,
+            num_of_floors=2
+        )
+        commercial_space1 = CommercialSpace(
+            name="Commercial Space 1",
+            property_type="Commercial Space",
+            location="Sofia",
+            price=190000,
+            square_footage=1050,
+            business_type="Office"
+        )
+        properties = (apartment1, apartment2, apartment3,
+                      house1, commercial_space1)
+        self.property_manager._add_properties(list(properties))
+        return properties
+
+    def test_query_combined_criteria(self):
+        """
+        Tests the query method with several criteria combined.
+        """
+        apartment1, _, _, _, _ = self.add_query_sample()
+
+        found_properties = self.property_manager.query(
+            location="sofia",
+            property_type="Apartment",
+            max_price=200000,
+            min_square_footage=1000)
+        self.assertEqual(found_properties, [apartment1])
+
+    def test_query_without_criteria(self):
+        """
+        Tests the query method without any criteria.
+        """
+        properties = self.add_query_sample()
+
+        found_properties = self.property_manager.query()
+        self.assertEqual(found_properties, list(properties))
+        self.assertIsNot(
+            found_properties,
+            self.property_manager.get_properties())
+
+    def test_query_sorted_and_limited(self):
+        """
+        Tests the query method with sorting and a limit.
+        """
+        apartment1, apartment2, _, house1, commercial_space1 = self.add_query_sample()
+
+        found_properties = self.property_manager.query(
+            location="Sofia", sorting_attribute="price", sorting_type="descending")
+        self.assertEqual(found_properties, [
+                         apartment2, commercial_space1, house1, apartment1])
+
+        found_properties = self.property_manager.query(
+            min_price=100000, sorting_attribute="square_footage", limit=2)
+        self.assertEqual(found_properties, [commercial_space1, apartment1])
+
+    def test_query_offset(self):
+        """
+        Tests the query method with an offset, with and without sorting.
+        """
+        apartment1, apartment2, apartment3, house1, commercial_space1 = self.add_query_sample()
+
+        self.assertEqual(self.property_manager.query(
+            location="Sofia", sorting_attribute="price", sorting_type="descending", limit=2, offset=1),
+            [commercial_space1, house1])
+        self.assertEqual(self.property_manager.query(
+            min_price=150000, sorting_attribute="price", sorting_type="descending", offset=3),
+            [apartment1])
+        self.assertEqual(self.property_manager.query(
+            sorting_attribute="square_footage", limit=2, offset=2), [apartment3, apartment2])
+        self.assertEqual(self.property_manager.query(
+            location="Sofia", limit=2, offset=1), [apartment2, house1])
+
+    def test_query_no_matches(self):
+        """
+        Tests the query method with criteria that do not match any property.
+        """
+        self.add_query_sample()
+
+        self.assertEqual(self.property_manager.query(
+            location="Varna", property_type="House"), [])
+        self.assertEqual(self.property_manager.query(
+            min_price=300000, location="Sofia"), [])
+
+    def test_count(self):
+        """
+        Tests the count method.
+        """
+        self.add_query_sample()
+
+        self.assertEqual(self.property_manager.count(), 5)
+        self.assertEqual(self.property_manager.count(location="Sofia"), 4)
+        self.assertEqual(self.property_manager.count(max_price=180000), 3)
+        self.assertEqual(self.property_manager.count(
+            location="Sofia", property_type="Apartment", max_price=200000), 1)
+
+    def test_query_invalid_sorting_attribute(self):
+        """
+        Tests the query method with an unsupported sorting attribute.
+        """
+        with self.assertRaises(ValueError):
+            self.property_manager.query(sorting_attribute="name")
+
+    def test_add_update_delete_property(self):
+        """
+        Tests the add_property, update_property and delete_property methods.
+        """
+        apartment1, apartment2, apartment3, house1, commercial_space1 = self.add_query_sample()
+        self.property_manager.sort_properties("price", "ascending")
+
+        apartment4 = Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Burgas",
+            price=90000,
+            square_footage=800,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+        self.property_manager.add_property(apartment4)
+        with self.assertRaises(ValueError):
+            self.property_manager.add_property(apartment4)
+
+        updated_apartment1 = Apartment(
+            name="Apartment 1",
+            property_type="Apartment",
+            location="Varna",
+            price=300000,
+            square_footage=1100,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=3,
+            property_id=apartment1.get_id()
+        )
+        version = self.property_manager.get_version()
+        self.property_manager.update_property(updated_apartment1)
+        self.assertNotEqual(self.property_manager.get_version(), version)
+        self.assertTrue(self.property_manager.delete_property(house1.get_id()))
+        self.assertFalse(self.property_manager.delete_property(house1.get_id()))
+
+        self.assertEqual(self.property_manager.get_properties(), [
+            apartment2, apartment3, commercial_space1, apartment4, updated_apartment1])
+        self.assertIs(self.property_manager.get_by_id(apartment1.get_id()), updated_apartment1)
+        self.assertIsNone(self.property_manager.get_by_id(house1.get_id()))
+        self.assertEqual(self.property_manager.filter_by_location("sofia"), [apartment2, commercial_space1])
+        self.assertEqual(self.property_manager.filter_by_location("varna"), [apartment3, updated_apartment1])
+        self.assertEqual(self.property_manager.filter_by_property_type("house"), [])
+        self.assertEqual(self.property_manager.sort_properties("price", "ascending"), [
+            apartment4, apartment3, commercial_space1, apartment2, updated_apartment1])
+        self.assertEqual(self.property_manager.filter_by_square_footage(max_square_footage=1100), [
+            apartment4, commercial_space1, updated_apartment1])
+
+    def test_update_property_unknown_id(self):
+        """
+        Tests that the update_property method rejects a property that is not in the catalog.
+        """
+        apartment1, *_ = self.add_query_sample()
+        self.property_manager.delete_property(apartment1.get_id())
+
+        with self.assertRaises(ValueError):
+            self.property_manager.update_property(apartment1)
+        with self.assertRaises(Exception):
+            self.property_manager.update_property({"name": "Not a property"})
+
+    def test_apply_changes_keeps_sorted_indexes(self):
+        """
+        Tests that a large batch of changes leaves the sorted indexes in the order a full sort gives.
+        """
+        apartments = [
+            Apartment(
+                name=f"Apartment {number}",
+                property_type="Apartment",
+                location="Sofia",
+                price=1000 * (number % 7),
+                square_footage=1000 + number % 5,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=1
+            )
+            for number in range(100)
+        ]
+        self.property_manager._add_properties(apartments)
+        self.property_manager.sort_properties("price", "ascending")
+
+        replacements = [
+            Apartment(
+                name=f"Apartment {number}",
+                property_type="Apartment",
+                location="Sofia",
+                price=1000 * (number % 3),
+                square_footage=1000,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=1,
+                property_id=apartments[number].get_id()
+            )
+            for number in range(0, 100, 4)
+        ]
+        deleted_ids = [apartments[number].get_id() for number in range(1, 100, 3)] + ["unknown-id"]
+
+        self.assertEqual(self.property_manager.apply_changes(replacements, deleted_ids), (8, 17, 33))
+
+        expected = PropertyManager()
+        expected._add_properties(list(self.property_manager.get_properties()))
+        for attribute in ("price", "square_footage"):
+            for sorting_type in ("ascending", "descending"):
+                self.assertEqual(
+                    self.property_manager.sort_properties(attribute, sorting_type),
+                    expected.sort_properties(attribute, sorting_type))
+        self.assertEqual(self.property_manager.count(max_price=1000), expected.count(max_price=1000))
+
+    def test_apply_delta(self):
+        """
+        Tests the apply_delta method with upserts, tombstones and repeated IDs.
+        """
+        apartment1, apartment2, apartment3, house1, commercial_space1 = self.add_query_sample()
+        new_record = {
+            "id": "new-house",
+            "name": "House 2",
+            "property_type": "House",
+            "location": "Plovdiv",
+            "price": 210000,
+            "square_footage": 1800,
+            "num_of_bedrooms": 3,
+            "num_of_bathrooms": 2,
+            "num_of_floors": 2
+        }
+        records = [
+            {"id": apartment2.get_id(), "deleted": True},
+            {**apartment1.to_dict(), "id": apartment1.get_id(), "price": 100000},
+            {**apartment1.to_dict(), "id": apartment1.get_id(), "price": 110000},
+            new_record,
+            {"id": house1.get_id(), "deleted": True},
+            {**house1.to_dict(), "id": house1.get_id(), "deleted": False},
+            {"id": "unknown-id", "deleted": True}
+        ]
+        test_json_path = "test_delta.jsonl"
+        with open(test_json_path, "w") as json_file:
+            json_file.write("\n".join(json.dumps(record) for record in records))
+
+        self.assertEqual(self.property_manager.apply_delta(test_json_path), (1, 2, 1))
+        os.remove(test_json_path)
+
+        self.assertEqual(
+            [prop.get_id() for prop in self.property_manager.get_properties()],
+            [apartment3.get_id(), commercial_space1.get_id(), apartment1.get_id(), "new-house", house1.get_id()])
+        self.assertEqual(self.property_manager.get_by_id(apartment1.get_id()).get_price(), 110000)
+        self.assertEqual(
+            self.property_manager.get_by_id("new-house").to_dict(),
+            {name: value for name, value in new_record.items() if name != "id"})
+
+    def test_apply_delta_without_id(self):
+        """
+        Tests that the apply_delta method rejects records without an ID.
+        """
+        test_json_path = "test_delta.json"
+        with open(test_json_path, "w") as json_file:
+            json.dump([{"deleted": True}], json_file)
+
+        with self.assertRaises(ValueError):
+            self.property_manager.apply_delta(test_json_path)
+
+        os.remove(test_json_path)
+
+    def test_copy(self):
+        """
+        Tests that changing a copy of the catalog leaves the original unchanged.
+        """
+        apartment1, apartment2, apartment3, house1, commercial_space1 = self.add_query_sample()
+        self.property_manager.sort_properties("price", "ascending")
+
+        catalog = self.property_manager.copy()
+        catalog.delete_property(apartment3.get_id())
+        catalog.add_property(Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Sofia",
+            price=1,
+            square_footage=1,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        ))
+
+        self.assertEqual(self.property_manager.get_properties(), [
+            apartment1, apartment2, apartment3, house1, commercial_space1])
+        self.assertEqual(self.property_manager.sort_properties("price", "ascending"), [
+            apartment3, apartment1, house1, commercial_space1, apartment2])
+        self.assertEqual(len(self.property_manager.filter_by_location("Sofia")), 4)
+        self.assertIs(self.property_manager.get_by_id(apartment3.get_id()), apartment3)
+        self.assertEqual(len(catalog.filter_by_location("Sofia")), 5)
+        self.assertEqual(catalog.sort_properties("price", "ascending", limit=1)[0].get_name(), "Apartment 4")
+
+    def test_metrics(self):
+        """
+        Tests that the filtering, sorting and query methods count the rows they scan and return.
+        """
+        self.add_query_sample()
+        metrics = RequestMetrics()
+        self.property_manager.set_metrics(metrics)
+
+        self.property_manager.filter_by_location("sofia")
+        self.property_manager.filter_by_price(150000, 190000)
+        self.property_manager.sort_properties("price", "ascending", limit=2)
+        self.property_manager.query(location="Sofia", min_price=150000)
+        self.property_manager.query(sorting_attribute="price", limit=1)
+        self.property_manager.count(location="Sofia", min_price=150000)
+        self.property_manager.count(location="Sofia")
+
+        self.assertEqual(metrics.get_rows("filter_by_location"), (4, 4))
+        self.assertEqual(metrics.get_rows("filter_by_price"), (3, 3))
+        self.assertEqual(metrics.get_rows("sort_properties"), (2, 2))
+        self.assertEqual(metrics.get_rows("query"), (5, 5))
+        self.assertEqual(metrics.get_rows("count"), (4, 0))
+        self.property_manager.copy().filter_by_property_type("house")
+        self.assertEqual(metrics.get_rows("filter_by_property_type"), (1, 1))
+
+
+
+class TestPropertyManagerContract(PropertyManagerContractTests, unittest.TestCase):
+    """
+    Test cases shared by the storage engines, run against the PropertyManager class.
+    """
+
+    def create_property_manager(self):
+        """
+        Creates an empty PropertyManager instance.
+
+        Returns:
+            PropertyManager: The empty catalog.
+        """
+        return PropertyManager()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Unit Tests for the PropertyReader Class
+
+This file contains unit tests for the PropertyReader class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from classes.property_reader import PropertyReader
+
+
+class TestPropertyReader(unittest.TestCase):
+    """
+    Test cases for the PropertyReader class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a temporary directory and sample property records.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.records = [
+            {
+                "name": f"Apartment {number} в София",
+                "property_type": "Apartment",
+                "location": "Sofia",
+                "price": 1000 * number,
+                "square_footage": 50.5 + number,
+                "num_of_bedrooms": 2,
+                "num_of_bathrooms": 1,
+                "floor_number": number
+            }
+            for number in range(25)
+        ]
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+        """
+        self.temporary_directory.cleanup()
+
+    def write_file(self, file_name, content):
+        """
+        Writes a file into the temporary directory.
+
+        Args:
+            file_name (str): The name of the file.
+            content (str): The content of the file.
+
+        Returns:
+            str: The path to the file.
+        """
+        path_to_file = os.path.join(self.temporary_directory.name, file_name)
+        with open(path_to_file, "w", encoding="utf-8") as output_file:
+            output_file.write(content)
+        return path_to_file
+
+    def test_read_json_array(self):
+        """
+        Tests reading a JSON array with chunks much smaller than a record.
+        """
+        path_to_file = self.write_file(
+            "properties.json", json.dumps(
+                self.records, ensure_ascii=False, indent=4))
+
+        for chunk_size in [1, 7, 64, 1 << 16]:
+            reader = PropertyReader(path_to_file, chunk_size=chunk_size)
+            self.assertEqual(list(reader), self.records)
+
+    def test_read_empty_json_array(self):
+        """
+        Tests reading an empty JSON array.
+        """
+        path_to_file = self.write_file("properties.json", " [ ] ")
+        self.assertEqual(list(PropertyReader(path_to_file)), [])
+
+    def test_read_json_lines(self):
+        """
+        Tests reading a JSON Lines file, detected by its extension.
+        """
+        content = "\n".join(json.dumps(record)
+                            for record in self.records) + "\n\n"
+        path_to_file = self.write_file("properties.jsonl", content)
+        self.assertEqual(list(PropertyReader(path_to_file)), self.records)
+
+    def test_read_json_lines_explicit_format(self):
+        """
+        Tests reading a JSON Lines file with the format given explicitly.
+        """
+        content = "\n".join(json.dumps(record) for record in self.records)
+        path_to_file = self.write_file("properties.txt", content)
+        self.assertEqual(
+            list(
+                PropertyReader(
+                    path_to_file,
+                    file_format="jsonl")),
+            self.records)
+
+    def test_progress_callback(self):
+        """
+        Tests that the progress callback is called periodically and at the end.
+        """
+        path_to_file = self.write_file(
+            "properties.json", json.dumps(self.records))
+        reports = []
+        reader = PropertyReader(
+            path_to_file,
+            chunk_size=128,
+            progress_callback=lambda *report: reports.append(report),
+            progress_interval=10)
+        list(reader)
+
+        total_bytes = os.path.getsize(path_to_file)
+        self.assertEqual([report[0] for report in reports], [10, 20, 25])
+        self.assertEqual(reports[-1], (25, total_bytes, total_bytes))
+
+    def test_invalid_format(self):
+        """
+        Tests creating a reader with an unsupported file format.
+        """
+        with self.assertRaises(ValueError):
+            PropertyReader("properties.csv", file_format="csv")
+
+    def test_not_an_array(self):
+        """
+        Tests reading a JSON file that does not hold an array.
+        """
+        path_to_file = self.write_file("properties.json", '{"name": "Test"}')
+        with self.assertRaises(ValueError):
+            list(PropertyReader(path_to_file))
+
+    def test_invalid_json_array(self):
+        """
+        Tests reading JSON arrays that are malformed or truncated.
+        """
+        for content in ['[{"name": "Test"} {"name": "Test"}]',
+                        '[{"name": "Test"}, {"name": ',
+                        '[{"name": "Test"},']:
+            path_to_file = self.write_file("properties.json", content)
+            with self.assertRaises(ValueError):
+                list(PropertyReader(path_to_file, chunk_size=4))
+
+    def test_invalid_json_lines(self):
+        """
+        Tests reading a JSON Lines file with an invalid line.
+        """
+        path_to_file = self.write_file(
+            "properties.jsonl", '{"name": "Test"}\n{"name": \n')
+        with self.assertRaises(ValueError):
+            list(PropertyReader(path_to_file))
+
+    def test_missing_file(self):
+        """
+        Tests reading a file that does not exist.
+        """
+        with self.assertRaises(FileNotFoundError):
+            list(PropertyReader("invalid_file.json"))
+
+
+if __name__ == '__main__':
+    unittest.main()
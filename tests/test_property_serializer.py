@@ -0,0 +1,92 @@
+"""
+Unit Tests for the PropertySerializer Class
+
+This file contains unit tests for the PropertySerializer class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import unittest
+from classes.property_serializer import PropertySerializer
+from classes.apartment import Apartment
+from classes.commercial_space import CommercialSpace
+
+
+class TestPropertySerializer(unittest.TestCase):
+    """
+    Test cases for the PropertySerializer class.
+    """
+
+    def setUp(self):
+        """
+        Sets up sample properties for testing.
+        """
+        self.apartment = Apartment(
+            name="Sample Apartment",
+            property_type="Apartment",
+            location="София",
+            price=120000,
+            square_footage=75.5,
+            num_of_bedrooms=2,
+            num_of_bathrooms=1,
+            floor_number=4
+        )
+        self.commercial_space = CommercialSpace(
+            name="Sample Commercial Space",
+            property_type="Commercial Space",
+            location="Varna",
+            price=500000,
+            square_footage=1500,
+            business_type="Call Center"
+        )
+
+    def test_dumps(self):
+        """
+        Tests that the dumps method returns compact UTF-8 encoded JSON.
+        """
+        encoded = PropertySerializer.dumps({"location": "София", "price": 1.5})
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded), {"location": "София", "price": 1.5})
+        self.assertNotIn(b" ", encoded)
+
+    def test_serialize_all_fields(self):
+        """
+        Tests that the serialize method returns the cached fragment of the property without a field selection.
+        """
+        serializer = PropertySerializer()
+        self.assertIs(serializer.serialize(self.apartment), self.apartment.to_json())
+
+    def test_serialize_selected_fields(self):
+        """
+        Tests that the serialize method keeps only the selected fields, in order, and skips missing ones.
+        """
+        serializer = PropertySerializer(["price", "id", "business_type", "price"])
+        self.assertEqual(json.loads(serializer.serialize(self.apartment)), {
+                         "price": 120000, "id": self.apartment.get_id()})
+        self.assertEqual(list(json.loads(serializer.serialize(self.commercial_space))), [
+                         "price", "id", "business_type"])
+
+    def test_unknown_field(self):
+        """
+        Tests creating a serializer with a field that properties do not have.
+        """
+        with self.assertRaises(ValueError):
+            PropertySerializer(["name", "owner"])
+
+    def test_iter_document(self):
+        """
+        Tests that the iter_document method writes the metadata and the properties as one JSON document.
+        """
+        serializer = PropertySerializer(["name"])
+        document = json.loads(b"".join(serializer.iter_document(
+            [self.apartment, self.commercial_space], total=2, next_cursor=None)))
+        self.assertEqual(document, {
+            "total": 2,
+            "next_cursor": None,
+            "data": [{"name": "Sample Apartment"}, {"name": "Sample Commercial Space"}]
+        })
+        self.assertEqual(json.loads(b"".join(serializer.iter_document([]))), {"data": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
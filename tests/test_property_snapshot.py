@@ -0,0 +1,335 @@
+"""
+Unit Tests for the PropertySnapshot Class
+
+This file contains unit tests for the PropertySnapshot class and for loading both storage engines from snapshots.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from classes.property_snapshot import PropertySnapshot
+from classes.string_column import StringColumn
+from classes.property_columns import PropertyColumns
+from classes.property_manager import PropertyManager
+from classes.columnar_property_manager import ColumnarPropertyManager
+from classes.apartment import Apartment
+from classes.house import House
+from classes.commercial_space import CommercialSpace
+
+
+class TestPropertySnapshot(unittest.TestCase):
+    """
+    Test cases for the PropertySnapshot class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a temporary directory holding a small catalog file.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.path_to_file = os.path.join(self.temporary_directory.name, "properties.json")
+        self.path_to_snapshot = os.path.join(self.temporary_directory.name, "properties.snapshot")
+        self.properties = [
+            Apartment(
+                name="Apartment 1",
+                property_type="Apartment",
+                location="София",
+                price=150000,
+                square_footage=75.5,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=3
+            ),
+            House(
+                name="House 1",
+                property_type="House",
+                location="Varna",
+                price=120000.5,
+                square_footage=2000,
+                num_of_bedrooms=4,
+                num_of_bathrooms=2,
+                num_of_floors=2
+            ),
+            CommercialSpace(
+                name="Commercial Space 1",
+                property_type="Commercial Space",
+                location="Varna",
+                price=150000,
+                square_footage=1050,
+                business_type="Office"
+            )
+        ]
+        self.write_source([prop.to_dict() for prop in self.properties])
+
+    def write_source(self, records):
+        """
+        Writes the catalog file.
+
+        Args:
+            records (list): The property records.
+        """
+        with open(self.path_to_file, "w", encoding="utf-8") as json_file:
+            json.dump(records, json_file, ensure_ascii=False)
+
+    def write_snapshot(self):
+        """
+        Writes a snapshot of the sample properties, created from the current catalog file.
+        """
+        columns = PropertyColumns()
+        for prop in self.properties:
+            columns.append(prop)
+        PropertySnapshot(self.path_to_snapshot).write(
+            columns,
+            {attribute: columns.get_order(attribute) for attribute in ("price", "square_footage")},
+            PropertySnapshot.describe_source(self.path_to_file))
+
+    def test_read(self):
+        """
+        Tests that a snapshot is read back with the same properties and orders, as read-only columns.
+        """
+        self.write_snapshot()
+        columns, orders = PropertySnapshot(self.path_to_snapshot).read()
+
+        self.assertEqual(len(columns), 3)
+        for row, prop in enumerate(self.properties):
+            materialized = columns.materialize(row)
+            self.assertEqual(materialized.get_id(), prop.get_id())
+            self.assertEqual(materialized.to_dict(), prop.to_dict())
+        self.assertEqual(list(orders["price"][0]), [1, 0, 2])
+        self.assertEqual(list(orders["price"][1]), [120000.5, 150000, 150000])
+        self.assertEqual(list(orders["square_footage"][0]), [0, 2, 1])
+        self.assertIsInstance(columns.get_column("price"), memoryview)
+        self.assertIsInstance(columns.to_columns()["ids"], StringColumn)
+        self.assertIsInstance(columns.to_columns()["names"], StringColumn)
+        self.assertEqual(columns.find_row(self.properties[2].get_id()), 2)
+        self.assertIsNone(columns.find_row("unknown-id"))
+
+    def test_append_after_read(self):
+        """
+        Tests that rows can be appended to columns read from a snapshot.
+        """
+        self.write_snapshot()
+        columns, _ = PropertySnapshot(self.path_to_snapshot).read()
+        apartment = Apartment(
+            name="Apartment 2",
+            property_type="Apartment",
+            location="Burgas",
+            price=1,
+            square_footage=2,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+        columns.append(apartment)
+
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(list(columns.get_column("price")), [150000, 120000.5, 150000, 1])
+        self.assertEqual(columns.materialize(3).to_dict(), apartment.to_dict())
+        self.assertEqual(columns.materialize(0).to_dict(), self.properties[0].to_dict())
+        self.assertEqual(columns.find_row(apartment.get_id()), 3)
+
+    def test_is_current(self):
+        """
+        Tests that a snapshot is current only while the catalog file keeps its content.
+        """
+        snapshot = PropertySnapshot(self.path_to_snapshot)
+        self.assertFalse(snapshot.is_current(self.path_to_file))
+
+        self.write_snapshot()
+        self.assertTrue(snapshot.is_current(self.path_to_file))
+
+        os.utime(self.path_to_file, ns=(0, 0))
+        self.assertTrue(snapshot.is_current(self.path_to_file))
+
+        records = [prop.to_dict() for prop in self.properties]
+        records[0]["price"] = 160000
+        self.write_source(records)
+        self.assertFalse(snapshot.is_current(self.path_to_file))
+
+    def test_is_current_with_deltas(self):
+        """
+        Tests that a snapshot created with delta files is current only for the same deltas with the same content.
+        """
+        path_to_delta = os.path.join(self.temporary_directory.name, "delta.json")
+        with open(path_to_delta, "w") as delta_file:
+            json.dump([], delta_file)
+        columns = PropertyColumns()
+        snapshot = PropertySnapshot(self.path_to_snapshot)
+        snapshot.write(
+            columns,
+            {attribute: columns.get_order(attribute) for attribute in ("price", "square_footage")},
+            PropertySnapshot.describe_source(self.path_to_file),
+            [PropertySnapshot.describe_source(path_to_delta)])
+
+        self.assertTrue(snapshot.is_current(self.path_to_file, [path_to_delta]))
+        self.assertFalse(snapshot.is_current(self.path_to_file))
+        self.assertFalse(snapshot.is_current(self.path_to_file, [path_to_delta, path_to_delta]))
+
+        with open(path_to_delta, "w") as delta_file:
+            json.dump([{"id": "unknown-id", "deleted": True}], delta_file)
+        self.assertFalse(snapshot.is_current(self.path_to_file, [path_to_delta]))
+
+    def test_lock(self):
+        """
+        Tests that the lock of a snapshot is held by one thread at a time.
+        """
+        snapshot = PropertySnapshot(self.path_to_snapshot)
+        events = []
+
+        def hold_lock():
+            with snapshot.lock():
+                events.append("second")
+
+        with snapshot.lock():
+            thread = threading.Thread(target=hold_lock)
+            thread.start()
+            time.sleep(0.1)
+            events.append("first")
+        thread.join()
+
+        self.assertEqual(events, ["first", "second"])
+
+    def test_read_invalid(self):
+        """
+        Tests reading a file that is not a snapshot.
+        """
+        snapshot = PropertySnapshot(self.path_to_file)
+        self.assertFalse(snapshot.is_current(self.path_to_file))
+        with self.assertRaises(ValueError):
+            snapshot.read()
+
+    def test_read_properties_from_json_with_snapshot(self):
+        """
+        Tests that both storage engines write a snapshot on the first read, load it on the next one and
+        rebuild it when the catalog file changes.
+        """
+        for manager_class in (PropertyManager, ColumnarPropertyManager):
+            with self.subTest(manager_class=manager_class.__name__):
+                self.write_source([prop.to_dict() for prop in self.properties])
+                if os.path.exists(self.path_to_snapshot):
+                    os.remove(self.path_to_snapshot)
+
+                property_manager = manager_class()
+                property_manager.read_properties_from_json(
+                    self.path_to_file, path_to_snapshot=self.path_to_snapshot)
+                self.assertTrue(PropertySnapshot(self.path_to_snapshot).is_current(self.path_to_file))
+
+                property_manager = manager_class()
+                property_manager.read_properties_from_json(
+                    self.path_to_file, path_to_snapshot=self.path_to_snapshot)
+                self.assertEqual(
+                    [prop.get_name() for prop in property_manager.sort_properties("price", "descending")],
+                    ["Commercial Space 1", "Apartment 1", "House 1"])
+                self.assertEqual(
+                    [prop.get_name() for prop in property_manager.query(location="varna", min_price=130000)],
+                    ["Commercial Space 1"])
+
+                self.write_source([prop.to_dict() for prop in self.properties[:2]])
+                property_manager = manager_class()
+                property_manager.read_properties_from_json(
+                    self.path_to_file, path_to_snapshot=self.path_to_snapshot)
+                self.assertEqual(len(property_manager.get_properties()), 2)
+                self.assertTrue(PropertySnapshot(self.path_to_snapshot).is_current(self.path_to_file))
+
+    def test_read_properties_from_json_with_deltas(self):
+        """
+        Tests that both storage engines save the deltas in the snapshot and rebuild it when a delta is added.
+        """
+        path_to_delta = os.path.join(self.temporary_directory.name, "delta.json")
+        with open(path_to_delta, "w") as delta_file:
+            json.dump([{"id": self.properties[0].get_id(), "deleted": True}], delta_file)
+        path_to_other_delta = os.path.join(self.temporary_directory.name, "other_delta.json")
+        with open(path_to_other_delta, "w") as delta_file:
+            json.dump([{**self.properties[0].to_dict(), "id": "new-id"}], delta_file)
+        self.write_source([{**prop.to_dict(), "id": prop.get_id()} for prop in self.properties])
+
+        for manager_class in (PropertyManager, ColumnarPropertyManager):
+            with self.subTest(manager_class=manager_class.__name__):
+                if os.path.exists(self.path_to_snapshot):
+                    os.remove(self.path_to_snapshot)
+
+                for _ in range(2):
+                    property_manager = manager_class()
+                    property_manager.read_properties_from_json(
+                        self.path_to_file, path_to_snapshot=self.path_to_snapshot, paths_to_deltas=[path_to_delta])
+                    self.assertEqual(
+                        [prop.get_name() for prop in property_manager.get_properties()],
+                        ["House 1", "Commercial Space 1"])
+                    self.assertIsNone(property_manager.get_by_id(self.properties[0].get_id()))
+                self.assertTrue(PropertySnapshot(self.path_to_snapshot).is_current(
+                    self.path_to_file, [path_to_delta]))
+
+                property_manager = manager_class()
+                property_manager.read_properties_from_json(
+                    self.path_to_file,
+                    path_to_snapshot=self.path_to_snapshot,
+                    paths_to_deltas=[path_to_delta, path_to_other_delta])
+                self.assertEqual(
+                    [prop.get_id() for prop in property_manager.sort_properties("price", "descending")],
+                    ["new-id", self.properties[2].get_id(), self.properties[1].get_id()])
+
+    def test_columnar_catalog_maps_written_snapshot(self):
+        """
+        Tests that a columnar catalog uses the memory-mapped columns of the snapshot it has just written.
+        """
+        self.write_source([{**prop.to_dict(), "id": prop.get_id()} for prop in self.properties])
+        property_manager = ColumnarPropertyManager()
+        property_manager.read_properties_from_json(self.path_to_file, path_to_snapshot=self.path_to_snapshot)
+
+        self.assertIsInstance(property_manager._columns.get_column("price"), memoryview)
+        self.assertEqual(
+            [prop.get_name() for prop in property_manager.sort_properties("square_footage", "ascending")],
+            ["Apartment 1", "Commercial Space 1", "House 1"])
+        self.assertEqual(property_manager.get_by_id(self.properties[1].get_id()).to_dict(),
+                         self.properties[1].to_dict())
+
+    def test_read_snapshot_duplicate_ids(self):
+        """
+        Tests that reading a snapshot into a catalog already holding its properties is rejected.
+        """
+        self.write_snapshot()
+        for manager_class in (PropertyManager, ColumnarPropertyManager):
+            with self.subTest(manager_class=manager_class.__name__):
+                property_manager = manager_class()
+                property_manager.read_snapshot(self.path_to_snapshot)
+                with self.assertRaises(ValueError):
+                    property_manager.read_snapshot(self.path_to_snapshot)
+                self.assertEqual(len(property_manager.get_properties()), 3)
+
+    def test_apply_changes_after_snapshot(self):
+        """
+        Tests that both storage engines apply changes on top of a catalog loaded from a snapshot.
+        """
+        self.write_snapshot()
+        house = House(
+            name="House 2",
+            property_type="House",
+            location="Varna",
+            price=10,
+            square_footage=20,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            num_of_floors=1,
+            property_id=self.properties[0].get_id()
+        )
+        for manager_class in (PropertyManager, ColumnarPropertyManager):
+            with self.subTest(manager_class=manager_class.__name__):
+                property_manager = manager_class()
+                property_manager.read_snapshot(self.path_to_snapshot)
+                property_manager.apply_changes([house], [self.properties[2].get_id()])
+
+                self.assertEqual(
+                    [prop.get_name() for prop in property_manager.sort_properties("price", "descending")],
+                    ["House 1", "House 2"])
+                self.assertEqual(
+                    [prop.get_name() for prop in property_manager.query(location="varna", min_square_footage=10)],
+                    ["House 1", "House 2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
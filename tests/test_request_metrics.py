@@ -0,0 +1,81 @@
+"""
+Unit Tests for the RequestMetrics Class
+
+This file contains unit tests for the RequestMetrics class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import unittest
+from classes.request_metrics import RequestMetrics
+
+
+class TestRequestMetrics(unittest.TestCase):
+    """
+    Test cases for the RequestMetrics class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a RequestMetrics instance with three histogram buckets.
+        """
+        self.metrics = RequestMetrics(buckets=(0.01, 0.1, 1))
+
+    def test_observe(self):
+        """
+        Tests that durations are counted per route and phase.
+        """
+        self.metrics.observe("search", "query", 0.005)
+        self.metrics.observe("search", "query", 0.5)
+        self.metrics.observe("search", "render", 0.05)
+
+        self.assertEqual(self.metrics.get_count("search", "query"), 2)
+        self.assertEqual(self.metrics.get_count("search", "render"), 1)
+        self.assertEqual(self.metrics.get_count("homepage", "total"), 0)
+
+    def test_count_rows(self):
+        """
+        Tests that rows are added up per method and that unknown scanned rows are skipped.
+        """
+        self.metrics.count_rows("query", 10, 2)
+        self.metrics.count_rows("query", 5, 1)
+        self.metrics.count_rows("select", None, 3)
+
+        self.assertEqual(self.metrics.get_rows("query"), (15, 3))
+        self.assertEqual(self.metrics.get_rows("select"), (0, 3))
+        self.assertEqual(self.metrics.get_rows("count"), (0, 0))
+
+    def test_render(self):
+        """
+        Tests the Prometheus text format of the metrics, with cumulative histogram buckets.
+        """
+        self.metrics.observe("search", "query", 0.01)
+        self.metrics.observe("search", "query", 0.5)
+        self.metrics.observe("search", "query", 2)
+        self.metrics.count_rows("query", 10, 2)
+        lines = self.metrics.render().splitlines()
+
+        self.assertIn("# TYPE property_app_request_duration_seconds histogram", lines)
+        self.assertEqual(
+            [line for line in lines if line.startswith("property_app_request_duration_seconds")],
+            ['property_app_request_duration_seconds_bucket{route="search",phase="query",le="0.01"} 1',
+             'property_app_request_duration_seconds_bucket{route="search",phase="query",le="0.1"} 1',
+             'property_app_request_duration_seconds_bucket{route="search",phase="query",le="1"} 2',
+             'property_app_request_duration_seconds_bucket{route="search",phase="query",le="+Inf"} 3',
+             'property_app_request_duration_seconds_sum{route="search",phase="query"} 2.51',
+             'property_app_request_duration_seconds_count{route="search",phase="query"} 3'])
+        self.assertIn("# TYPE property_app_rows_scanned_total counter", lines)
+        self.assertIn('property_app_rows_scanned_total{method="query"} 10', lines)
+        self.assertIn('property_app_rows_returned_total{method="query"} 2', lines)
+
+    def test_render_escapes_labels(self):
+        """
+        Tests that quotes, backslashes and line breaks in label values are escaped.
+        """
+        self.metrics.count_rows('a"b\\c\nd', 1, 1)
+
+        self.assertIn('property_app_rows_returned_total{method="a\\"b\\\\c\\nd"} 1',
+                      self.metrics.render().splitlines())
+
+
+if __name__ == '__main__':
+    unittest.main()
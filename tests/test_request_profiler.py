@@ -0,0 +1,123 @@
+"""
+Unit Tests for the RequestProfiler Class
+
+This file contains unit tests for the RequestProfiler class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import os
+import pstats
+import tempfile
+import unittest
+from classes.request_profiler import RequestProfiler
+
+
+class TestRequestProfiler(unittest.TestCase):
+    """
+    Test cases for the RequestProfiler class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a temporary directory for the profiles.
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temporary_directory.name, "profiles")
+
+    def tearDown(self):
+        """
+        Deletes the temporary directory.
+        """
+        self.temporary_directory.cleanup()
+
+    def profile_request(self, profiler, seconds, route="search"):
+        """
+        Profiles a short piece of work standing in for a request.
+
+        Args:
+            profiler (RequestProfiler): The profiler.
+            seconds (float): The duration reported for the request.
+            route (str): The name of the route.
+
+        Returns:
+            str: The path to the written profile or None.
+        """
+        profiling = profiler.start()
+        sorted(range(1000), key=lambda number: -number)
+        return profiler.stop(profiling, seconds, lambda: {"route": route, "catalog_size": 42})
+
+    def test_disabled(self):
+        """
+        Tests that no request is profiled without a sample rate or threshold.
+        """
+        profiler = RequestProfiler(self.directory)
+
+        self.assertFalse(profiler.is_enabled())
+        self.assertIsNone(profiler.start())
+        self.assertIsNone(self.profile_request(profiler, 10))
+        self.assertFalse(os.path.exists(self.directory))
+
+    def test_sampled(self):
+        """
+        Tests that a sampled request is written with its description and a readable profile.
+        """
+        profiler = RequestProfiler(self.directory, sample_rate=0.5, random_number=lambda: 0.25)
+        path = self.profile_request(profiler, 0.001)
+
+        self.assertTrue(profiler.is_enabled())
+        self.assertTrue(path.endswith("-search.prof"))
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
+        with open(path[:-len(".prof")] + ".json", encoding="utf-8") as metadata_file:
+            metadata = json.load(metadata_file)
+        self.assertEqual(metadata["route"], "search")
+        self.assertEqual(metadata["catalog_size"], 42)
+        self.assertEqual(metadata["seconds"], 0.001)
+        self.assertEqual(metadata["reason"], "sampled")
+
+    def test_not_sampled(self):
+        """
+        Tests that a request outside the sample is not profiled.
+        """
+        profiler = RequestProfiler(self.directory, sample_rate=0.5, random_number=lambda: 0.75)
+
+        self.assertIsNone(profiler.start())
+
+    def test_slow_threshold(self):
+        """
+        Tests that with a threshold only the slow requests are kept.
+        """
+        profiler = RequestProfiler(self.directory, slow_threshold=0.5)
+
+        self.assertIsNone(self.profile_request(profiler, 0.1))
+        path = self.profile_request(profiler, 0.6)
+        with open(path[:-len(".prof")] + ".json", encoding="utf-8") as metadata_file:
+            self.assertEqual(json.load(metadata_file)["reason"], "slow")
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_describe_only_kept(self):
+        """
+        Tests that the request is described only if its profile is kept.
+        """
+        profiler = RequestProfiler(self.directory, slow_threshold=0.5)
+        descriptions = []
+
+        profiler.stop(profiler.start(), 0.1, lambda: descriptions.append(True) or {})
+
+        self.assertEqual(descriptions, [])
+
+    def test_rotate(self):
+        """
+        Tests that the oldest profiles and their descriptions are deleted beyond the limit.
+        """
+        profiler = RequestProfiler(self.directory, sample_rate=1, max_files=2)
+        paths = [self.profile_request(profiler, 0.001, route) for route in ("first", "second", "third")]
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted(os.path.basename(path)[:-len(".prof")] + extension
+                   for path in paths[1:] for extension in (".prof", ".json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
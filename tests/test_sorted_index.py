@@ -0,0 +1,117 @@
+"""
+Unit Tests for the SortedIndex Class
+
+This file contains unit tests for the SortedIndex class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import unittest
+from classes.property import Property
+from classes.sorted_index import SortedIndex
+from classes.apartment import Apartment
+
+
+class TestSortedIndex(unittest.TestCase):
+    """
+    Test cases for the SortedIndex class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a SortedIndex ordered by price and a few sample apartments.
+        """
+        self.index = SortedIndex(Property.get_price)
+        self.apartments = [
+            Apartment(
+                name=f"Apartment {price}",
+                property_type="Apartment",
+                location="Location A",
+                price=price,
+                square_footage=1000,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=1
+            )
+            for price in [300, 100, 200, 100]
+        ]
+
+    def test_add(self):
+        """
+        Tests that the add method keeps the index ordered and stable.
+        """
+        for apartment in self.apartments:
+            self.index.add(apartment)
+
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(
+            self.index.get_items(),
+            [self.apartments[1], self.apartments[3], self.apartments[2], self.apartments[0]])
+
+    def test_rebuild(self):
+        """
+        Tests that the rebuild method replaces the content and produces the same order as repeated adds.
+        """
+        self.index.add(self.apartments[2])
+        self.index.rebuild(self.apartments)
+
+        self.assertEqual(
+            self.index.get_items(),
+            [self.apartments[1], self.apartments[3], self.apartments[2], self.apartments[0]])
+
+    def test_range(self):
+        """
+        Tests the range method with inclusive and open bounds.
+        """
+        self.index.rebuild(self.apartments)
+
+        self.assertEqual(self.index.range(100, 200), [
+                         self.apartments[1], self.apartments[3], self.apartments[2]])
+        self.assertEqual(self.index.range(150, None), [
+                         self.apartments[2], self.apartments[0]])
+        self.assertEqual(self.index.range(None, 99), [])
+        self.assertEqual(self.index.range(400, None), [])
+
+    def test_remove(self):
+        """
+        Tests that the remove method removes the given property among properties with equal keys.
+        """
+        self.index.rebuild(self.apartments)
+        self.index.remove(self.apartments[1])
+
+        self.assertEqual(self.index.get_items(), [self.apartments[3], self.apartments[2], self.apartments[0]])
+        self.assertEqual(self.index.range(100, 100), [self.apartments[3]])
+        with self.assertRaises(ValueError):
+            self.index.remove(self.apartments[1])
+
+    def test_update(self):
+        """
+        Tests that small and large batches of changes give the same order as a rebuild.
+        """
+        apartments = [
+            Apartment(
+                name=f"Apartment {number}",
+                property_type="Apartment",
+                location="Location A",
+                price=100 * (number % 4),
+                square_footage=1000,
+                num_of_bedrooms=2,
+                num_of_bathrooms=1,
+                floor_number=1
+            )
+            for number in range(60)
+        ]
+        for removed_count, added_count in ((2, 3), (20, 20)):
+            with self.subTest(removed_count=removed_count, added_count=added_count):
+                self.index.rebuild(apartments[:40])
+                removed = apartments[:40:40 // removed_count]
+                added = apartments[40:40 + added_count]
+                self.index.update(removed, added)
+
+                expected = SortedIndex(Property.get_price)
+                expected.rebuild([apartment for apartment in apartments[:40] if apartment not in removed] + added)
+                self.assertEqual(self.index.get_items(), expected.get_items())
+                self.assertEqual(self.index.range(100, 200), expected.range(100, 200))
+
+
+if __name__ == '__main__':
+    unittest.main()
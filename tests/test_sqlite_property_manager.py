@@ -0,0 +1,207 @@
+"""
+Unit Tests for the SQLitePropertyManager Class
+
+This file contains unit tests for the SQLitePropertyManager class and the SQLitePropertyRows sequences it returns.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from classes.sqlite_property_manager import SQLitePropertyManager
+from classes.apartment import Apartment
+from classes.request_metrics import RequestMetrics
+from tests.property_manager_contract import PropertyManagerContractTests
+
+
+class TestSQLitePropertyManager(PropertyManagerContractTests, unittest.TestCase):
+    """
+    Test cases for the SQLitePropertyManager class.
+    """
+
+    def create_property_manager(self):
+        """
+        Creates an empty SQLitePropertyManager instance.
+
+        Returns:
+            SQLitePropertyManager: The empty catalog.
+        """
+        return SQLitePropertyManager()
+
+    def test_property_rows(self):
+        """
+        Tests that the returned rows support indexing, slicing and iteration like a list.
+        """
+        properties = self.property_manager.filter_by_location("sofia")
+        expected = [self.apartment1, self.apartment2, self.house1, self.commercial_space1]
+
+        self.assertEqual(len(properties), 4)
+        self.assert_properties([properties[1], properties[-1]], [expected[1], expected[-1]])
+        self.assert_properties(properties[1:3], expected[1:3])
+        self.assert_properties(properties[::2], expected[::2])
+        self.assert_properties(list(properties), expected)
+        with self.assertRaises(IndexError):
+            properties[4]
+
+        limited = self.property_manager.query(location="sofia", limit=2, offset=1)
+        self.assertEqual(len(limited), 2)
+        self.assert_properties(list(limited), expected[1:3])
+        with self.assertRaises(IndexError):
+            limited[2]
+
+    def test_number_types(self):
+        """
+        Tests that integer and float numbers are returned with the type they were added with.
+        """
+        apartment4 = Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Varna",
+            price=100.5,
+            square_footage=10,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+        self.property_manager._add_property(apartment4)
+        stored = self.property_manager.get_by_id(apartment4.get_id())
+
+        self.assertIsInstance(stored.get_price(), float)
+        self.assertIsInstance(stored.get_square_footage(), int)
+
+    def test_database_file(self):
+        """
+        Tests that a database file keeps the catalog and is only replaced when the JSON file changes.
+        """
+        records = [self.apartment1.to_dict(), self.house1.to_dict()]
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "properties.json")
+            path_to_database = os.path.join(directory, "properties.sqlite3")
+            with open(path_to_file, "w") as json_file:
+                json.dump(records, json_file)
+
+            property_manager = SQLitePropertyManager(path_to_database)
+            property_manager.read_properties_from_json(path_to_file)
+            version = property_manager.get_version()
+            property_manager.close()
+
+            property_manager = SQLitePropertyManager(path_to_database)
+            property_manager.read_properties_from_json(path_to_file)
+            self.assertEqual(len(property_manager.get_properties()), 2)
+            self.assertEqual(property_manager.get_version(), version)
+
+            with open(path_to_file, "w") as json_file:
+                json.dump(records[:1], json_file)
+            property_manager.read_properties_from_json(path_to_file)
+            self.assertEqual([prop.to_dict() for prop in property_manager.get_properties()], records[:1])
+            self.assertGreater(property_manager.get_version(), version)
+            property_manager.close()
+
+    def test_consistent_reads(self):
+        """
+        Tests that the reads inside a consistent_reads block see the catalog as it was when the block began,
+        while a change is committed through another connection to the same database.
+        """
+        apartment4 = Apartment(
+            name="Apartment 4",
+            property_type="Apartment",
+            location="Sofia",
+            price=100,
+            square_footage=10,
+            num_of_bedrooms=1,
+            num_of_bathrooms=1,
+            floor_number=1
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_database = os.path.join(directory, "properties.sqlite3")
+            property_manager = SQLitePropertyManager(path_to_database)
+            self.addCleanup(property_manager.close)
+            property_manager._add_properties([self.apartment1, self.apartment2, self.house1])
+            other_manager = SQLitePropertyManager(path_to_database)
+            self.addCleanup(other_manager.close)
+            version = property_manager.get_version()
+
+            with property_manager.consistent_reads():
+                page = property_manager.query(location="sofia", sorting_attribute="price", limit=2)
+                self.assert_properties(page, [self.apartment1, self.house1])
+                other_manager.apply_changes([apartment4])
+                with property_manager.consistent_reads():
+                    self.assertEqual(property_manager.count(location="sofia"), 3)
+                self.assert_properties(list(page), [self.apartment1, self.house1])
+                self.assertEqual(property_manager.get_version(), version)
+
+            self.assertEqual(property_manager.count(location="sofia"), 4)
+            self.assert_properties(page, [apartment4, self.apartment1])
+            self.assertGreater(property_manager.get_version(), version)
+
+    def test_read_properties_from_json_with_deltas(self):
+        """
+        Tests that the deltas read with a JSON file are applied once and read again only when they change.
+        """
+        records = [{**self.apartment1.to_dict(), "id": "a"}, {**self.house1.to_dict(), "id": "b"}]
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "properties.json")
+            path_to_delta = os.path.join(directory, "delta.json")
+            with open(path_to_file, "w") as json_file:
+                json.dump(records, json_file)
+            with open(path_to_delta, "w") as json_file:
+                json.dump([{"id": "a", "deleted": True}, {**records[1], "id": "c"}], json_file)
+
+            property_manager = SQLitePropertyManager(os.path.join(directory, "properties.sqlite3"))
+            property_manager.read_properties_from_json(path_to_file, paths_to_deltas=[path_to_delta])
+            self.assertEqual([prop.get_id() for prop in property_manager.get_properties()], ["b", "c"])
+            version = property_manager.get_version()
+
+            property_manager.read_properties_from_json(path_to_file, paths_to_deltas=[path_to_delta])
+            self.assertEqual(property_manager.get_version(), version)
+
+            property_manager.read_properties_from_json(path_to_file)
+            self.assertEqual([prop.get_id() for prop in property_manager.get_properties()], ["a", "b"])
+            property_manager.close()
+
+    def test_apply_delta(self):
+        """
+        Tests that a delta file updates, adds and deletes properties in the database.
+        """
+        records = [
+            {**self.apartment1.to_dict(), "id": self.apartment1.get_id(), "price": 100000},
+            {"id": self.house1.get_id(), "deleted": True},
+            {**self.house1.to_dict(), "id": "new-house", "location": "Burgas"},
+            {"id": "unknown-id", "deleted": True}
+        ]
+        version = self.property_manager.get_version()
+        with tempfile.TemporaryDirectory() as directory:
+            path_to_file = os.path.join(directory, "delta.json")
+            with open(path_to_file, "w") as json_file:
+                json.dump(records, json_file)
+
+            self.assertEqual(self.property_manager.apply_delta(path_to_file), (1, 1, 1))
+
+        self.assertNotEqual(self.property_manager.get_version(), version)
+        self.assertEqual(
+            [prop.get_id() for prop in self.property_manager.get_properties()],
+            [self.apartment2.get_id(), self.apartment3.get_id(), self.commercial_space1.get_id(),
+             self.apartment1.get_id(), "new-house"])
+        self.assertEqual(self.property_manager.get_by_id(self.apartment1.get_id()).get_price(), 100000)
+        self.assertIsNone(self.property_manager.get_by_id(self.house1.get_id()))
+        self.assertEqual(self.property_manager.count(location="burgas"), 1)
+        self.assertEqual(
+            [prop.get_id() for prop in self.property_manager.sort_properties("price", "ascending", limit=2)],
+            [self.apartment1.get_id(), self.apartment3.get_id()])
+
+    def test_metrics(self):
+        """
+        Tests that the properties fetched from the database are counted as returned rows.
+        """
+        metrics = RequestMetrics()
+        self.property_manager.set_metrics(metrics)
+
+        list(self.property_manager.filter_by_location("sofia"))
+        self.property_manager.query(min_price=150000, limit=2)[:]
+
+        self.assertEqual(metrics.get_rows("select"), (0, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Unit Tests for the StringColumn Class
+
+This file contains unit tests for the StringColumn class.
+It uses the unittest framework to test various methods and functionalities.
+"""
+
+import unittest
+from classes.string_column import StringColumn
+
+
+class TestStringColumn(unittest.TestCase):
+    """
+    Test cases for the StringColumn class.
+    """
+
+    def setUp(self):
+        """
+        Sets up a column of strings over memoryviews, as it is read from a snapshot.
+        """
+        self.strings = ["Apartment 1", "", "София", "House 1"]
+        offsets, data = StringColumn.encode(self.strings)
+        self.column = StringColumn(memoryview(offsets), memoryview(data))
+
+    def test_encode(self):
+        """
+        Tests that encode stores the UTF-8 encoded strings one after another.
+        """
+        offsets, data = StringColumn.encode(["ab", "", "ц"])
+
+        self.assertEqual(list(offsets), [0, 2, 2, 4])
+        self.assertEqual(data, "abц".encode("utf-8"))
+
+    def test_getitem(self):
+        """
+        Tests reading single strings, also with negative positions.
+        """
+        self.assertEqual(len(self.column), 4)
+        self.assertEqual(list(self.column), self.strings)
+        self.assertEqual(self.column[2], "София")
+        self.assertEqual(self.column[-1], "House 1")
+        self.assertIn("", self.column)
+
+    def test_getitem_slice(self):
+        """
+        Tests that a slice is read as a list.
+        """
+        self.assertEqual(self.column[1:3], ["", "София"])
+        self.assertEqual(self.column[::-2], ["House 1", ""])
+
+    def test_take(self):
+        """
+        Tests reading the strings at many positions at once.
+        """
+        self.assertEqual(self.column.take([3, 0, 2, 0]), ["House 1", "Apartment 1", "София", "Apartment 1"])
+        self.assertEqual(self.column.take([]), [])
+        with self.assertRaises(IndexError):
+            self.column.take([4])
+
+    def test_getitem_out_of_range(self):
+        """
+        Tests reading a position outside the column.
+        """
+        with self.assertRaises(IndexError):
+            self.column[4]
+        with self.assertRaises(IndexError):
+            self.column[-5]
+
+    def test_empty(self):
+        """
+        Tests a column without strings.
+        """
+        column = StringColumn(*StringColumn.encode([]))
+
+        self.assertEqual(len(column), 0)
+        self.assertEqual(list(column), [])
+
+
+if __name__ == '__main__':
+    unittest.main()